@@ -1,13 +1,19 @@
 from .adapters import *
 from .array_schema import *
+from .binary_record_schema import *
 from .icomparable_schema import *
+from .imembership_schema import *
+from .imemo_schema import *
 from .ischema import *
 from .isized_schema import *
 from .locale import *
 from .mapping_schema import *
+from .membership_store import *
 from .mixed_schema import *
 from .number_schema import *
+from .query_adapter import *
 from .schema import *
+from .schema_registry import *
 from .string_schema import *
 from .union_schema import *
 from .validation_error import *
@@ -18,11 +24,14 @@ mapping = MappingSchema
 array = ArraySchema
 mixed = MixedSchema
 union = UnionSchema
+binary = BinaryRecordSchema
 
 immutable = SchemaImmutableAdapter
 default = SchemaDefaultAdapter
 required = SchemaRequiredAdapter
 json = SchemaJsonAdapter
+query = SchemaQueryAdapter
+budget = SchemaBudgetAdapter
 
 __all__ = (
     'ErrorMessage',
@@ -37,6 +46,8 @@ __all__ = (
     'ArraySchema',
     'MixedSchema',
     'UnionSchema',
+    'BinaryRecordSchema',
+    'ArrayCheckpoint',
 
     'ISchema',
     'IComparableSchema',
@@ -45,26 +56,41 @@ __all__ = (
     'EqualityComparableSchema',
     'ISizedSchema',
     'SizedSchema',
+    'IMembershipSchema',
+    'MembershipSchema',
+    'IMemoSchema',
+    'MemoSchema',
+
+    'SortedArrayStore',
+    'BloomFilterStore',
 
     'ISchemaAdapter',
     'SchemaAdapter',
     'SchemaJsonAdapter',
+    'SchemaQueryAdapter',
     'SchemaDefaultAdapter',
     'SchemaRequiredAdapter',
     'SchemaImmutableAdapter',
+    'SchemaBudgetAdapter',
     '_REQUIRED_UNDEFINED_',
 
+    'SchemaRegistry',
+    'RegistryInfo',
+
     'string',
     'number',
     'mapping',
     'array',
     'mixed',
     'union',
+    'binary',
 
     'immutable',
     'required',
     'default',
     'json',
+    'query',
+    'budget',
 
     'locale',
     'set_locale',
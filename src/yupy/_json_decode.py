@@ -1,7 +1,13 @@
 import json
 import warnings
+from collections.abc import Callable, Iterable, Mapping
+from itertools import accumulate, count
+from operator import sub
 from typing import Any, Literal, TypedDict
 
+from yupy.locale import locale
+from yupy.validation_error import Constraint, ValidationError
+
 orjson: Any | None
 
 # Attempt to import orjson; if not available, fall back to None
@@ -14,12 +20,42 @@ __all__ = (
     "SUPPORTED_JSON_PARSER",
     "get_json_parser",
     "loads",
+    "measure",
 )
 
 # Define a TypeVar for the parser type (e.g., "json" or "orjson")
 SUPPORTED_JSON_PARSER = Literal["json", "orjson"]
 
 
+_JSON_SKIPPED = b" \t\r\n:"
+"""
+Whitespace and colons, which don't matter for the structure of a JSON document.
+"""
+
+_JSON_SCALARS = bytes(set(range(256)).difference(b'"[{]},' + _JSON_SKIPPED))
+"""
+Every other byte value except quotes, brackets and commas: the characters of
+numbers, literals and string contents.
+"""
+
+_JSON_STRUCTURE = bytes.maketrans(_JSON_SCALARS, b"1" * len(_JSON_SCALARS))
+"""
+Translation table collapsing every scalar character to `1`, so that only the
+structure of a document is left to inspect.
+"""
+
+_BRACKET_WEIGHTS = bytes.maketrans(b"[{]}", b"\x02\x02\x00\x00")
+"""
+Translation table mapping opening brackets to 2 and closing brackets to 0,
+used to compute the nesting depth with C-level iteration only.
+"""
+
+_NON_BRACKETS = bytes(set(range(256)).difference(b"[{]}"))
+"""
+Every byte value except the JSON brackets, deleted before computing the depth.
+"""
+
+
 class JsonLoadsKwargs(TypedDict, total=False):
     """Represents options typically used with the standard 'json' library."""
 
@@ -63,12 +99,50 @@ def get_json_parser(parser: SUPPORTED_JSON_PARSER) -> Any:
         )
 
 
+def _object_pairs_hook(
+    reject_duplicate_keys: bool, intern_keys: Mapping[str, str] | None
+) -> Callable[[list[tuple[str, Any]]], dict[str, Any]]:
+    """
+    Builds an `object_pairs_hook` that checks and canonicalises object keys
+    while the document is being parsed.
+
+    Args:
+        reject_duplicate_keys: If True, objects with a repeated key are rejected.
+        intern_keys: A table mapping known keys to their canonical string
+            objects, or None to keep the keys produced by the parser.
+
+    Returns:
+        The hook building each decoded object.
+    """
+
+    def hook(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+        if intern_keys is None:
+            obj = dict(pairs)
+        else:
+            obj = {intern_keys.get(k, k): v for k, v in pairs}
+        if reject_duplicate_keys and len(obj) != len(pairs):
+            seen: set[str] = set()
+            for key, _ in pairs:
+                if key in seen:
+                    raise ValidationError(
+                        Constraint("duplicate_key", locale["duplicate_key"], key),
+                        invalid_value=obj,
+                    )
+                seen.add(key)
+        return obj
+
+    return hook
+
+
 def loads(
     fp: bytes
     | bytearray
     | memoryview
     | str,  # Reverted to str as per user's latest code
     parser: SUPPORTED_JSON_PARSER,  # The parser type is constrained to "json" or "orjson"
+    *,
+    reject_duplicate_keys: bool = False,
+    intern_keys: Mapping[str, str] | Iterable[str] | None = None,
     **kwargs: JsonLoadsKwargs,  # Accept any keyword arguments, to be filtered later
 ) -> Any:
     """
@@ -78,6 +152,15 @@ def loads(
         fp: The JSON string or byte-like object to parse.
         parser: The parser to use, either "json" or "orjson".
                 If "orjson" is specified but not installed, it falls back to "json".
+        reject_duplicate_keys: If True, objects with a repeated key are rejected
+                  in the same parsing pass. orjson keeps the last value silently,
+                  so the 'json' library is used instead, with a warning.
+        intern_keys: Keys (e.g. the fields of a `MappingSchema`) whose decoded
+                  occurrences are replaced by the given string objects, so that
+                  every decoded object shares one string per key. A mapping of
+                  each key to itself is used as is, so callers decoding many
+                  documents can build it once. orjson already caches short keys
+                  itself, so this is a no-op with it.
         **kwargs: Additional keyword arguments to pass to the chosen parser's loads function.
                   Arguments not supported by the chosen parser will be ignored,
                   and a warning will be issued.
@@ -86,12 +169,32 @@ def loads(
         The parsed Python object (dict, list, str, int, float, bool, None).
 
     Raises:
-        ValueError: If an unsupported parser type is provided.
+        ValueError: If an unsupported parser type is provided, or if
+            `object_pairs_hook` is combined with the key options.
+        ValidationError: If `reject_duplicate_keys` is set and an object has
+            a duplicate key.
         json.JSONDecodeError: If the JSON string is invalid.
         orjson.JSONDecodeError: If the JSON string is invalid.
     """
     json_parser = get_json_parser(parser)
 
+    if json_parser is orjson and reject_duplicate_keys:
+        warnings.warn(
+            "orjson can't detect duplicate keys. Falling back to the standard 'json' library.",
+            UserWarning,
+        )
+        json_parser = json
+
+    if json_parser is json and (reject_duplicate_keys or intern_keys is not None):
+        if "object_pairs_hook" in kwargs:
+            raise ValueError(
+                "object_pairs_hook can't be combined with reject_duplicate_keys or intern_keys"
+            )
+        table = intern_keys
+        if table is not None and not isinstance(table, Mapping):
+            table = {k: k for k in table}
+        kwargs["object_pairs_hook"] = _object_pairs_hook(reject_duplicate_keys, table)  # type: ignore[assignment]
+
     if json_parser is orjson:
         unsupported_keys = [k for k in kwargs]
         if unsupported_keys:
@@ -105,3 +208,41 @@ def loads(
         # json.loads primarily expects str, but can handle bytes if encoding is specified.
         # If bytes are passed, json.loads will attempt to decode them.
         return json_parser.loads(fp, **kwargs)
+
+
+def measure(fp: bytes | bytearray | memoryview | str) -> tuple[int, int]:
+    """
+    Measures the nesting depth and the number of items of a JSON document
+    without parsing it.
+
+    The scan only looks at brackets and commas outside string literals and
+    uses bytes methods only, so it runs at C speed and needs no recursion.
+    Malformed documents produce approximate figures; they are rejected by
+    `loads` anyway.
+
+    Args:
+        fp: The JSON string or byte-like object to measure.
+
+    Returns:
+        A `(depth, items)` pair: the maximum nesting depth of arrays and
+        objects (0 for a scalar document) and the total number of array
+        elements and object members.
+    """
+    data = fp.encode("utf-8") if isinstance(fp, str) else bytes(fp)
+    if b"\\" in data:
+        # Drop escape pairs first, so every remaining quote delimits a string
+        data = data.replace(b"\\\\", b"").replace(b'\\"', b"")
+    # Odd parts between quotes are string contents, keep a quote in their place
+    structure = b'"'.join(
+        data.translate(_JSON_STRUCTURE, _JSON_SKIPPED).split(b'"')[::2]
+    )
+
+    # Opening brackets weigh 2 and closing ones 0, so after k brackets the
+    # running sum minus k is the current depth
+    weights = structure.translate(_BRACKET_WEIGHTS, _NON_BRACKETS)
+    depth = max(map(sub, accumulate(weights), count(1)), default=0)
+
+    containers = structure.count(b"[") + structure.count(b"{")
+    empty = structure.count(b"[]") + structure.count(b"{}")
+    items = structure.count(b",") + containers - empty
+    return depth, items
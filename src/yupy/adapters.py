@@ -1,20 +1,29 @@
+import hashlib
 from copy import deepcopy
 from json import JSONDecodeError
+from types import MappingProxyType
 from typing import Any, Protocol, TypeVar, runtime_checkable
 
 from typing_extensions import Self
 
-from yupy._json_decode import SUPPORTED_JSON_PARSER, loads
+from yupy._json_decode import SUPPORTED_JSON_PARSER, loads, measure
 from yupy.ischema import ISchema
 from yupy.locale import ErrorMessage, locale
+from yupy.util.cache import LRUCache
+from yupy.util.fingerprint import fingerprint
+from yupy.util.revision import rules_changed
+from yupy.util.time_budget import budget_exceeded, time_budget
 from yupy.validation_error import _EMPTY_MESSAGE_, Constraint, ValidationError
 
 _REQUIRED_UNDEFINED_ = TypeVar("_REQUIRED_UNDEFINED_")
 
+_MISSING_ = object()
+
 __all__ = (
     "_REQUIRED_UNDEFINED_",
     "ISchemaAdapter",
     "SchemaAdapter",
+    "SchemaBudgetAdapter",
     "SchemaDefaultAdapter",
     "SchemaImmutableAdapter",
     "SchemaJsonAdapter",
@@ -116,6 +125,35 @@ class SchemaAdapter:
         """
         return self._schema
 
+    def optimize(self, path: str = "~") -> Self:
+        """
+        Simplifies the rules of the wrapped schema, if it supports it
+        (see `Schema.optimize()`).
+
+        Args:
+            path (str): The path of the schema, used in error messages.
+                Defaults to "~".
+
+        Returns:
+            Self: The adapter instance, allowing for method chaining.
+
+        Raises:
+            ValueError: If the rules of the wrapped schema contradict each other.
+        """
+        optimize = getattr(self._schema, "optimize", None)
+        if optimize is not None:
+            optimize(path)
+        return self
+
+    def fingerprint(self) -> str:
+        """
+        Returns a structural fingerprint of the adapter and the schema it wraps.
+
+        Returns:
+            str: The fingerprint, as 32 hexadecimal digits.
+        """
+        return fingerprint(self)
+
     def validate(
         self, value: Any = None, abort_early: bool = True, path: str = "~"
     ) -> Any:
@@ -181,6 +219,7 @@ class SchemaDefaultAdapter(SchemaAdapter):
             Self: The adapter instance, allowing for method chaining.
         """
         self._ensure = True
+        rules_changed()
         return self
 
     def validate(
@@ -210,8 +249,8 @@ class SchemaDefaultAdapter(SchemaAdapter):
             value = self._default
         try:
             return super().validate(value, abort_early, path)
-        except ValidationError:
-            if not self._ensure:
+        except ValidationError as err:
+            if not self._ensure or budget_exceeded(err):
                 raise
         return self._default
 
@@ -324,6 +363,118 @@ class SchemaImmutableAdapter(SchemaAdapter):
         return value
 
 
+class SchemaBudgetAdapter(SchemaAdapter):
+    """
+    An adapter that limits the time spent validating a value.
+
+    Validation of the wrapped schema runs under `time_budget()`: once the
+    budget is exhausted, it stops at the next array element, mapping field
+    or binary record (or before the next `matches()` pattern) with a
+    "budget" error, so a single oversized or adversarial payload can't hold
+    a worker for seconds.
+
+    Attributes:
+        _ms (float): The time budget in milliseconds.
+    """
+
+    _ms: float
+
+    def __init__(
+        self,
+        schema: ISchema | ISchemaAdapter,
+        ms: float,
+        message: ErrorMessage = locale["budget"],
+    ):
+        """
+        Initializes a new SchemaBudgetAdapter instance.
+
+        Args:
+            schema (Union[ISchema, ISchemaAdapter]): The schema to wrap.
+            ms (float): The time budget of each validation, in milliseconds.
+            message (ErrorMessage, optional): The error message to use once the
+                budget is exhausted. Defaults to the locale-defined message for "budget".
+
+        Raises:
+            ValueError: If `ms` is not positive.
+        """
+        if ms <= 0:
+            raise ValueError("ms must be positive")
+        super().__init__(schema, message)
+        self._ms = ms
+
+    def validate(
+        self, value: Any = None, abort_early: bool = True, path: str = "~"
+    ) -> Any:
+        """
+        Validates the given value against the wrapped schema within the time budget.
+
+        Args:
+            value (Any, optional): The value to validate. Defaults to None.
+            abort_early (bool, optional): If True, validation stops on the first
+                error. If False, all errors are collected. Defaults to True.
+            path (str, optional): The current path in the data structure.
+                Defaults to "~".
+
+        Returns:
+            Any: The validated value returned by the wrapped schema.
+
+        Raises:
+            ValidationError: If validation fails in the wrapped schema, or with
+                a "budget" constraint if the time budget is exhausted.
+        """
+        with time_budget(self._ms, self._message):
+            return self._schema.validate(value, abort_early, path)
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Returns a deep-frozen view of a decoded JSON value: objects become
+    read-only `MappingProxyType` mappings and arrays become tuples.
+
+    Args:
+        value (Any): The decoded JSON value.
+
+    Returns:
+        Any: The frozen value.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _shape_keys(schema: ISchema | ISchemaAdapter) -> set[str]:
+    """
+    Collects the field names of every mapping schema reachable from `schema`,
+    through adapters, array items, union options and nested mappings.
+
+    Args:
+        schema (Union[ISchema, ISchemaAdapter]): The root schema.
+
+    Returns:
+        set[str]: The field names.
+    """
+    keys: set[str] = set()
+    seen: set[int] = set()
+    stack: list[Any] = [schema]
+    while stack:
+        current = stack.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, SchemaAdapter):
+            stack.append(current.schema)
+            continue
+        fields = getattr(current, "_fields", None)
+        if isinstance(fields, dict):
+            keys.update(k for k in fields if isinstance(k, str))
+            stack.extend(fields.values())
+        stack.append(getattr(current, "_of_schema_type", None))
+        stack.extend(getattr(current, "_options", ()))
+    return keys
+
+
 class SchemaJsonAdapter(SchemaAdapter):
     """
     An adapter that first parses the input value as JSON and then optionally
@@ -334,12 +485,41 @@ class SchemaJsonAdapter(SchemaAdapter):
     step directly into the validation pipeline. It supports both the standard
     `json` library and the faster `orjson` library.
 
+    Oversized or pathologically nested payloads can be rejected before they
+    are parsed with the `max_bytes`, `max_depth` and `max_items` limits.
+
+    With a `cache`, the outcome of a payload (its validated value, or the
+    validation error) is cached under a 128-bit BLAKE2b digest of the raw
+    payload, so byte-identical payloads (retried webhooks, polling clients)
+    skip both parsing and validation. Cached values are shared, so they are
+    returned deep-frozen: objects as read-only `MappingProxyType` and arrays
+    as tuples.
+
     Attributes:
         _json_parser (SUPPORTED_JSON_PARSER): The name of the JSON parsing library
             to use ("json" or "orjson").
+        _max_bytes (int | None): The maximum length of the raw payload.
+        _max_depth (int | None): The maximum nesting depth of arrays and objects.
+        _max_items (int | None): The maximum total number of array elements
+            and object members.
+        _reject_duplicate_keys (bool): If True, objects with a repeated key are
+            rejected while parsing.
+        _intern_keys (dict[str, str] | None): The field names of the wrapped
+            schema, each mapped to itself and shared by every decoded object,
+            or None if keys are not interned.
+        _cache (LRUCache | None): The cache of payload outcomes, if any.
+        _verify (bool): If True, cache hits are confirmed by comparing the raw
+            payloads, not only their digests.
     """
 
     _json_parser: SUPPORTED_JSON_PARSER
+    _max_bytes: int | None
+    _max_depth: int | None
+    _max_items: int | None
+    _reject_duplicate_keys: bool
+    _intern_keys: dict[str, str] | None
+    _cache: LRUCache | None
+    _verify: bool
 
     def __init__(
         self,
@@ -347,6 +527,13 @@ class SchemaJsonAdapter(SchemaAdapter):
         message: ErrorMessage = locale["json"],
         *,
         json_parser: SUPPORTED_JSON_PARSER = "json",
+        max_bytes: int | None = None,
+        max_depth: int | None = None,
+        max_items: int | None = None,
+        reject_duplicate_keys: bool = False,
+        intern_keys: bool = False,
+        cache: LRUCache | None = None,
+        verify: bool = False,
     ):
         """
         Initializes a new SchemaJsonAdapter instance.
@@ -359,9 +546,72 @@ class SchemaJsonAdapter(SchemaAdapter):
             json_parser (SUPPORTED_JSON_PARSER, optional): The JSON parsing library to use.
                 Can be "json" (standard library) or "orjson" (if installed for performance).
                 Defaults to "json".
+            max_bytes (int | None, optional): The maximum length of the raw payload,
+                checked with `len()` (bytes for byte-like input, characters for
+                strings). Defaults to None (unlimited).
+            max_depth (int | None, optional): The maximum nesting depth of arrays
+                and objects. Defaults to None (unlimited).
+            max_items (int | None, optional): The maximum total number of array
+                elements and object members. Defaults to None (unlimited).
+            reject_duplicate_keys (bool, optional): If True, objects with a
+                repeated key are rejected with a "duplicate_key" error while
+                parsing. Defaults to False.
+            intern_keys (bool, optional): If True, decoded keys matching a field
+                of the mapping schemas in `schema` are replaced by the field name
+                itself, so that every decoded object shares one string per key.
+                Defaults to False.
+            cache (LRUCache | None, optional): A cache (e.g. an `LRUCache` or a
+                `TTLCache`) dedicated to this adapter, keeping the outcome of
+                the most recent payloads. Defaults to None (no caching).
+            verify (bool, optional): If True, the raw payload is kept with its
+                cached outcome and compared on every hit, which rules out digest
+                collisions at the cost of storing the payloads. Defaults to False.
         """
         super().__init__(schema, message)
         self._json_parser = json_parser
+        self._max_bytes = max_bytes
+        self._max_depth = max_depth
+        self._max_items = max_items
+        self._reject_duplicate_keys = reject_duplicate_keys
+        self._intern_keys = {k: k for k in _shape_keys(schema)} if intern_keys else None
+        self._cache = cache
+        self._verify = verify
+
+    def _check_limits(self, value: Any, path: str) -> None:
+        """
+        Internal method rejecting payloads that exceed the configured limits
+        before they are parsed.
+
+        The size is checked with `len()`; depth and item count are measured
+        with a single scan of the raw payload (see `yupy._json_decode.measure`)
+        only if one of those limits is set.
+
+        Args:
+            value (Any): The raw JSON payload.
+            path (str): The current path in the data structure.
+
+        Raises:
+            ValidationError: With a "json_limit" constraint if a limit is exceeded.
+        """
+        if not isinstance(value, (str, bytes, bytearray, memoryview)):
+            return
+
+        exceeded: tuple[str, int] | None = None
+        if self._max_bytes is not None and len(value) > self._max_bytes:
+            exceeded = ("max_bytes", self._max_bytes)
+        elif self._max_depth is not None or self._max_items is not None:
+            depth, items = measure(value)
+            if self._max_depth is not None and depth > self._max_depth:
+                exceeded = ("max_depth", self._max_depth)
+            elif self._max_items is not None and items > self._max_items:
+                exceeded = ("max_items", self._max_items)
+
+        if exceeded is not None:
+            raise ValidationError(
+                Constraint("json_limit", locale["json_limit"], *exceeded),
+                path,
+                invalid_value=value,
+            )
 
     def validate(
         self, value: Any = None, abort_early: bool = True, path: str = "~"
@@ -374,6 +624,9 @@ class SchemaJsonAdapter(SchemaAdapter):
         (which handles both standard `json` and `orjson` based on
         `self._json_parser`).
 
+        Before parsing, the payload is checked against the `max_bytes`,
+        `max_depth` and `max_items` limits, if any.
+
         If a `JSONDecodeError` occurs during parsing, it is caught and re-raised
         as a `ValidationError` with a specific "json" constraint, providing
         more context within the validation framework.
@@ -393,16 +646,79 @@ class SchemaJsonAdapter(SchemaAdapter):
         Returns:
             Any: The parsed Python object (dict, list, str, int, float, bool, None).
                 This is the value after JSON parsing and potential schema validation.
+                With a cache, it is deep-frozen.
 
         Raises:
-            ValidationError: If the input `value` is not a valid JSON string or
-                byte-like object (wrapping `JSONDecodeError`), or if a schema
-                is provided and validation of the parsed value fails against that schema.
+            ValidationError: If the input `value` exceeds a configured limit,
+                is not a valid JSON string or byte-like object (wrapping
+                `JSONDecodeError`), or if a schema is provided and validation
+                of the parsed value fails against that schema.
         """
+        cache = self._cache
+        if cache is None or not isinstance(value, (str, bytes, bytearray, memoryview)):
+            return self._validate_payload(value, abort_early, path)
+
+        raw = (
+            value.encode("utf-8", "surrogatepass") if isinstance(value, str) else value
+        )
+        # Limits measure strings and bytes differently, so they don't share entries
+        key = (
+            hashlib.blake2b(raw, digest_size=16).digest(),
+            isinstance(value, str),
+            abort_early,
+            path,
+        )
+        entry = cache.get(key, _MISSING_)
+        if entry is not _MISSING_ and (not self._verify or entry[0] == raw):
+            _, valid, outcome = entry
+            if valid:
+                return outcome
+            raise ValidationError(
+                outcome.constraint,
+                outcome.path,
+                outcome._errors,
+                invalid_value=outcome.invalid_value,
+            )
+
+        stored = bytes(raw) if self._verify else None
         try:
-            value = loads(value, self._json_parser)
+            result = _freeze(self._validate_payload(value, abort_early, path))
+        except ValidationError as err:
+            if not budget_exceeded(err):
+                cache.put(key, (stored, False, err))
+            raise
+        cache.put(key, (stored, True, result))
+        return result
+
+    def _validate_payload(self, value: Any, abort_early: bool, path: str) -> Any:
+        """
+        Internal method checking the limits of a payload, parsing it and
+        validating the parsed value against the schema.
+
+        Args:
+            value (Any): The JSON string or byte-like object.
+            abort_early (bool): If True, validation stops on the first error.
+            path (str): The current path in the data structure.
+
+        Returns:
+            Any: The parsed and validated value.
+
+        Raises:
+            ValidationError: If the payload exceeds a limit, is not valid JSON,
+                or fails validation against the schema.
+        """
+        self._check_limits(value, path)
+        try:
+            value = loads(
+                value,
+                self._json_parser,
+                reject_duplicate_keys=self._reject_duplicate_keys,
+                intern_keys=self._intern_keys,
+            )
         except JSONDecodeError as err:
             raise ValidationError(
                 Constraint("json", self._message, origin=err), path, invalid_value=value
             )
+        except ValidationError as err:
+            raise ValidationError(err.constraint, path, invalid_value=value)
         return self._schema.validate(value, abort_early, path)
@@ -1,4 +1,8 @@
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
+from itertools import islice
+from threading import Lock
+from time import monotonic
 from typing import Any
 
 from typing_extensions import Self
@@ -8,10 +12,15 @@ from yupy.icomparable_schema import ComparableSchema, EqualityComparableSchema
 from yupy.ischema import ISchema, _SchemaExpectedType
 from yupy.isized_schema import SizedSchema
 from yupy.locale import locale
+from yupy.schema import _optimize_nested
 from yupy.util.concat_path import concat_path
+from yupy.util.error_limit import errors_exceeded
+from yupy.util.revalidate import revalidate_field
+from yupy.util.subtree_memo import validate_once
+from yupy.util.time_budget import budget_exceeded, budget_expiry, check_time_budget
 from yupy.validation_error import Constraint, ValidationError
 
-__all__ = ("ArraySchema",)
+__all__ = ("ArrayCheckpoint", "ArraySchema")
 
 
 @dataclass
@@ -64,6 +73,27 @@ class ArraySchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
         self._of_schema_type = schema
         return self
 
+    def optimize(self, path: str = "~") -> Self:
+        """
+        Simplifies the rules of the array and of its element schema
+        (see `Schema.optimize()`).
+
+        Args:
+            path (str): The path of the schema, used in error messages.
+                Defaults to "~".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            ValueError: If the rules of the array or of its element schema
+                contradict each other.
+        """
+        super().optimize(path)
+        if self._of_schema_type is not None:
+            _optimize_nested(self._of_schema_type, concat_path(path, "[*]"))
+        return self
+
     def validate(
         self, value: Any = None, abort_early: bool = True, path: str = "~"
     ) -> Any:
@@ -74,6 +104,10 @@ class ArraySchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
         inherited from base classes, then delegates to `_validate_array` for
         element-wise validation if an `_of_schema_type` is set.
 
+        Within `identity_memo()`, an array object met again (e.g. shared by
+        several parents) reuses its first result, and an array containing
+        itself is rejected with a "cycle" error.
+
         Args:
             value (Any, optional): The value to validate. Defaults to None.
             abort_early (bool, optional): If True, validation stops on the first
@@ -85,6 +119,23 @@ class ArraySchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
         Returns:
             Any: The validated and potentially transformed array (list or tuple).
 
+        Raises:
+            ValidationError: If validation fails at the array level or for any element.
+        """
+        return validate_once(self, value, abort_early, path)
+
+    def _validate(self, value: Any, abort_early: bool, path: str) -> Any:
+        """
+        Internal method validating the array itself, then its elements.
+
+        Args:
+            value (Any): The value to validate.
+            abort_early (bool): If True, validation stops on the first error.
+            path (str): The current path in the data structure.
+
+        Returns:
+            Any: The validated and potentially transformed array.
+
         Raises:
             ValidationError: If validation fails at the array level or for any element.
         """
@@ -123,23 +174,53 @@ class ArraySchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
         if self._of_schema_type is None:
             return value
 
+        validated_result = self._validate_items(value, 0, abort_early, path)
+        if type(value) is tuple:
+            return tuple(validated_result)
+        return validated_result
+
+    def _validate_items(
+        self, value: list | tuple, start: int, abort_early: bool, path: str
+    ) -> list:
+        """
+        Internal method validating the elements of the array from index `start`.
+
+        Args:
+            value (Union[list, tuple]): The array (list or tuple) to validate.
+            start (int): The index of the first element to validate.
+            abort_early (bool): If True, validation stops on the first element
+                error. If False, all element errors are collected.
+            path (str): The current path in the data structure.
+
+        Returns:
+            list: The validated elements, from index `start`.
+
+        Raises:
+            ValidationError: If any element fails validation, or a general "array"
+                constraint error if multiple errors are collected.
+        """
+        item_schema = self._of_schema_type
+        if item_schema is None:
+            return list(islice(value, start, None))
         errs: list[ValidationError] = []
         validated_result = []
-        original_type = type(value)
 
-        for i, item in enumerate(value):
+        expiry = budget_expiry()
+        for i, item in enumerate(islice(value, start, None), start):
             item_path = concat_path(path, i)
+            if expiry is not None and monotonic() > expiry:
+                check_time_budget(item_path)
             try:
-                validated_item = self._of_schema_type.validate(
-                    item, abort_early, item_path
-                )
+                validated_item = item_schema.validate(item, abort_early, item_path)
                 validated_result.append(validated_item)
             except ValidationError as err:
-                if abort_early:
+                if abort_early or budget_exceeded(err):
                     raise
                 else:
                     errs.append(err)
                     validated_result.append(item)
+                    if errors_exceeded(path, len(errs)):
+                        break
 
         if errs:
             raise ValidationError(
@@ -148,11 +229,96 @@ class ArraySchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
                 errs,
                 invalid_value=value,
             )
-
-        if original_type is tuple:
-            return tuple(validated_result)
         return validated_result
 
+    def checkpoint(self) -> "ArrayCheckpoint":
+        """
+        Returns a validator for an append-only array (a time series buffer,
+        an event log) that only validates the elements appended since its
+        previous call.
+
+        Returns:
+            ArrayCheckpoint: A new checkpoint of this schema.
+        """
+        return ArrayCheckpoint(self)
+
+    def revalidate(
+        self,
+        previous: list | tuple,
+        changes: Mapping[int, Any],
+        abort_early: bool = True,
+        path: str = "~",
+    ) -> list | tuple:
+        """
+        Validates a previously validated array after replacing or patching
+        some elements, validating only the changed elements.
+
+        `changes` maps element indexes to their change: a mapping applied to
+        a nested mapping (or array) element patches it recursively (see
+        `MappingSchema.revalidate()`), and any other value replaces the
+        element. The array-level rules (length, tests) are then checked on
+        the patched array. `previous` is not modified.
+
+        Args:
+            previous (Union[list, tuple]): The array returned by a previous
+                validation against this schema.
+            changes (Mapping[int, Any]): The changes, by element index.
+            abort_early (bool, optional): If True, validation stops on the first
+                error. If False, all errors are collected. Defaults to True.
+            path (str, optional): The current path in the data structure.
+                Defaults to "~".
+
+        Returns:
+            Union[list, tuple]: The validated patched array, of the same type
+                as `previous`.
+
+        Raises:
+            TypeError: If `changes` is not a mapping of integer indexes.
+            IndexError: If an index is out of range.
+            ValidationError: If the patched array or any changed element fails
+                validation, or a general "array" constraint error if multiple
+                errors are collected.
+        """
+        if not isinstance(changes, Mapping) or not all(
+            isinstance(index, int) for index in changes
+        ):
+            raise TypeError("changes must be a mapping of indexes")
+
+        items = list(previous)
+        errs: list[ValidationError] = []
+        expiry = budget_expiry()
+        for index, change in changes.items():
+            items[index] = change
+            if self._of_schema_type is None:
+                continue
+            index %= len(items)
+            item_path = concat_path(path, index)
+            if expiry is not None and monotonic() > expiry:
+                check_time_budget(item_path)
+            try:
+                items[index] = revalidate_field(
+                    self._of_schema_type,
+                    previous[index],
+                    change,
+                    abort_early,
+                    item_path,
+                )
+            except ValidationError as err:
+                if abort_early or budget_exceeded(err):
+                    raise
+                errs.append(err)
+                if errors_exceeded(path, len(errs)):
+                    break
+
+        if errs:
+            raise ValidationError(
+                Constraint("array", locale["array"], path),
+                path,
+                errs,
+                invalid_value=items,
+            )
+        return super().validate(type(previous)(items), abort_early, path)
+
     def __getitem__(self, item: int) -> ISchema | ISchemaAdapter:
         """
         Allows accessing schema definitions for specific array indices.
@@ -172,3 +338,152 @@ class ArraySchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
             IndexError: If the index is out of bounds for `_fields`.
         """
         return self._fields[item]
+
+
+class _ArrayView(Sequence):
+    """
+    A read-only view of the first `length` validated elements of a checkpoint.
+
+    The checkpoint only appends to the list it views (a reset starts a new
+    list), so the view keeps showing the array it was returned for.
+    """
+
+    __slots__ = ("_items", "_kind", "_length")
+
+    def __init__(self, items: list, length: int, kind: type) -> None:
+        self._items = items
+        self._length = length
+        self._kind = kind
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            items = self._items
+            return self._kind(items[i] for i in range(self._length)[index])
+        if not -self._length <= index < self._length:
+            raise IndexError("array index out of range")
+        return self._items[index % self._length]
+
+    def __iter__(self) -> Iterator[Any]:
+        return islice(self._items, self._length)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _ArrayView):
+            kind: type = other._kind
+        elif isinstance(other, (list, tuple)):
+            kind = list if isinstance(other, list) else tuple
+        else:
+            return NotImplemented
+        return (
+            kind is self._kind
+            and len(other) == self._length
+            and all(a == b for a, b in zip(self, other))
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._kind(self)!r})"
+
+
+class ArrayCheckpoint:
+    """
+    An incremental validator for an array that only grows by appending.
+
+    It remembers the validated elements of the array it last validated
+    successfully; the next call only validates the elements appended since.
+    The array-level rules (type, length, tests) are still checked on the
+    whole array every time.
+
+    The elements already validated are assumed unchanged. If the array
+    shrank, or its first or last checkpointed element is no longer the same
+    object, or the schema has array-level transforms, the whole array is
+    validated again. Call `reset()` after modifying elements in place.
+    """
+
+    _schema: ArraySchema
+    _validated: list
+    _first: Any
+    _last: Any
+    _lock: Lock
+
+    def __init__(self, schema: ArraySchema):
+        """
+        Initializes a new checkpoint.
+
+        Args:
+            schema (ArraySchema): The schema the array is validated against.
+        """
+        self._schema = schema
+        self._lock = Lock()
+        self.reset()
+
+    @property
+    def count(self) -> int:
+        """
+        Returns the number of elements validated so far.
+
+        Returns:
+            int: The number of elements the next call won't validate again.
+        """
+        return len(self._validated)
+
+    def reset(self) -> None:
+        """
+        Forgets the validated elements, so the next call validates the whole array.
+        """
+        self._validated = []
+        self._first = self._last = None
+
+    def validate(
+        self, value: Any = None, abort_early: bool = True, path: str = "~"
+    ) -> Any:
+        """
+        Validates the array, only validating the elements appended since the
+        previous successful call.
+
+        The checkpoint only moves forward when validation succeeds.
+
+        Args:
+            value (Any, optional): The array to validate. Defaults to None.
+            abort_early (bool, optional): If True, validation stops on the first
+                error. If False, all errors are collected. Defaults to True.
+            path (str, optional): The current path in the data structure.
+                Defaults to "~".
+
+        Returns:
+            Any: The validated array, with transformed elements, as a
+                read-only sequence viewing the checkpoint (slices are lists or
+                tuples, like the array), so elements aren't copied again.
+
+        Raises:
+            ValidationError: If validation fails at the array level or for any
+                new element.
+        """
+        schema = self._schema
+        with self._lock:
+            checked = super(ArraySchema, schema).validate(value, abort_early, path)
+            if checked is None and schema._nullability:
+                self.reset()
+                return None
+            if schema._of_schema_type is None:
+                return checked
+
+            validated = self._validated
+            count = len(validated)
+            if count and (
+                schema._transforms
+                or len(checked) < count
+                or checked[0] is not self._first
+                or checked[count - 1] is not self._last
+            ):
+                self.reset()
+                validated = self._validated
+                count = 0
+            validated.extend(schema._validate_items(checked, count, abort_early, path))
+            if validated:
+                self._first = checked[0]
+                self._last = checked[-1]
+            return _ArrayView(validated, len(validated), type(checked))
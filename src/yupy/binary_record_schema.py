@@ -0,0 +1,379 @@
+import struct
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from mmap import mmap
+from time import monotonic
+from typing import Any, Literal, TypeAlias
+
+from typing_extensions import Self
+
+from yupy.adapters import ISchemaAdapter
+from yupy.ischema import ISchema, _SchemaExpectedType
+from yupy.locale import locale
+from yupy.schema import Schema
+from yupy.string_schema import StringSchema
+from yupy.util.concat_path import concat_path
+from yupy.util.time_budget import budget_exceeded, budget_expiry, check_time_budget
+from yupy.util.unwrap import unwrap
+from yupy.validation_error import Constraint, ValidationError
+
+__all__ = ("BinaryRecordSchema",)
+
+_Buffer: TypeAlias = bytes | bytearray | memoryview | mmap
+"""
+Type alias for the buffer types a binary record can be read from.
+"""
+
+ByteOrder = Literal["@", "=", "<", ">", "!"]
+"""
+Literal type for the `struct` byte order prefixes.
+"""
+
+_RecordLayout: TypeAlias = Mapping[str, tuple[str, ISchema | ISchemaAdapter | None]]
+"""
+Type alias for the layout definition of a binary record.
+
+It maps each field name to a pair of a single `struct` format item
+(e.g. `"I"`, `"8s"`, `"2x"`) and the schema the unpacked value must satisfy,
+or None if the value is not validated.
+"""
+
+_RecordField: TypeAlias = tuple[str, ISchema | ISchemaAdapter | None, bool]
+"""
+Type alias for a compiled record field: its name, its schema and whether the
+raw bytes are decoded to `str` before validation.
+"""
+
+
+@dataclass
+class BinaryRecordSchema(Schema):
+    """
+    A schema for validating fixed-layout packed binary records.
+
+    The record layout is described with `struct` format items, one per named
+    field. Values are read with `struct.unpack_from` directly from the buffer
+    (`bytes`, `bytearray`, `memoryview` or `mmap`), without copying it and
+    without building an intermediate dictionary, and each one is validated
+    against its field schema (e.g. a `NumberSchema` or a `StringSchema`).
+
+    `s` and `p` fields validated by a `StringSchema` are decoded with
+    `_encoding` and stripped of trailing NUL bytes before validation; bytes
+    that are not valid in `_encoding` fail with a "type" error for the field.
+
+    Inherits from `Schema`.
+
+    Attributes:
+        _type (_SchemaExpectedType): The expected Python type(s) for the schema's value.
+            Initialized to the supported buffer types.
+        _byte_order (ByteOrder): The `struct` byte order prefix. Defaults to "<".
+        _encoding (str): The encoding used to decode string fields. Defaults to "utf-8".
+        _fields (list[_RecordField]): The compiled value-producing fields, in order.
+        _struct (struct.Struct): The compiled record layout.
+    """
+
+    _type: _SchemaExpectedType = field(
+        init=False, default=(bytes, bytearray, memoryview, mmap)
+    )
+    _byte_order: ByteOrder = field(init=False, default="<")
+    _encoding: str = field(init=False, default="utf-8")
+    _fields: list[_RecordField] = field(init=False, default_factory=list)
+    _struct: struct.Struct = field(init=False, default=struct.Struct("<"))
+
+    def layout(
+        self,
+        fields: _RecordLayout,
+        byte_order: ByteOrder = "<",
+        encoding: str = "utf-8",
+    ) -> Self:
+        """
+        Defines the packed layout (fields, formats and schemas) of the record.
+
+        Args:
+            fields (_RecordLayout): A dictionary where keys are field names and
+                values are `(format, schema)` pairs. `format` must be a single
+                `struct` format item producing exactly one value, or a pad
+                item (`"x"`, `"3x"`) producing none. `schema` may be None to
+                skip validation of the field.
+            byte_order (ByteOrder, optional): The `struct` byte order prefix.
+                Defaults to "<" (little-endian, no alignment).
+            encoding (str, optional): The encoding used to decode string
+                fields. Defaults to "utf-8".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            TypeError: If `fields` is not a dictionary or if any schema is not
+                an `ISchema` or `ISchemaAdapter` instance.
+            ValueError: If a format is invalid or does not describe exactly one value.
+        """
+        if not isinstance(fields, Mapping):
+            raise TypeError("Layout definition must be a dictionary.")
+
+        compiled: list[_RecordField] = []
+        formats: list[str] = []
+        for name, (fmt, schema) in fields.items():
+            if schema is not None and not isinstance(schema, (ISchema, ISchemaAdapter)):
+                raise TypeError(
+                    "each layout schema must be an instance of ISchema, ISchemaAdapter or None"
+                )
+            try:
+                item = struct.Struct(byte_order + fmt)
+            except struct.error as err:
+                raise ValueError(f"Invalid format {fmt!r} for field {name!r}") from err
+            produced = len(item.unpack(bytes(item.size)))
+            if produced == 0:
+                formats.append(fmt)
+                continue
+            if produced != 1:
+                raise ValueError(
+                    f"Format {fmt!r} for field {name!r} must describe a single value"
+                )
+            decode = fmt[-1] in "sp" and isinstance(
+                unwrap(schema) if schema is not None else None, StringSchema
+            )
+            formats.append(fmt)
+            compiled.append((name, schema, decode))
+
+        self._byte_order = byte_order
+        self._encoding = encoding
+        self._fields = compiled
+        self._struct = struct.Struct(byte_order + "".join(formats))
+        return self
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the size of a single record in bytes.
+
+        Returns:
+            int: The record size.
+        """
+        return self._struct.size
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """
+        Returns the names of the value-producing fields, in layout order.
+
+        Returns:
+            tuple[str, ...]: The field names.
+        """
+        return tuple(name for name, _, _ in self._fields)
+
+    def validate(
+        self, value: Any = None, abort_early: bool = True, path: str = "~"
+    ) -> Any:
+        """
+        Validates the given buffer as a single record.
+
+        This method first performs general schema validation (e.g., type,
+        nullability) inherited from base classes, then checks that the buffer
+        is exactly one record long and validates every field.
+
+        Args:
+            value (Any, optional): The buffer to validate. Defaults to None.
+            abort_early (bool, optional): If True, validation stops on the first
+                field error. If False, all field errors are collected. Defaults to True.
+            path (str, optional): The current path in the data structure, used
+                for more informative error messages. Defaults to "~".
+
+        Returns:
+            Any: The buffer itself, unchanged.
+
+        Raises:
+            ValidationError: If validation fails for the buffer or for any field.
+        """
+        value = super().validate(value, abort_early, path)
+        if value is None and self._nullability:
+            return None
+        size = self._struct.size
+        if len(memoryview(value).cast("B")) != size:
+            raise ValidationError(
+                Constraint("length", locale["length"], size), path, invalid_value=value
+            )
+        self._validate_record(self._struct.unpack_from(value), abort_early, path, value)
+        return value
+
+    def validate_records(
+        self, buffer: _Buffer, abort_early: bool = True, path: str = "~"
+    ) -> int:
+        """
+        Validates every record of a buffer holding consecutive fixed-size records.
+
+        Records are unpacked one at a time from the buffer, so millions of
+        records can be validated from a `mmap` without loading or copying them.
+
+        Args:
+            buffer (_Buffer): The buffer holding the records. Its length must
+                be a multiple of `size`.
+            abort_early (bool, optional): If True, validation stops on the first
+                error. If False, all errors are collected. Defaults to True.
+            path (str, optional): The current path in the data structure.
+                Defaults to "~".
+
+        Returns:
+            int: The number of validated records.
+
+        Raises:
+            ValidationError: If the buffer length is not a multiple of the
+                record size, or if any record fails validation. When errors are
+                collected, a general "array" constraint error is raised.
+        """
+        errs: list[ValidationError] = []
+        count = 0
+        for count, _ in enumerate(
+            self._iter_records(buffer, abort_early, path, errs), 1
+        ):
+            pass
+        if errs:
+            raise ValidationError(
+                Constraint("array", locale["array"], path),
+                path,
+                errs,
+                invalid_value=buffer,
+            )
+        return count
+
+    def iter_records(
+        self, buffer: _Buffer, path: str = "~"
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Iterates over the records of a buffer, yielding the validated field
+        values of each record as a tuple ordered like `names`.
+
+        Validation stops with the first invalid record.
+
+        Args:
+            buffer (_Buffer): The buffer holding the records. Its length must
+                be a multiple of `size`.
+            path (str, optional): The current path in the data structure.
+                Defaults to "~".
+
+        Yields:
+            tuple[Any, ...]: The validated (and potentially transformed) field values.
+
+        Raises:
+            ValidationError: If the buffer length is not a multiple of the
+                record size, or if a record fails validation.
+        """
+        yield from self._iter_records(buffer, True, path, [])
+
+    def _iter_records(
+        self,
+        buffer: _Buffer,
+        abort_early: bool,
+        path: str,
+        errs: list[ValidationError],
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Internal generator that unpacks and validates consecutive records.
+
+        Errors are appended to `errs` when `abort_early` is False; the
+        corresponding records are skipped.
+
+        Args:
+            buffer (_Buffer): The buffer holding the records.
+            abort_early (bool): If True, the first error is raised immediately.
+            path (str): The current path in the data structure.
+            errs (list[ValidationError]): The list collecting record errors.
+
+        Yields:
+            tuple[Any, ...]: The validated field values of each valid record.
+        """
+        view = memoryview(buffer).cast("B")
+        size = self._struct.size
+        if size == 0 or len(view) % size:
+            raise ValidationError(
+                Constraint("multiple_of", locale["multiple_of"], size),
+                path,
+                invalid_value=buffer,
+            )
+        expiry = budget_expiry()
+        for i, values in enumerate(self._struct.iter_unpack(view)):
+            record_path = concat_path(path, i)
+            if expiry is not None and monotonic() > expiry:
+                check_time_budget(record_path)
+            try:
+                yield self._validate_record(
+                    values, abort_early, record_path, view[i * size : (i + 1) * size]
+                )
+            except ValidationError as err:
+                if abort_early or budget_exceeded(err):
+                    raise
+                errs.append(err)
+
+    @staticmethod
+    def _decode(raw: bytes, encoding: str, name: str) -> str:
+        """
+        Internal method decoding a string field, stripped of its NUL padding.
+
+        Raises:
+            ValidationError: A "type" constraint error if the bytes are not
+                valid in `encoding`.
+        """
+        try:
+            return raw.rstrip(b"\0").decode(encoding)
+        except UnicodeDecodeError:
+            raise ValidationError(
+                Constraint("type", locale["type"], str, bytes),
+                name,
+                invalid_value=raw,
+            ) from None
+
+    def _validate_record(
+        self,
+        values: tuple[Any, ...],
+        abort_early: bool,
+        path: str,
+        record: Any,
+    ) -> tuple[Any, ...]:
+        """
+        Internal method to validate the unpacked values of a single record.
+
+        Args:
+            values (tuple[Any, ...]): The values unpacked from the record.
+            abort_early (bool): If True, validation stops on the first field error.
+            path (str): The path of the record.
+            record (Any): The record buffer, reported as the invalid value when
+                errors are collected.
+
+        Returns:
+            tuple[Any, ...]: The validated (and potentially transformed) values.
+
+        Raises:
+            ValidationError: If any field fails validation (including string
+                fields that can't be decoded), or a general "mapping"
+                constraint error if multiple errors are collected.
+        """
+        errs: list[ValidationError] = []
+        validated = list(values)
+        encoding = self._encoding
+        for i, (name, schema, decode) in enumerate(self._fields):
+            if schema is None:
+                continue
+            item = values[i]
+            try:
+                if decode:
+                    item = self._decode(item, encoding, name)
+                validated[i] = schema.validate(item, abort_early, name)
+            except ValidationError as err:
+                # Field paths are only built when a field actually fails
+                field_err = ValidationError(
+                    err.constraint,
+                    concat_path(path, name),
+                    err._errors,
+                    invalid_value=err.invalid_value,
+                )
+                if abort_early or budget_exceeded(err):
+                    raise field_err from None
+                errs.append(field_err)
+
+        if errs:
+            raise ValidationError(
+                Constraint("mapping", locale["mapping"]),
+                path,
+                errs,
+                invalid_value=record,
+            )
+        return tuple(validated)
@@ -3,7 +3,7 @@ from typing import Any, Protocol, runtime_checkable
 from typing_extensions import Self
 
 from yupy.locale import ErrorMessage, locale
-from yupy.schema import Schema
+from yupy.schema import Schema, _describe, _rule_repr
 from yupy.validation_error import Constraint, ValidationError
 
 __all__ = (
@@ -13,6 +13,16 @@ __all__ = (
     "IEqualityComparableSchema",
 )
 
+_LOWER_BOUNDS = {"ge": 0, "gt": 1}
+"""
+The constraint types bounding a value from below, with their strictness.
+"""
+
+_UPPER_BOUNDS = {"le": 0, "lt": -1}
+"""
+The constraint types bounding a value from above, with their strictness.
+"""
+
 
 @runtime_checkable
 class IEqualityComparableSchema(Protocol):
@@ -132,7 +142,7 @@ class EqualityComparableSchema(Schema):
             if x != value:
                 raise ValidationError(Constraint("eq", message, value), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "eq", message, value))
 
     def ne(self, value: Any, message: ErrorMessage = locale["ne"]) -> Self:
         """
@@ -151,7 +161,7 @@ class EqualityComparableSchema(Schema):
             if x == value:
                 raise ValidationError(Constraint("ne", message, value), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "ne", message, value))
 
 
 class ComparableSchema(Schema):
@@ -161,6 +171,39 @@ class ComparableSchema(Schema):
     Inherits from `Schema` and implements `IComparableSchema`.
     """
 
+    def optimize(self, path: str = "~") -> Self:
+        """
+        Simplifies the rules of the schema (see `Schema.optimize()`), keeping
+        only the tightest lower and upper bounds: `ge(0).ge(5)` becomes
+        `ge(5)`, `positive().gt(10)` becomes `gt(10)`.
+
+        Args:
+            path (str): The path of the schema, used in error messages.
+                Defaults to "~".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            ValueError: If the rules contradict each other, e.g. `gt(5).lt(5)`.
+        """
+        super().optimize(path)
+        lower = self._keep_tightest(_LOWER_BOUNDS, lower=True)
+        upper = self._keep_tightest(_UPPER_BOUNDS, lower=False)
+        if lower is not None and upper is not None:
+            low, high = lower[1], upper[1]
+            try:
+                empty = low.args[0] > high.args[0] or (
+                    low.args[0] == high.args[0] and bool(lower[2] or upper[2])
+                )
+            except TypeError:
+                empty = False
+            if empty:
+                raise ValueError(
+                    f"{path}: {_rule_repr(low)} contradicts {_rule_repr(high)}"
+                )
+        return self
+
     def le(self, limit: Any, message: ErrorMessage = locale["le"]) -> Self:
         """
         Adds a validation rule to ensure the value is less than or equal to a limit.
@@ -178,7 +221,7 @@ class ComparableSchema(Schema):
             if x > limit:
                 raise ValidationError(Constraint("le", message, limit), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "le", message, limit))
 
     def ge(self, limit: Any, message: ErrorMessage = locale["ge"]) -> Self:
         """
@@ -197,7 +240,7 @@ class ComparableSchema(Schema):
             if x < limit:
                 raise ValidationError(Constraint("ge", message, limit), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "ge", message, limit))
 
     def lt(self, limit: Any, message: ErrorMessage = locale["lt"]) -> Self:
         """
@@ -216,7 +259,7 @@ class ComparableSchema(Schema):
             if x >= limit:
                 raise ValidationError(Constraint("lt", message, limit), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "lt", message, limit))
 
     def gt(self, limit: Any, message: ErrorMessage = locale["gt"]) -> Self:
         """
@@ -235,4 +278,4 @@ class ComparableSchema(Schema):
             if x <= limit:
                 raise ValidationError(Constraint("gt", message, limit), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "gt", message, limit))
@@ -0,0 +1,137 @@
+from collections.abc import Container
+from dataclasses import dataclass
+from typing import Any, Protocol, runtime_checkable
+
+from typing_extensions import Self
+
+from yupy.locale import ErrorMessage, locale
+from yupy.membership_store import BloomFilterStore, SortedArrayStore
+from yupy.schema import Schema, _describe
+from yupy.validation_error import Constraint, ValidationError
+
+__all__ = ("IMembershipSchema", "MembershipSchema")
+
+_IMMUTABLE_STORES = (frozenset, tuple, str, bytes, range, SortedArrayStore)
+"""
+Store types whose contents can't change, so membership rules over them are
+pure and their outcomes can be memoized.
+"""
+
+
+def _is_immutable(store: Container) -> bool:
+    """
+    Checks whether the contents of a store are known not to change.
+
+    Args:
+        store (Container): The store.
+
+    Returns:
+        bool: True for the stores of `_IMMUTABLE_STORES`, and Bloom filters
+            in front of one of them.
+    """
+    if isinstance(store, BloomFilterStore):
+        return _is_immutable(store._exact)
+    return isinstance(store, _IMMUTABLE_STORES)
+
+
+@runtime_checkable
+class IMembershipSchema(Protocol):
+    """
+    IMembershipSchema defines the interface for schemas that can validate
+    a value against a set of allowed or denied values.
+    """
+
+    def member_of(
+        self, store: Container, message: ErrorMessage = locale["member_of"]
+    ) -> Self:
+        """
+        Adds a validation rule to ensure the value is in the given store.
+
+        Args:
+            store (Container): The allowed values.
+            message (ErrorMessage): The error message to use if the validation fails.
+                Defaults to the locale-defined message for "member_of".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+
+    def not_member_of(
+        self, store: Container, message: ErrorMessage = locale["not_member_of"]
+    ) -> Self:
+        """
+        Adds a validation rule to ensure the value is not in the given store.
+
+        Args:
+            store (Container): The denied values.
+            message (ErrorMessage): The error message to use if the validation fails.
+                Defaults to the locale-defined message for "not_member_of".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+
+
+@dataclass
+class MembershipSchema(Schema):
+    """
+    A schema class that provides methods for validating a value against an
+    allowlist or a denylist.
+
+    The backing store is chosen per constraint: any container implementing
+    `in` works, from a plain `frozenset` to the compact stores of
+    `yupy.membership_store` (`SortedArrayStore`, memory-mapped or not, and
+    `BloomFilterStore`) for sets too large to keep as Python objects.
+    Rules over a mutable store (e.g. a `set`) are looked up on every
+    validation, even in memoized schemas.
+
+    Inherits from `Schema` and implements `IMembershipSchema`.
+    """
+
+    def member_of(
+        self, store: Container, message: ErrorMessage = locale["member_of"]
+    ) -> Self:
+        """
+        Adds a validation rule to ensure the value is in the given store.
+
+        Args:
+            store (Container): The allowed values.
+            message (ErrorMessage): The error message to use if the validation fails.
+                Defaults to the locale-defined message for "member_of".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+
+        def _(x: Any) -> None:
+            if x not in store:
+                raise ValidationError(
+                    Constraint("member_of", message, store), invalid_value=x
+                )
+
+        _.pure = _is_immutable(store)  # type: ignore[attr-defined]
+        return self.test(_describe(_, "member_of", message, store))
+
+    def not_member_of(
+        self, store: Container, message: ErrorMessage = locale["not_member_of"]
+    ) -> Self:
+        """
+        Adds a validation rule to ensure the value is not in the given store.
+
+        Args:
+            store (Container): The denied values.
+            message (ErrorMessage): The error message to use if the validation fails.
+                Defaults to the locale-defined message for "not_member_of".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+
+        def _(x: Any) -> None:
+            if x in store:
+                raise ValidationError(
+                    Constraint("not_member_of", message, store), invalid_value=x
+                )
+
+        _.pure = _is_immutable(store)  # type: ignore[attr-defined]
+        return self.test(_describe(_, "not_member_of", message, store))
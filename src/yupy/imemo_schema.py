@@ -0,0 +1,190 @@
+from dataclasses import dataclass, field
+from typing import Any, Protocol, runtime_checkable
+
+from typing_extensions import Self
+
+from yupy.adapters import _REQUIRED_UNDEFINED_
+from yupy.schema import Schema, _is_pure, _value_key
+from yupy.util.cache import CacheInfo, LRUCache
+from yupy.util.time_budget import budget_exceeded
+from yupy.validation_error import ValidationError
+
+__all__ = ("IMemoSchema", "MemoSchema")
+
+_MISSING = object()
+
+
+@runtime_checkable
+class IMemoSchema(Protocol):
+    """
+    IMemoSchema defines the interface for schemas that can cache their
+    validation results by value.
+    """
+
+    def memoize(self, maxsize: int = 1024) -> Self:
+        """
+        Caches the validation result of the most recently validated values.
+
+        Args:
+            maxsize (int): The maximum number of cached values. Defaults to 1024.
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+
+    @property
+    def memo_info(self) -> CacheInfo | None:
+        """
+        Returns the statistics of the validation result cache.
+
+        Returns:
+            CacheInfo | None: The cache statistics, or None if the schema is
+                not memoized.
+        """
+
+    @property
+    def memoized(self) -> bool:
+        """
+        Returns whether validation results are currently cached.
+
+        Returns:
+            bool: True if validation results are cached.
+        """
+
+
+@dataclass
+class MemoSchema(Schema):
+    """
+    A schema class that can cache its validation results by value.
+
+    Once `memoize()` is called, the result of validating a value (the
+    transformed value, or the failed constraint) is kept in a bounded LRU
+    cache keyed by value and type (see `_value_key`), so repeated values (status codes,
+    enum-like strings, small integers) skip the transforms and validators.
+
+    Caching is only used while every transform and validator of the schema
+    is pure: built-in rules are, user-defined `test()` and `transform()`
+    callables are only if added with `pure=True`. Changing the rules clears
+    the cache.
+
+    Inherits from `Schema` and implements `IMemoSchema`.
+
+    Attributes:
+        _memo (LRUCache | None): The validation result cache, if memoized.
+        _memo_rules (tuple[int, int, int]): The revision of the rules and the
+            number of transforms and validators `_memo_pure` was computed for.
+        _memo_pure (bool): Whether every transform and validator is pure.
+    """
+
+    _memo: LRUCache | None = field(init=False, default=None, repr=False, compare=False)
+    _memo_rules: tuple[int, int, int] = field(
+        init=False, default=(-1, -1, -1), repr=False, compare=False
+    )
+    _memo_pure: bool = field(init=False, default=False, repr=False, compare=False)
+
+    def memoize(self, maxsize: int = 1024) -> Self:
+        """
+        Caches the validation result of the most recently validated values.
+
+        Args:
+            maxsize (int): The maximum number of cached values. Defaults to 1024.
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            ValueError: If `maxsize` is less than 1.
+        """
+        self._memo = LRUCache(maxsize)
+        self._memo_rules = (-1, -1, -1)
+        return self
+
+    @property
+    def memo_info(self) -> CacheInfo | None:
+        """
+        Returns the statistics of the validation result cache.
+
+        Returns:
+            CacheInfo | None: The cache statistics, or None if the schema is
+                not memoized.
+        """
+        return None if self._memo is None else self._memo.info()
+
+    @property
+    def memoized(self) -> bool:
+        """
+        Returns whether validation results are currently cached, i.e. the
+        schema is memoized and all its rules are pure.
+
+        Returns:
+            bool: True if validation results are cached.
+        """
+        return self._memo is not None and self._memo_ready(self._memo)
+
+    def _memo_ready(self, memo: LRUCache) -> bool:
+        """
+        Internal method checking that every rule is pure, once per change of
+        the rules. Cached results are dropped when the rules change.
+
+        Args:
+            memo (LRUCache): The validation result cache.
+
+        Returns:
+            bool: True if the cache can be used.
+        """
+        # the counts catch rules appended to the lists directly
+        rules = (self._revision, len(self._transforms), len(self._validators))
+        if rules != self._memo_rules:
+            memo.clear()
+            self._memo_pure = all(map(_is_pure, self._transforms)) and all(
+                map(_is_pure, self._validators)
+            )
+            self._memo_rules = rules
+        return self._memo_pure
+
+    def validate(
+        self, value: Any = None, abort_early: bool = True, path: str = "~"
+    ) -> Any:
+        """
+        Validates the given value, through the validation result cache if
+        the schema is memoized.
+
+        Args:
+            value (Any, optional): The value to validate. Defaults to None.
+            abort_early (bool, optional): If True, validation stops on the first
+                error. If False, all errors are collected. Defaults to True.
+            path (str, optional): The current path in the data structure.
+                Defaults to "~".
+
+        Returns:
+            Any: The validated and potentially transformed value.
+
+        Raises:
+            ValidationError: If validation fails (or failed for an equal value).
+        """
+        memo = self._memo
+        if (
+            memo is None
+            or value is None
+            or value is _REQUIRED_UNDEFINED_
+            or not self._memo_ready(memo)
+        ):
+            return super().validate(value, abort_early, path)
+        key = _value_key(value)
+        try:
+            entry = memo.get(key, _MISSING)
+        except TypeError:
+            return super().validate(value, abort_early, path)
+        if entry is _MISSING:
+            try:
+                result = super().validate(value, abort_early, path)
+            except ValidationError as err:
+                if not budget_exceeded(err):
+                    memo.put(key, (False, err.constraint))
+                raise
+            memo.put(key, (True, result))
+            return result
+        valid, result = entry
+        if not valid:
+            raise ValidationError(result, path, invalid_value=value)
+        return result
@@ -122,7 +122,7 @@ class ISchema(Protocol[_P]):
             value (Any): The value to check against the schema's expected type.
         """
 
-    def transform(self, func: TransformFunc) -> Self:
+    def transform(self, func: TransformFunc, pure: bool = False) -> Self:
         """
         Adds a transformation function to be applied to the value before validation.
 
@@ -132,6 +132,8 @@ class ISchema(Protocol[_P]):
         Args:
             func (TransformFunc): A callable that takes one argument (the value)
                 and returns the transformed value.
+            pure (bool): Declares the function deterministic and free of side
+                effects. Defaults to False.
 
         Returns:
             Self: The schema instance, allowing for method chaining.
@@ -148,7 +150,13 @@ class ISchema(Protocol[_P]):
             Any: The transformed value after applying all transformation functions.
         """
 
-    def test(self, func: ValidatorFunc) -> Self:
+    def test(
+        self,
+        func: ValidatorFunc,
+        pure: bool = False,
+        cost: float | None = None,
+        cache: Any = None,
+    ) -> Self:
         """
         Adds a custom validation test function to the schema.
 
@@ -158,6 +166,12 @@ class ISchema(Protocol[_P]):
         Args:
             func (ValidatorFunc): A callable that takes one argument (the value)
                 and performs validation. It should raise `ValidationError` on failure.
+            pure (bool): Declares the function deterministic and free of side
+                effects. Defaults to False.
+            cost (float | None): The relative cost of the test, used to run
+                expensive tests last. Defaults to None.
+            cache (Any): A cache keeping the outcome of the test per value.
+                Defaults to None.
 
         Returns:
             Self: The schema instance, allowing for method chaining.
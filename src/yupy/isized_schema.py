@@ -1,16 +1,35 @@
-from collections.abc import Sized
+from collections.abc import Callable, Sized
 from dataclasses import dataclass
 from typing import Protocol, runtime_checkable
 
 from typing_extensions import Self
 
 from yupy.locale import ErrorMessage, locale
-from yupy.schema import Schema
+from yupy.schema import Schema, _constraint_of, _describe, _rule_repr
 from yupy.validation_error import Constraint, ValidationError
 
 __all__ = ("ISizedSchema", "SizedSchema")
 
 
+def _length(limit: int, message: ErrorMessage) -> Callable[[Sized], None]:
+    """
+    Builds the validator of a `length()` rule.
+
+    Args:
+        limit (int): The required length of the value.
+        message (ErrorMessage): The error message to use if the validation fails.
+
+    Returns:
+        Callable[[Sized], None]: The described validator.
+    """
+
+    def _(x: Sized) -> None:  # Use Sized instead of Iterable
+        if len(x) != limit:
+            raise ValidationError(Constraint("length", message, limit), invalid_value=x)
+
+    return _describe(_, "length", message, limit)
+
+
 @runtime_checkable
 class ISizedSchema(Protocol):
     """
@@ -69,6 +88,73 @@ class SizedSchema(Schema):
     Inherits from `Schema` and implements `ISizedSchema`.
     """
 
+    def optimize(self, path: str = "~") -> Self:
+        """
+        Simplifies the rules of the schema (see `Schema.optimize()`), keeping
+        only the tightest `min()` and `max()`, folding `min(n).max(n)` into
+        `length(n)` and dropping size bounds implied by `length()`.
+
+        Args:
+            path (str): The path of the schema, used in error messages.
+                Defaults to "~".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            ValueError: If the rules contradict each other, e.g. `min(10).max(5)`.
+        """
+        super().optimize(path)
+        low = self._keep_tightest({"min": 0}, lower=True)
+        high = self._keep_tightest({"max": 0}, lower=False)
+        lengths = [
+            (func, constraint)
+            for func in self._validators
+            if (constraint := _constraint_of(func)) is not None
+            and constraint.type == "length"
+        ]
+        if len(lengths) > 1:
+            raise ValueError(
+                f"{path}: {_rule_repr(lengths[0][1])} contradicts "
+                f"{_rule_repr(lengths[1][1])}"
+            )
+        if low is not None and high is not None and low[1].args[0] > high[1].args[0]:
+            raise ValueError(
+                f"{path}: {_rule_repr(low[1])} contradicts {_rule_repr(high[1])}"
+            )
+        index = {id(func): i for i, func in enumerate(self._validators)}
+        implied: set[int] = set()
+        folded = False
+        if lengths:
+            func, length = lengths[0]
+            for bound_func, bound, _ in (rule for rule in (low, high) if rule):
+                if (
+                    length.args[0] < bound.args[0]
+                    if bound.type == "min"
+                    else length.args[0] > bound.args[0]
+                ):
+                    raise ValueError(
+                        f"{path}: {_rule_repr(length)} contradicts {_rule_repr(bound)}"
+                    )
+                first, second = index[id(bound_func)], index[id(func)]
+                if first > second or self._can_replace(first, second):
+                    implied.add(first)
+        elif low is not None and high is not None and low[1].args[0] == high[1].args[0]:
+            first, second = sorted((index[id(low[0])], index[id(high[0])]))
+            if self._can_replace(first, second):
+                message = low[1].message
+                if message != high[1].message:
+                    message = locale["length"]
+                self._validators[first] = _length(low[1].args[0], message)
+                implied.add(second)
+                folded = True
+        if low is not None and low[1].args[0] <= 0 and not folded:
+            implied.add(index[id(low[0])])
+        self._validators = [
+            func for i, func in enumerate(self._validators) if i not in implied
+        ]
+        return self
+
     def length(self, limit: int, message: ErrorMessage = locale["length"]) -> Self:
         """
         Adds a validation rule to ensure the value has an exact length.
@@ -81,14 +167,7 @@ class SizedSchema(Schema):
         Returns:
             Self: The schema instance, allowing for method chaining.
         """
-
-        def _(x: Sized) -> None:  # Use Sized instead of Iterable
-            if len(x) != limit:
-                raise ValidationError(
-                    Constraint("length", message, limit), invalid_value=x
-                )
-
-        return self.test(_)
+        return self.test(_length(limit, message))
 
     def min(self, limit: int, message: ErrorMessage = locale["min"]) -> Self:
         """
@@ -109,7 +188,7 @@ class SizedSchema(Schema):
                     Constraint("min", message, limit), invalid_value=x
                 )
 
-        return self.test(_)
+        return self.test(_describe(_, "min", message, limit))
 
     def max(self, limit: int, message: ErrorMessage = locale["max"]) -> Self:
         """
@@ -130,4 +209,4 @@ class SizedSchema(Schema):
                     Constraint("max", message, limit), invalid_value=x
                 )
 
-        return self.test(_)
+        return self.test(_describe(_, "max", message, limit))
@@ -58,7 +58,18 @@ class Locale(TypedDict, total=False):
     mapping: ErrorMessage
     strict: ErrorMessage
     one_of: ErrorMessage
+    discriminator: ErrorMessage
+    member_of: ErrorMessage
+    not_member_of: ErrorMessage
+    starts_with_any: ErrorMessage
+    ends_with_any: ErrorMessage
+    contains_none_of: ErrorMessage
     json: ErrorMessage
+    json_limit: ErrorMessage
+    duplicate_key: ErrorMessage
+    query: ErrorMessage
+    budget: ErrorMessage
+    cycle: ErrorMessage
     undefined: ErrorMessage
 
 
@@ -94,7 +105,18 @@ LocaleKey = Literal[
     "mapping",
     "strict",
     "one_of",
+    "discriminator",
+    "member_of",
+    "not_member_of",
+    "starts_with_any",
+    "ends_with_any",
+    "contains_none_of",
     "json",
+    "json_limit",
+    "duplicate_key",
+    "query",
+    "budget",
+    "cycle",
     "undefined",
 ]
 """
@@ -135,7 +157,18 @@ locale: Locale = {
         f"Object contains unknown keys: {', '.join(map(repr, args))}"
     ),
     "one_of": lambda args: f"Must be one of {args[0]!r}",
+    "discriminator": lambda args: f"Value of {args[0]!r} must be one of {args[1]!r}",
+    "member_of": "Value is not an allowed value",
+    "not_member_of": "Value is not allowed",
+    "starts_with_any": "Value must start with an allowed prefix",
+    "ends_with_any": "Value must end with an allowed suffix",
+    "contains_none_of": lambda args: f"Value must not contain {args[0]!r}",
     "json": lambda args: "Value must be a valid JSON",
+    "json_limit": lambda args: f"JSON payload exceeds {args[0]} of {args[1]!r}",
+    "duplicate_key": lambda args: f"Object contains duplicate key {args[0]!r}",
+    "query": "Value must be a valid query string",
+    "budget": lambda args: f"Validation exceeded its time budget of {args[0]!r} ms",
+    "cycle": "Value contains a reference to itself",
     "undefined": "Undefined validation error",
 }
 """
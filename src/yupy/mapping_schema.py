@@ -1,5 +1,6 @@
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 from dataclasses import dataclass, field
+from time import monotonic
 from typing import Any, TypeAlias
 
 from typing_extensions import Self
@@ -8,7 +9,12 @@ from yupy.adapters import _REQUIRED_UNDEFINED_, ISchemaAdapter
 from yupy.icomparable_schema import EqualityComparableSchema
 from yupy.ischema import ISchema, _SchemaExpectedType
 from yupy.locale import ErrorMessage, locale
+from yupy.schema import _optimize_nested, _pure
 from yupy.util.concat_path import concat_path
+from yupy.util.error_limit import errors_exceeded
+from yupy.util.revalidate import revalidate_field
+from yupy.util.subtree_memo import validate_once
+from yupy.util.time_budget import budget_exceeded, budget_expiry, check_time_budget
 from yupy.validation_error import Constraint, ValidationError
 
 __all__ = ("MappingSchema",)
@@ -107,7 +113,28 @@ class MappingSchema(EqualityComparableSchema):
                     invalid_value=x,  # The whole dictionary is the invalid value in this case
                 )
 
-        return self.test(_)
+        return self.test(_pure(_))
+
+    def optimize(self, path: str = "~") -> Self:
+        """
+        Simplifies the rules of the mapping and of its fields
+        (see `Schema.optimize()`).
+
+        Args:
+            path (str): The path of the schema, used in error messages.
+                Defaults to "~".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            ValueError: If the rules of the mapping or of a field contradict
+                each other.
+        """
+        super().optimize(path)
+        for key, schema in self._fields.items():
+            _optimize_nested(schema, concat_path(path, key))
+        return self
 
     def validate(
         self, value: Any = None, abort_early: bool = True, path: str = "~"
@@ -119,6 +146,10 @@ class MappingSchema(EqualityComparableSchema):
         inherited from base classes, then delegates to `_validate_shape` for
         field-wise validation.
 
+        Within `identity_memo()`, a mapping object met again (e.g. shared by
+        several parents) reuses its first result, and a mapping containing
+        itself is rejected with a "cycle" error.
+
         Args:
             value (Any, optional): The value to validate. Defaults to None.
             abort_early (bool, optional): If True, validation stops on the first
@@ -130,6 +161,23 @@ class MappingSchema(EqualityComparableSchema):
         Returns:
             Any: The validated and potentially transformed mapping.
 
+        Raises:
+            ValidationError: If validation fails at the mapping level or for any field.
+        """
+        return validate_once(self, value, abort_early, path)
+
+    def _validate(self, value: Any, abort_early: bool, path: str) -> Any:
+        """
+        Internal method validating the mapping itself, then its fields.
+
+        Args:
+            value (Any): The value to validate.
+            abort_early (bool): If True, validation stops on the first error.
+            path (str): The current path in the data structure.
+
+        Returns:
+            Any: The validated and potentially transformed mapping.
+
         Raises:
             ValidationError: If validation fails at the mapping level or for any field.
         """
@@ -164,21 +212,26 @@ class MappingSchema(EqualityComparableSchema):
                 constraint error if multiple errors are collected.
         """
         errs: list[ValidationError] = []
+        expiry = budget_expiry()
         for (
             key,
             field_schema,
         ) in self._fields.items():  # Renamed 'field' to 'field_schema' to avoid confusion with dataclasses.field
             path_ = concat_path(path, key)
+            if expiry is not None and monotonic() > expiry:
+                check_time_budget(path_)
             try:
                 # Pass _REQUIRED_UNDEFINED_ if key is not in value
                 field_value = value.get(key, _REQUIRED_UNDEFINED_)
                 value[key] = field_schema.validate(field_value, abort_early, path_)
             except ValidationError as err:
-                if abort_early:
+                if abort_early or budget_exceeded(err):
                     # When abort_early is True, re-raise the original error with the correct path and invalid_value
                     # The original err.path is already correct
                     raise
                 errs.append(err)  # Append the original error to collect all
+                if errors_exceeded(path, len(errs)):
+                    break
 
         if errs:
             # When collecting errors, the main error describes the object itself being invalid
@@ -192,6 +245,91 @@ class MappingSchema(EqualityComparableSchema):
             )
         return value
 
+    def revalidate(
+        self,
+        previous: Mapping[str, Any],
+        changes: Mapping[str, Any],
+        abort_early: bool = True,
+        path: str = "~",
+    ) -> MutableMapping[str, Any]:
+        """
+        Validates a previously validated mapping after applying changes,
+        validating only the changed fields.
+
+        `changes` is a JSON merge patch (RFC 7396): a key set to None is
+        removed (and its field validated as missing), a mapping applied to a
+        nested mapping (or array) field patches it recursively (see
+        `ArraySchema.revalidate()` for arrays), and any other value replaces
+        the field. Unchanged fields are not validated again.
+
+        The mapping-level rules (strictness, tests) are then checked on the
+        patched mapping. `previous` is not modified: the result is a new
+        mapping sharing the unchanged values with `previous`.
+
+        Args:
+            previous (Mapping[str, Any]): The mapping returned by a previous
+                validation against this schema.
+            changes (Mapping[str, Any]): The merge patch to apply.
+            abort_early (bool, optional): If True, validation stops on the first
+                error. If False, all errors are collected. Defaults to True.
+            path (str, optional): The current path in the data structure.
+                Defaults to "~".
+
+        Returns:
+            MutableMapping[str, Any]: The validated patched mapping.
+
+        Raises:
+            TypeError: If `changes` is not a mapping.
+            ValidationError: If the patched mapping or any changed field fails
+                validation, or a general "mapping" constraint error if multiple
+                errors are collected.
+        """
+        if not isinstance(changes, Mapping):
+            raise TypeError("changes must be a mapping")
+
+        patched = dict(previous)
+        errs: list[ValidationError] = []
+        expiry = budget_expiry()
+        for key, change in changes.items():
+            field_schema = self._fields.get(key)
+            if field_schema is None:
+                if change is None:
+                    patched.pop(key, None)
+                else:
+                    patched[key] = change
+                continue
+            path_ = concat_path(path, key)
+            if expiry is not None and monotonic() > expiry:
+                check_time_budget(path_)
+            try:
+                if change is None:
+                    patched[key] = field_schema.validate(
+                        _REQUIRED_UNDEFINED_, abort_early, path_
+                    )
+                else:
+                    patched[key] = revalidate_field(
+                        field_schema,
+                        previous.get(key, _REQUIRED_UNDEFINED_),
+                        change,
+                        abort_early,
+                        path_,
+                    )
+            except ValidationError as err:
+                if abort_early or budget_exceeded(err):
+                    raise
+                errs.append(err)
+                if errors_exceeded(path, len(errs)):
+                    break
+
+        if errs:
+            raise ValidationError(
+                Constraint("mapping", locale["mapping"]),
+                path,
+                errs,
+                invalid_value=patched,
+            )
+        return super().validate(patched, abort_early, path)
+
     def __getitem__(self, item: str) -> ISchema | ISchemaAdapter:
         """
         Allows accessing the schema definition for a specific field by its name.
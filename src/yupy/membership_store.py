@@ -0,0 +1,315 @@
+import hashlib
+import math
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Container, Iterable
+from mmap import ACCESS_READ, mmap
+from typing import Any
+
+from typing_extensions import Self
+
+__all__ = ("BloomFilterStore", "SortedArrayStore")
+
+_MAGIC = b"YUPYSET1"
+
+_HEADER = struct.Struct("<8sc7xQ")
+"""
+The header of a sorted store buffer: magic bytes, kind (b"q" for 64-bit
+integers, b"d" for 64-bit floats, b"s" for strings) and number of values.
+"""
+
+
+def _number_kind(values: list[Any]) -> bytes:
+    """
+    Picks the array kind able to hold all the given numbers exactly.
+
+    Args:
+        values (list[Any]): The numbers to store.
+
+    Returns:
+        bytes: b"q" if every value is an integer, otherwise b"d".
+
+    Raises:
+        TypeError: If a value is not a number.
+        ValueError: If an integer doesn't fit in 64 bits, or can't be stored
+            exactly as a float alongside float values.
+    """
+    kind = b"q"
+    for value in values:
+        if isinstance(value, float):
+            kind = b"d"
+        elif not isinstance(value, int):
+            raise TypeError(
+                f"store values must be all strings or all numbers, got {value!r}"
+            )
+        elif not -(2**63) <= value < 2**63:
+            raise ValueError(f"store integers must fit in 64 bits, got {value!r}")
+    if kind == b"d":
+        for value in values:
+            if not isinstance(value, float) and float(value) != value:
+                raise ValueError(
+                    f"store integer {value!r} can't be stored exactly with floats"
+                )
+    return kind
+
+
+class SortedArrayStore:
+    """
+    A compact, immutable set of strings or numbers kept as a sorted array and
+    queried with binary search.
+
+    Numbers are stored as a packed array of 64-bit integers (or floats if any
+    value is a float), strings as a single UTF-8 blob with an offset table.
+    The same layout can be written to disk with `save()` and memory-mapped
+    with `open()`, so worker processes share one copy of the store through
+    the page cache instead of each keeping a resident set.
+
+    A string store never contains numbers and a number store never contains
+    strings.
+    """
+
+    _buffer: Any
+    _kind: bytes
+    _count: int
+    _numbers: Any
+    _offsets: Any
+
+    def __init__(self, values: Iterable[str] | Iterable[int | float]):
+        """
+        Builds a store from the given values. Duplicates are removed.
+
+        Args:
+            values (Union[Iterable[str], Iterable[Union[int, float]]]): The
+                values to store, all strings or all numbers.
+
+        Raises:
+            TypeError: If the values mix strings and numbers or contain
+                anything else.
+            ValueError: If an integer can't be stored exactly (it doesn't fit
+                in 64 bits, or it exceeds float precision in a store holding
+                floats).
+        """
+        items: list[Any] = sorted(set(values))
+        if items and all(isinstance(item, str) for item in items):
+            encoded = [item.encode("utf-8", "surrogatepass") for item in items]
+            offsets = array("Q", [0])
+            for item in encoded:
+                offsets.append(offsets[-1] + len(item))
+            body = offsets.tobytes() + b"".join(encoded)
+            kind = b"s"
+        else:
+            kind = _number_kind(items)
+            body = array(kind.decode(), items).tobytes()
+        self._load(_HEADER.pack(_MAGIC, kind, len(items)) + body)
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> Self:
+        """
+        Memory-maps a store previously written with `save()`.
+
+        The file is mapped read-only; pages are loaded lazily by the operating
+        system and shared between all processes mapping the same file.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the store file.
+
+        Returns:
+            Self: The memory-mapped store.
+
+        Raises:
+            ValueError: If the file is not a valid store.
+        """
+        with open(path, "rb") as fp:
+            buffer = mmap(fp.fileno(), 0, access=ACCESS_READ)
+        store = cls.__new__(cls)
+        store._load(buffer)
+        return store
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Writes the store to a file that can be memory-mapped with `open()`.
+
+        Args:
+            path (Union[str, os.PathLike]): The destination path.
+        """
+        with open(path, "wb") as fp:
+            fp.write(self._buffer)
+
+    def _load(self, buffer: Any) -> None:
+        """
+        Internal method reading the header and the arrays of a store buffer.
+
+        Args:
+            buffer (Any): A `bytes` or `mmap` buffer holding the store.
+
+        Raises:
+            ValueError: If the buffer is not a valid store.
+        """
+        if len(buffer) < _HEADER.size:
+            raise ValueError("invalid store: truncated header")
+        magic, kind, count = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or kind not in (b"q", b"d", b"s"):
+            raise ValueError("invalid store: unknown format")
+        view = memoryview(buffer)[_HEADER.size :]
+        self._buffer = buffer
+        self._kind = kind
+        self._count = count
+        if kind == b"s":
+            self._offsets = view[: (count + 1) * 8].cast("Q")
+        else:
+            self._numbers = view[: count * 8].cast(kind.decode())
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, value: Any) -> bool:
+        if self._kind == b"s":
+            return isinstance(value, str) and self._contains_string(value)
+        if not isinstance(value, (int, float)) or (
+            isinstance(value, float) and math.isnan(value)
+        ):
+            return False
+        if self._kind == b"q" and isinstance(value, float):
+            if not value.is_integer():
+                return False
+            value = int(value)
+        numbers = self._numbers
+        i = bisect_left(numbers, value)
+        return i < self._count and numbers[i] == value
+
+    def _contains_string(self, value: str) -> bool:
+        """
+        Internal method looking a string up in the blob with binary search.
+
+        Args:
+            value (str): The string to look up.
+
+        Returns:
+            bool: True if the string is in the store.
+        """
+        key = value.encode("utf-8", "surrogatepass")
+        offsets = self._offsets
+        buffer = self._buffer
+        start = _HEADER.size + len(offsets) * 8
+
+        def item(i: int) -> bytes:
+            return buffer[start + offsets[i] : start + offsets[i + 1]]
+
+        i = bisect_left(range(self._count), key, key=item)
+        return i < self._count and item(i) == key
+
+
+def _bloom_key(value: Any) -> bytes | None:
+    """
+    Encodes a value for hashing into a Bloom filter.
+
+    Numbers that compare equal (e.g. `2` and `2.0`) get the same key.
+
+    Args:
+        value (Any): The value to encode.
+
+    Returns:
+        bytes | None: The key, or None if the value can't be a member.
+    """
+    if isinstance(value, str):
+        return b"s" + value.encode("utf-8", "surrogatepass")
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        if value.is_integer():
+            value = int(value)
+        else:
+            return b"n" + repr(value).encode()
+    if isinstance(value, int):
+        return b"n" + str(int(value)).encode()
+    return None
+
+
+class BloomFilterStore:
+    """
+    A Bloom filter placed in front of an exact store.
+
+    Values rejected by the filter are known not to be members without
+    touching the exact store; only values the filter may contain (every
+    member and about `error_rate` of the non-members) are looked up in it.
+    Paired with a memory-mapped `SortedArrayStore`, the resident memory is
+    about 10 bits per value (at a 1% error rate) and lookups of absent
+    values rarely touch the mapped file.
+    """
+
+    _exact: Container
+    _bits: bytearray
+    _size: int
+    _hashes: int
+
+    def __init__(
+        self,
+        values: Iterable[str] | Iterable[int | float],
+        exact: Container | None = None,
+        error_rate: float = 0.01,
+    ):
+        """
+        Builds the filter from the given values.
+
+        Args:
+            values (Union[Iterable[str], Iterable[Union[int, float]]]): The
+                members of the set.
+            exact (Container | None, optional): The exact store consulted when
+                the filter may contain a value. Defaults to a `SortedArrayStore`
+                built from `values`.
+            error_rate (float, optional): The target false positive rate of
+                the filter. Defaults to 0.01.
+
+        Raises:
+            ValueError: If `error_rate` is not between 0 and 1.
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        items: list[Any] = list(values)
+        self._exact = SortedArrayStore(items) if exact is None else exact
+        count = max(len(items), 1)
+        self._size = max(8, math.ceil(-count * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / count * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        for item in items:
+            key = _bloom_key(item)
+            if key is not None:
+                for bit in self._positions(key):
+                    self._bits[bit >> 3] |= 1 << (bit & 7)
+
+    def _positions(self, key: bytes) -> Iterable[int]:
+        """
+        Internal method computing the filter bits of a key with double hashing.
+
+        Args:
+            key (bytes): The encoded value.
+
+        Returns:
+            Iterable[int]: The bit positions.
+        """
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self._size
+        return ((h1 + i * h2) % size for i in range(self._hashes))
+
+    def might_contain(self, value: Any) -> bool:
+        """
+        Checks the filter only.
+
+        Args:
+            value (Any): The value to check.
+
+        Returns:
+            bool: False if the value is certainly not a member, True if it may be.
+        """
+        key = _bloom_key(value)
+        if key is None:
+            return False
+        bits = self._bits
+        return all(bits[bit >> 3] >> (bit & 7) & 1 for bit in self._positions(key))
+
+    def __contains__(self, value: Any) -> bool:
+        return self.might_contain(value) and value in self._exact
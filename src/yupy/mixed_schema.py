@@ -1,5 +1,6 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import Any
 
 from typing_extensions import Self
@@ -7,11 +8,33 @@ from typing_extensions import Self
 from yupy.icomparable_schema import EqualityComparableSchema
 from yupy.ischema import _SchemaExpectedType
 from yupy.locale import ErrorMessage, locale
+from yupy.schema import _describe, _pure
 from yupy.validation_error import Constraint, ValidationError
 
 __all__ = ("MixedSchema",)
 
 
+def _hash_index(items: Iterable) -> tuple[frozenset, list]:
+    """
+    Splits items into a hash index of the hashable ones and a list of the
+    remaining unhashable ones.
+
+    Args:
+        items (Iterable): The items to index.
+
+    Returns:
+        tuple[frozenset, list]: The hashable items and the unhashable items.
+    """
+    index = set()
+    rest = []
+    for item in items:
+        try:
+            index.add(item)
+        except TypeError:
+            rest.append(item)
+    return frozenset(index), rest
+
+
 @dataclass
 class MixedSchema(EqualityComparableSchema):
     """
@@ -54,12 +77,16 @@ class MixedSchema(EqualityComparableSchema):
                     Constraint("type", message, type_, type(x)), invalid_value=x
                 )
 
-        return self.test(_)
+        return self.test(_pure(_))
 
     def one_of(self, items: Iterable, message: ErrorMessage = locale["one_of"]) -> Self:
         """
         Adds a validation rule to check if the value is one of the provided items.
 
+        Hashable items are indexed in a frozenset when the rule is defined, so
+        the check is a single hash lookup whatever the number of items.
+        Unhashable items and values fall back to a linear comparison.
+
         Args:
             items (Iterable): An iterable (e.g., list, tuple, set) containing
                 the allowed values.
@@ -69,11 +96,72 @@ class MixedSchema(EqualityComparableSchema):
         Returns:
             Self: The schema instance, allowing for method chaining.
         """
+        if isinstance(items, Iterator):
+            items = list(items)
+        index, rest = _hash_index(items)
 
         def _(x: Any) -> None:
-            if x not in items:
+            try:
+                if x in index:
+                    return
+            except TypeError:
+                # Unhashable values are compared against every item
+                if x in items:
+                    return
+            else:
+                if rest and x in rest:
+                    return
+            raise ValidationError(Constraint("one_of", message, items), invalid_value=x)
+
+        return self.test(_describe(_, "one_of", message, items))
+
+    def literal(
+        self,
+        values: type[Enum] | Mapping[Any, Any] | Iterable,
+        message: ErrorMessage = locale["one_of"],
+    ) -> Self:
+        """
+        Restricts the value to a set of literals and maps it to its canonical
+        form through a dictionary built once, when the rule is defined.
+
+        - An `enum.Enum` class accepts the values of its members (and the
+          members themselves) and maps them to the members.
+        - A mapping accepts its keys and maps them to the associated values.
+        - Any other iterable accepts its items and leaves them unchanged.
+
+        The mapping is applied as a transformation, so the validated value is
+        the mapped one and subsequent tests see it.
+
+        Args:
+            values (Union[type[Enum], Mapping, Iterable]): The accepted literals.
+                All of them must be hashable.
+            message (ErrorMessage): The error message to use if the value is
+                not an accepted literal. Defaults to the locale-defined message
+                for "one_of".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            TypeError: If a literal is not hashable.
+        """
+        if isinstance(values, type) and issubclass(values, Enum):
+            accepted = [member.value for member in values]
+            lookup = {member.value: member for member in values}
+            lookup.update({member: member for member in values})
+        elif isinstance(values, Mapping):
+            accepted = list(values)
+            lookup = dict(values)
+        else:
+            accepted = list(values)
+            lookup = {item: item for item in accepted}
+
+        def _(x: Any) -> Any:
+            try:
+                return lookup[x]
+            except (KeyError, TypeError):
                 raise ValidationError(
-                    Constraint("one_of", message, items), invalid_value=x
-                )
+                    Constraint("one_of", message, accepted), invalid_value=x
+                ) from None
 
-        return self.test(_)
+        return self.transform(_describe(_, "one_of", message, accepted))
@@ -5,8 +5,11 @@ from typing import Literal, TypeAlias
 from typing_extensions import Self
 
 from yupy.icomparable_schema import ComparableSchema, EqualityComparableSchema
+from yupy.imembership_schema import MembershipSchema
+from yupy.imemo_schema import MemoSchema
 from yupy.ischema import _SchemaExpectedType
 from yupy.locale import ErrorMessage, locale
+from yupy.schema import _describe
 from yupy.validation_error import Constraint, ValidationError
 
 __all__ = ("NumberSchema",)
@@ -17,7 +20,9 @@ RoundingMethod = Literal["ceil", "floor", "round", "trunc"]
 
 
 @dataclass
-class NumberSchema(ComparableSchema, EqualityComparableSchema):
+class NumberSchema(
+    ComparableSchema, EqualityComparableSchema, MembershipSchema, MemoSchema
+):
     """
     A schema for validating numerical values (integers and floats).
 
@@ -25,7 +30,9 @@ class NumberSchema(ComparableSchema, EqualityComparableSchema):
     integer-only values, and divisibility by a multiplier.
 
     Inherits from `ComparableSchema` for comparison operations (le, ge, lt, gt)
-    and `EqualityComparableSchema` for equality operations (eq, ne).
+    `EqualityComparableSchema` for equality operations (eq, ne),
+    `MembershipSchema` for allowlists and denylists (member_of, not_member_of)
+    and `MemoSchema` for caching validation results (memoize).
 
     Attributes:
         _type (_SchemaExpectedType): The expected Python type(s) for the schema's value.
@@ -80,7 +87,7 @@ class NumberSchema(ComparableSchema, EqualityComparableSchema):
             if (x % 1) != 0:
                 raise ValidationError(Constraint("integer", message), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "integer", message))
 
     def truncate(self) -> Self:
         """
@@ -91,9 +98,8 @@ class NumberSchema(ComparableSchema, EqualityComparableSchema):
         Returns:
             Self: The schema instance, allowing for method chaining.
         """
-        # Directly append math.trunc as it matches the TransformFunc signature
-        self._transforms.append(math.trunc)
-        return self
+        # math.trunc matches the TransformFunc signature
+        return self.transform(math.trunc)
 
     def round(self, method: RoundingMethod = "round") -> Self:
         """
@@ -120,16 +126,16 @@ class NumberSchema(ComparableSchema, EqualityComparableSchema):
             "trunc",
         ]  # Define valid methods for the error message
 
-        # Use match statement to directly append the appropriate function
+        # Use match statement to add the appropriate function
         match method:
             case "round":
-                self._transforms.append(round)
+                self.transform(round)
             case "ceil":
-                self._transforms.append(math.ceil)
+                self.transform(math.ceil)
             case "floor":
-                self._transforms.append(math.floor)
+                self.transform(math.floor)
             case "trunc":
-                self._transforms.append(math.trunc)
+                self.transform(math.trunc)
             case _:  # Default case for unsupported methods
                 raise ValueError(f"round method should be one of {valid_methods}")
 
@@ -159,4 +165,4 @@ class NumberSchema(ComparableSchema, EqualityComparableSchema):
                     Constraint("multiple_of", message, multiplier), invalid_value=x
                 )
 
-        return self.test(_)
+        return self.test(_describe(_, "multiple_of", message, multiplier))
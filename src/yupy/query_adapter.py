@@ -0,0 +1,245 @@
+import re
+from collections.abc import Callable
+from typing import Any, TypeAlias
+from urllib.parse import unquote_plus
+
+from yupy.adapters import ISchemaAdapter, SchemaAdapter
+from yupy.array_schema import ArraySchema
+from yupy.ischema import ISchema
+from yupy.locale import ErrorMessage, locale
+from yupy.mapping_schema import MappingSchema
+from yupy.number_schema import NumberSchema
+from yupy.util.unwrap import unwrap
+from yupy.validation_error import Constraint, ValidationError
+
+__all__ = ("SchemaQueryAdapter",)
+
+_Coerce: TypeAlias = Callable[[str], Any]
+"""
+Type alias for a function that converts a single decoded query value.
+"""
+
+_FieldPlan: TypeAlias = tuple[bool, _Coerce | None]
+"""
+Type alias for the per-field parsing plan: whether the field collects every
+occurrence of the key into a list, and the coercion to apply to each value.
+"""
+
+
+_INTEGER = re.compile(r"[+-]?[0-9]+")
+"""
+Regular expression for query values converted to `int`.
+"""
+
+_DECIMAL = re.compile(r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+"""
+Regular expression for query values converted to `float`: plain decimal
+notation only, so "nan", "inf", "1_000" and padded values stay strings.
+"""
+
+
+def _to_number(raw: str) -> Any:
+    """
+    Converts a query value to `int` or `float`.
+
+    If the value is not numeric it is returned unchanged, so the wrapped
+    `NumberSchema` reports the usual "type" error for it.
+
+    Args:
+        raw (str): The decoded query value.
+
+    Returns:
+        Any: The parsed number, or `raw` if it can't be parsed.
+    """
+    if _INTEGER.fullmatch(raw):
+        return int(raw)
+    if _DECIMAL.fullmatch(raw):
+        return float(raw)
+    return raw
+
+
+def _coercion_for(schema: ISchema | ISchemaAdapter | None) -> _Coerce | None:
+    """
+    Picks the coercion for values validated by `schema`.
+
+    Args:
+        schema (Union[ISchema, ISchemaAdapter, None]): The schema the value
+            will be validated against.
+
+    Returns:
+        _Coerce | None: `_to_number` for number schemas, otherwise None
+            (the value stays a string).
+    """
+    if schema is not None and isinstance(unwrap(schema), NumberSchema):
+        return _to_number
+    return None
+
+
+def _plan_for(schema: ISchema | ISchemaAdapter) -> _FieldPlan:
+    """
+    Builds the parsing plan for a single mapping field.
+
+    Args:
+        schema (Union[ISchema, ISchemaAdapter]): The field schema.
+
+    Returns:
+        _FieldPlan: The `(is_list, coerce)` pair for the field.
+    """
+    inner = unwrap(schema)
+    if isinstance(inner, ArraySchema):
+        return True, _coercion_for(inner._of_schema_type)
+    return False, _coercion_for(inner)
+
+
+class SchemaQueryAdapter(SchemaAdapter):
+    """
+    An adapter that parses a raw query string (or an
+    `application/x-www-form-urlencoded` body) straight into the shape of the
+    wrapped `MappingSchema` and then validates the result.
+
+    The input is split only once; each value is decoded and coerced according
+    to the schema of the field it belongs to:
+
+    - fields backed by an `ArraySchema` receive a list of every occurrence of
+      the key, with items coerced according to the array's `of()` schema;
+    - fields backed by a `NumberSchema` receive an `int` or a `float`;
+    - any other field (and keys unknown to the shape) receive the last
+      occurrence of the key as a string.
+
+    Adapters wrapping field schemas (e.g. `required`, `default`) are looked
+    through when choosing the coercion.
+
+    Attributes:
+        _separator (str): The separator between `key=value` pairs.
+        _keep_blank_values (bool): If True, keys with empty values are kept as
+            empty strings instead of being dropped.
+        _plan (dict[str, _FieldPlan]): The precomputed per-field parsing plan.
+    """
+
+    _separator: str
+    _keep_blank_values: bool
+    _plan: dict[str, _FieldPlan]
+
+    def __init__(
+        self,
+        schema: ISchema | ISchemaAdapter,
+        message: ErrorMessage = locale["query"],
+        *,
+        separator: str = "&",
+        keep_blank_values: bool = False,
+    ):
+        """
+        Initializes a new SchemaQueryAdapter instance.
+
+        Args:
+            schema (Union[ISchema, ISchemaAdapter]): The mapping schema to wrap,
+                optionally wrapped in other adapters.
+            message (ErrorMessage, optional): The error message to use if the
+                input is not a string or a byte-like object. Defaults to the
+                locale-defined message for "query".
+            separator (str, optional): The separator between `key=value` pairs.
+                Defaults to "&".
+            keep_blank_values (bool, optional): If True, blank values are kept
+                as empty strings, mirroring `urllib.parse.parse_qs`. Defaults to False.
+
+        Raises:
+            TypeError: If the wrapped schema is not a `MappingSchema`.
+        """
+        super().__init__(schema, message)
+        inner = unwrap(schema)
+        if not isinstance(inner, MappingSchema):
+            raise TypeError("schema must be an instance of MappingSchema")
+        self._separator = separator
+        self._keep_blank_values = keep_blank_values
+        self._plan = {key: _plan_for(s) for key, s in inner._fields.items()}
+
+    def parse(self, query: str | bytes | bytearray | memoryview) -> dict[str, Any]:
+        """
+        Splits and decodes a query string into a dictionary shaped for the
+        wrapped schema, without validating it.
+
+        Args:
+            query (Union[str, bytes]): The raw query string or byte-like object, with or without
+                a leading "?".
+
+        Returns:
+            dict[str, Any]: The decoded and coerced values keyed by field name.
+
+        Raises:
+            ValidationError: If the query (or a percent-encoded key or value)
+                is not valid UTF-8.
+        """
+        try:
+            return self._parse(query)
+        except UnicodeDecodeError:
+            raise ValidationError(
+                Constraint("query", self._message), invalid_value=query
+            ) from None
+
+    def _parse(self, query: str | bytes | bytearray | memoryview) -> dict[str, Any]:
+        """
+        Internal method splitting and decoding a query string, see `parse()`.
+
+        Raises:
+            UnicodeDecodeError: If the query is not valid UTF-8.
+        """
+        if isinstance(query, (bytes, bytearray, memoryview)):
+            query = bytes(query).decode("utf-8")
+        query = query.removeprefix("?")
+
+        plan = self._plan
+        keep_blank = self._keep_blank_values
+        result: dict[str, Any] = {}
+        for pair in query.split(self._separator):
+            if not pair:
+                continue
+            key, _, raw = pair.partition("=")
+            if not raw and not keep_blank:
+                continue
+            if "%" in key or "+" in key:
+                key = unquote_plus(key, errors="strict")
+            if "%" in raw or "+" in raw:
+                raw = unquote_plus(raw, errors="strict")
+
+            is_list, coerce = plan.get(key, (False, None))
+            item = raw if coerce is None else coerce(raw)
+            if is_list:
+                result.setdefault(key, []).append(item)
+            else:
+                result[key] = item
+        return result
+
+    def validate(
+        self, value: Any = None, abort_early: bool = True, path: str = "~"
+    ) -> Any:
+        """
+        Parses the query string and validates the result against the wrapped schema.
+
+        A `None` value is passed to the wrapped schema unchanged, so its
+        nullability rules apply.
+
+        Args:
+            value (Any, optional): The raw query string or byte-like object.
+                Defaults to None.
+            abort_early (bool, optional): If True, validation stops on the first
+                error. If False, all errors are collected. Defaults to True.
+            path (str, optional): The current path in the data structure, used
+                for more informative error messages. Defaults to "~".
+
+        Returns:
+            Any: The parsed mapping after validation by the wrapped schema.
+
+        Raises:
+            ValidationError: If `value` is not a string or byte-like object,
+                is not valid UTF-8, or if the parsed mapping fails validation.
+        """
+        if value is not None:
+            if not isinstance(value, (str, bytes, bytearray, memoryview)):
+                raise ValidationError(
+                    Constraint("query", self._message), path, invalid_value=value
+                )
+            try:
+                value = self.parse(value)
+            except ValidationError as err:
+                raise ValidationError(err.constraint, path, invalid_value=value)
+        return self._schema.validate(value, abort_early, path)
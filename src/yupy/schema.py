@@ -1,15 +1,314 @@
+import math
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from typing import Any
+from functools import wraps
+from typing import Any, TypeVar
 
 from typing_extensions import Self
 
 from yupy.adapters import _REQUIRED_UNDEFINED_
 from yupy.ischema import TransformFunc, ValidatorFunc, _SchemaExpectedType
 from yupy.locale import ErrorMessage, locale
+from yupy.util.cache import LRUCache
+from yupy.util.fingerprint import fingerprint
+from yupy.util.revision import rules_changed
+from yupy.util.time_budget import budget_exceeded
 from yupy.validation_error import Constraint, ValidationError
 
 __all__ = ("Schema",)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _describe(func: _F, type_: str, message: ErrorMessage, *args: Any) -> _F:
+    """
+    Records on a built-in validator the constraint it enforces.
+
+    Validators stay plain callables; the attached `Constraint` lets other
+    parts of the library (e.g. stream validation) recognise built-in checks
+    and reproduce them without calling the validator.
+
+    Args:
+        func (_F): The validator to describe.
+        type_ (str): The constraint type (e.g. "min", "matches").
+        message (ErrorMessage): The error message used by the validator.
+        *args (Any): The constraint parameters (e.g. the limit).
+
+    Returns:
+        _F: The same validator.
+    """
+    func.constraint = Constraint(type_, message, *args)  # type: ignore[attr-defined]
+    return func
+
+
+def _constraint_of(func: Callable[..., Any]) -> Constraint | None:
+    """
+    Returns the constraint recorded on a built-in validator by `_describe`.
+
+    Args:
+        func (Callable[..., Any]): The validator to inspect.
+
+    Returns:
+        Constraint | None: The recorded constraint, or None for user-defined
+            validators.
+    """
+    return getattr(func, "constraint", None)
+
+
+_PURE_BUILTINS = frozenset((round, math.ceil, math.floor, math.trunc))
+"""
+Built-in functions used as transforms that are known to be pure. They can't
+carry the `pure` attribute set by `_pure`.
+"""
+
+
+def _pure(func: _F) -> _F:
+    """
+    Marks a built-in validator or transform as pure: deterministic and free
+    of side effects, so its outcome for a value can be cached.
+
+    Args:
+        func (_F): The validator or transform to mark.
+
+    Returns:
+        _F: The same function.
+    """
+    func.pure = True  # type: ignore[attr-defined]
+    return func
+
+
+def _is_pure(func: Callable[..., Any]) -> bool:
+    """
+    Checks whether a validator or transform is known to be pure.
+
+    Functions marked with `_pure` and validators described with `_describe`
+    are pure, unless their `pure` attribute was set to False (e.g. a
+    membership rule over a mutable store); user-defined callables are not.
+
+    Args:
+        func (Callable[..., Any]): The validator or transform to inspect.
+
+    Returns:
+        bool: True if the function is known to be pure.
+    """
+    pure = getattr(func, "pure", None)
+    if pure is not None:
+        return bool(pure)
+    if _constraint_of(func) is not None:
+        return True
+    return isinstance(func, type(round)) and func in _PURE_BUILTINS
+
+
+def _same_rule(first: Constraint, second: Constraint) -> bool:
+    """
+    Checks whether two recorded constraints enforce the same rule.
+
+    Args:
+        first (Constraint): A recorded constraint.
+        second (Constraint): Another recorded constraint.
+
+    Returns:
+        bool: True if both have the same type and parameters.
+    """
+    try:
+        return first.type == second.type and bool(first.args == second.args)
+    except (TypeError, ValueError):
+        return False
+
+
+def _comparable_limit(limit: Any) -> bool:
+    """
+    Checks whether a rule limit can be ordered against other limits, i.e. it
+    compares equal to itself (NaN doesn't, and a rule over it never fails).
+
+    Args:
+        limit (Any): The limit of a bound or size rule.
+
+    Returns:
+        bool: True if the limit can be compared.
+    """
+    try:
+        return bool(limit == limit)  # noqa: PLR0124
+    except (TypeError, ValueError):
+        return False
+
+
+def _same_message(first: Constraint, second: Constraint) -> bool:
+    """
+    Checks whether a rule can report its errors with the message of another
+    one: both messages are the same, or both are the locale defaults.
+
+    Args:
+        first (Constraint): A recorded constraint.
+        second (Constraint): Another recorded constraint.
+
+    Returns:
+        bool: True if replacing one rule by the other keeps the user's messages.
+    """
+    if first.message == second.message:
+        return True
+    return _is_default_message(first) and _is_default_message(second)
+
+
+# `positive()` and `negative()` are `gt(0)` and `lt(0)` with their own default messages
+_DEFAULT_MESSAGE_KEYS: dict[str, tuple[str, ...]] = {
+    "gt": ("gt", "positive"),
+    "lt": ("lt", "negative"),
+}
+
+
+def _is_default_message(constraint: Constraint) -> bool:
+    """
+    Checks whether a recorded constraint reports its errors with a locale
+    default message.
+
+    Args:
+        constraint (Constraint): A recorded constraint.
+
+    Returns:
+        bool: True if the message is one of the defaults for the rule type.
+    """
+    defaults: Mapping[str, object] = locale
+    kind = constraint.type or ""
+    return any(
+        constraint.message == defaults.get(key)
+        for key in _DEFAULT_MESSAGE_KEYS.get(kind, (kind,))
+    )
+
+
+def _rule_repr(constraint: Constraint) -> str:
+    """
+    Formats a recorded constraint the way the rule was defined, e.g. "min(3)".
+
+    Args:
+        constraint (Constraint): The recorded constraint.
+
+    Returns:
+        str: The rule name and its parameters.
+    """
+    return f"{constraint.type}({', '.join(map(repr, constraint.args))})"
+
+
+def _optimize_nested(schema: Any, path: str) -> None:
+    """
+    Optimizes a nested schema or adapter, if it supports `optimize()`.
+
+    Args:
+        schema (Any): The nested schema or adapter.
+        path (str): The path of the nested schema.
+
+    Raises:
+        ValueError: If the rules of the nested schema contradict each other.
+    """
+    optimize = getattr(schema, "optimize", None)
+    if optimize is not None:
+        optimize(path)
+
+
+_MISSING = object()
+
+_DEFAULT_COST = 1.0
+"""
+The relative cost of validators added without an explicit cost.
+"""
+
+
+def _cost_of(func: Callable[..., Any]) -> float:
+    """
+    Returns the relative cost of a validator, as given to `Schema.test()`.
+
+    Args:
+        func (Callable[..., Any]): The validator to inspect.
+
+    Returns:
+        float: The cost of the validator, `_DEFAULT_COST` if none was given.
+    """
+    return getattr(func, "cost", _DEFAULT_COST)
+
+
+def _annotate(func: _F, pure: bool, cost: float | None) -> _F:
+    """
+    Wraps a user-defined validator or transform to record its purity and cost.
+
+    The callable is wrapped rather than modified, so the same function can be
+    added to other schemas with other annotations.
+
+    Args:
+        func (_F): The validator or transform.
+        pure (bool): Whether the function is pure.
+        cost (float | None): The relative cost of the validator, if any.
+
+    Returns:
+        _F: The annotated wrapper.
+    """
+
+    @wraps(func)
+    def _(x: Any) -> Any:
+        return func(x)
+
+    _.pure = pure  # type: ignore[attr-defined]
+    if cost is not None:
+        _.cost = cost  # type: ignore[attr-defined]
+    return _  # type: ignore[return-value]
+
+
+def _value_key(value: Any) -> Any:
+    """
+    Returns the key under which the outcome of validating a value is cached.
+
+    Equal values of different types (`1`, `1.0` and `True`), including inside
+    tuples, and the two zeros `0.0` and `-0.0` get different keys, since
+    validators and transforms may tell them apart.
+
+    Args:
+        value (Any): The validated value.
+
+    Returns:
+        Any: The cache key; hashing it raises `TypeError` if the value is unhashable.
+    """
+    if type(value) is float:
+        return (float, value, math.copysign(1.0, value))
+    if type(value) is tuple:
+        return (tuple, tuple(map(_value_key, value)))
+    return (type(value), value)
+
+
+def _cached(func: _F, cache: LRUCache) -> _F:
+    """
+    Wraps a user-defined validator to cache its outcome by value.
+
+    The outcome (pass, or the failed constraint) is cached under
+    `_value_key(value)`; unhashable values are always validated.
+
+    Args:
+        func (_F): The validator.
+        cache (LRUCache): The cache of outcomes, dedicated to this validator.
+
+    Returns:
+        _F: The caching wrapper.
+    """
+
+    @wraps(func)
+    def _(x: Any) -> None:
+        key = _value_key(x)
+        try:
+            outcome = cache.get(key, _MISSING)
+        except TypeError:
+            func(x)
+            return
+        if outcome is _MISSING:
+            try:
+                func(x)
+            except ValidationError as err:
+                if not budget_exceeded(err):
+                    cache.put(key, err.constraint)
+                raise
+            cache.put(key, None)
+        elif outcome is not None:
+            raise ValidationError(outcome, invalid_value=x)
+
+    return _  # type: ignore[return-value]
+
 
 @dataclass
 class Schema:
@@ -38,6 +337,9 @@ class Schema:
             Defaults to `False`.
         _not_nullable (ErrorMessage): The error message to use when a non-nullable
             field receives `None`. Defaults to the locale-defined message for "not_nullable".
+        _revision (int): Counts the changes made to the rules by `test()`,
+            `transform()` and `optimize()`, so caches of validation results
+            can tell when they are stale.
     """
 
     message: ErrorMessage = field(default=locale["type"])
@@ -46,6 +348,7 @@ class Schema:
     _validators: list[ValidatorFunc] = field(init=False, default_factory=list)
     _nullability: bool = False
     _not_nullable: ErrorMessage = locale["not_nullable"]
+    _revision: int = field(init=False, default=0, repr=False, compare=False)
 
     @property
     def nullability(self) -> bool:
@@ -121,7 +424,7 @@ class Schema:
                 invalid_value=value,
             )
 
-    def transform(self, func: TransformFunc) -> Self:
+    def transform(self, func: TransformFunc, pure: bool = False) -> Self:
         """
         Adds a transformation function to be applied to the value before validation.
 
@@ -131,12 +434,17 @@ class Schema:
         Args:
             func (TransformFunc): A callable that takes one argument (the value)
                 and returns the transformed value.
+            pure (bool): Declares the function deterministic and free of side
+                effects, so its results can be cached (see `MemoSchema`).
+                Defaults to False.
 
         Returns:
             Self: The schema instance, allowing for method chaining.
         """
         self._transforms: list[TransformFunc]
-        self._transforms.append(func)
+        self._transforms.append(_annotate(func, True, None) if pure else func)
+        self._revision += 1
+        rules_changed()
         return self
 
     def _transform(self, value: Any) -> Any:
@@ -154,22 +462,57 @@ class Schema:
             transformed = t(transformed)
         return transformed
 
-    def test(self, func: ValidatorFunc) -> Self:
+    def test(
+        self,
+        func: ValidatorFunc,
+        pure: bool = False,
+        cost: float | None = None,
+        cache: LRUCache | None = None,
+    ) -> Self:
         """
         Adds a custom validation test function to the schema.
 
         Test functions perform additional validation logic and should raise
         a `ValidationError` if the value is invalid. These tests are run
-        after transformations and type checks.
+        after transformations and type checks, in the order they were added,
+        except that a test given a `cost` is deferred past tests added after
+        it with a lower cost (tests without one count as 1). Tests never
+        move ahead of built-in rules or of tests without a `cost` added
+        before them, so those can guard the tests that follow.
 
         Args:
             func (ValidatorFunc): A callable that takes one argument (the value)
                 and performs validation. It should raise `ValidationError` on failure.
+            pure (bool): Declares the function deterministic and free of side
+                effects, so its results can be cached (see `MemoSchema`).
+                Defaults to False.
+            cost (float | None): The relative cost of the test, used to run
+                expensive tests after cheaper ones added later. Defaults to
+                None (keeps the test in place).
+            cache (LRUCache | None): A cache (e.g. a `TTLCache`) dedicated to
+                this test, keeping its outcome (pass, or the failed constraint)
+                per value so repeated values skip it. Defaults to None.
 
         Returns:
             Self: The schema instance, allowing for method chaining.
         """
-        self._validators.append(func)
+        if cache is not None:
+            func = _cached(func, cache)
+        if pure or cost is not None:
+            func = _annotate(func, pure, cost)
+        # only tests added with a costlier `cost` are moved back; built-in
+        # rules and tests without a cost may guard the ones added after them
+        validators = self._validators
+        cost = _cost_of(func)
+        index = len(validators)
+        while (
+            index
+            and hasattr(validators[index - 1], "cost")
+            and _cost_of(validators[index - 1]) > cost
+        ):
+            index -= 1
+        validators.insert(index, func)
+        self._revision += 1
         return self
 
     def validate(
@@ -219,6 +562,132 @@ class Schema:
         except ValidationError as err:
             raise ValidationError(err.constraint, path, invalid_value=value)
 
+    def optimize(self, path: str = "~") -> Self:
+        """
+        Simplifies the built-in rules of the schema without changing the
+        values it accepts, and checks that they can be satisfied.
+
+        Duplicate rules are removed; schemas with bounds or sizes also merge
+        them (see `ComparableSchema` and `SizedSchema`), and container schemas
+        optimize their nested schemas. Custom tests are never touched, and
+        a rule is only merged into a later one if no custom test runs between
+        them and their messages are the same (or both the defaults).
+
+        Args:
+            path (str): The path of the schema, used in error messages.
+                Defaults to "~".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            ValueError: If the rules contradict each other, so that no value
+                but None can be valid.
+        """
+        # subclasses change the rules further once this returns
+        self._revision += 1
+        seen: list[Constraint] = []
+        validators: list[ValidatorFunc] = []
+        for func in self._validators:
+            constraint = _constraint_of(func)
+            if constraint is not None:
+                if any(_same_rule(constraint, rule) for rule in seen):
+                    continue
+                seen.append(constraint)
+            validators.append(func)
+        self._validators = validators
+        return self
+
+    def _can_replace(self, earlier: int, later: int) -> bool:
+        """
+        Internal method checking whether the validator at index `earlier` can
+        be dropped in favor of the stricter one at index `later`: only
+        built-in rules run between them (so no custom test relies on the
+        earlier one), and the later one reports errors with the same message.
+
+        Args:
+            earlier (int): The index of the validator to drop.
+            later (int): The index of the validator replacing it.
+
+        Returns:
+            bool: True if the earlier validator can be dropped.
+        """
+        validators = self._validators
+        first = _constraint_of(validators[earlier])
+        second = _constraint_of(validators[later])
+        if first is None or second is None or not _same_message(first, second):
+            return False
+        return all(
+            _constraint_of(func) is not None for func in validators[earlier + 1 : later]
+        )
+
+    def _keep_tightest(
+        self, kinds: dict[str, int], lower: bool
+    ) -> tuple[ValidatorFunc, Constraint, int] | None:
+        """
+        Internal method dropping the bound rules of the given kinds made
+        redundant by a tighter one, e.g. `ge(0)` out of `ge(0).ge(5)`.
+
+        A bound following a tighter one never fails and is always dropped. A
+        bound followed by a tighter one is only dropped if `_can_replace()`
+        allows it, so bounds guarding a custom test and custom messages are
+        kept. Bounds over limits that can't be compared (e.g. NaN) are kept.
+
+        Args:
+            kinds (dict[str, int]): The constraint types of the bounds, with
+                their strictness: 1 for a strict lower bound, -1 for a strict
+                upper bound, 0 for an inclusive one.
+            lower (bool): True for lower bounds, False for upper bounds.
+
+        Returns:
+            tuple[ValidatorFunc, Constraint, int] | None: The tightest rule,
+                its constraint and strictness, or None if there is no such rule
+                or the limits can't be compared.
+        """
+        best: tuple[int, Constraint, int] | None = None
+        dropped: set[int] = set()
+        for i, func in enumerate(self._validators):
+            constraint = _constraint_of(func)
+            if constraint is None or constraint.type not in kinds:
+                continue
+            limit = constraint.args[0]
+            if not _comparable_limit(limit):
+                continue
+            # recorded constraints always have a type
+            rule = (i, constraint, kinds[constraint.type])  # type: ignore[index]
+            if best is None:
+                best = rule
+                continue
+            try:
+                tighter = (best[1].args[0], best[2]) >= (limit, rule[2])
+                looser = (best[1].args[0], best[2]) <= (limit, rule[2])
+            except TypeError:
+                return None
+            if tighter if lower else looser:
+                dropped.add(i)
+                continue
+            if self._can_replace(best[0], i):
+                dropped.add(best[0])
+            best = rule
+        if best is None:
+            return None
+        kept = (self._validators[best[0]], best[1], best[2])
+        self._validators = [
+            func for i, func in enumerate(self._validators) if i not in dropped
+        ]
+        return kept
+
+    def fingerprint(self) -> str:
+        """
+        Returns a structural fingerprint of the schema: schemas built with
+        the same rules, options and nested schemas share it, across processes
+        running the same code.
+
+        Returns:
+            str: The fingerprint, as 32 hexadecimal digits.
+        """
+        return fingerprint(self)
+
     def const(
         self,
         value: _SchemaExpectedType | None,
@@ -243,4 +712,4 @@ class Schema:
                     Constraint("const", message, value), invalid_value=x
                 )
 
-        return self.test(_)
+        return self.test(_describe(_, "const", message, value))
@@ -0,0 +1,320 @@
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from threading import Lock
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any, NamedTuple
+
+from yupy.adapters import ISchemaAdapter
+from yupy.ischema import ISchema
+
+__all__ = ("RegistryInfo", "SchemaRegistry")
+
+SchemaFactory = Callable[[], ISchema | ISchemaAdapter]
+"""
+Type alias for a schema definition: a callable building the schema.
+"""
+
+_LATEST: Any = object()
+"""
+Default version of lookups, standing for the most recently registered
+version. None is a valid version of its own.
+"""
+
+_EXTERNAL = (type, ModuleType, BuiltinFunctionType)
+"""
+Objects a schema references but shares with every other schema, not counted
+by `_footprint()`.
+"""
+
+
+def _footprint(schema: Any) -> int:
+    """
+    Estimates the memory held by a schema: the sizes of the objects reachable
+    from it through attributes, containers and validator closures.
+
+    Classes, modules and builtins are shared with every other schema and
+    aren't counted.
+
+    Args:
+        schema (Any): The schema to measure.
+
+    Returns:
+        int: The approximate size of the schema, in bytes.
+    """
+    seen: set[int] = set()
+    pending = [schema]
+    size = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, _EXTERNAL):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        elif isinstance(obj, FunctionType):
+            pending.extend(cell.cell_contents for cell in obj.__closure__ or ())
+            pending.append(obj.__dict__)
+        else:
+            state = getattr(obj, "__dict__", None)
+            if state is not None:
+                pending.append(state)
+    return size
+
+
+class RegistryInfo(NamedTuple):
+    """
+    Statistics of a schema registry's plan cache.
+    """
+
+    hits: int
+    misses: int
+    registered: int
+    currsize: int
+    nbytes: int
+
+
+class SchemaRegistry:
+    """
+    A thread-safe store of schema definitions by id and version, building
+    each schema on first use and keeping the built schemas (their validation
+    plans) in a bounded LRU cache.
+
+    Definitions are callables returning a schema, so registering thousands of
+    schemas (e.g. per-tenant schemas loaded from config) costs nothing until
+    they are used. Built schemas are evicted, least recently used first, when
+    the cache holds more than `maxsize` schemas or more than `max_bytes`
+    bytes (as estimated by walking each schema when it is built), and are
+    rebuilt by their definition when used again.
+
+    Attributes:
+        maxsize (int): The maximum number of built schemas kept.
+        max_bytes (int | None): The maximum estimated size of the built
+            schemas kept, or None for no limit.
+        hits (int): The number of lookups that found a built schema.
+        misses (int): The number of lookups that built the schema.
+    """
+
+    maxsize: int
+    max_bytes: int | None
+    hits: int
+    misses: int
+    _definitions: dict[tuple[str, Hashable], SchemaFactory]
+    _latest: dict[str, Hashable]
+    _plans: OrderedDict[tuple[str, Hashable], tuple[ISchema | ISchemaAdapter, int]]
+    _nbytes: int
+    _lock: Lock
+
+    def __init__(self, maxsize: int = 256, max_bytes: int | None = None):
+        """
+        Initializes an empty registry.
+
+        Args:
+            maxsize (int): The maximum number of built schemas kept.
+                Defaults to 256.
+            max_bytes (int | None): The maximum estimated size of the built
+                schemas kept, in bytes. Defaults to None (no limit).
+
+        Raises:
+            ValueError: If `maxsize` or `max_bytes` is less than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._definitions = {}
+        self._latest = {}
+        self._plans = OrderedDict()
+        self._nbytes = 0
+        self._lock = Lock()
+
+    def register(
+        self, schema_id: str, definition: SchemaFactory, version: Hashable = None
+    ) -> None:
+        """
+        Registers the definition of a schema version, which becomes the
+        version used when none is given. Re-registering a version replaces it
+        and drops its built schema.
+
+        Args:
+            schema_id (str): The schema id.
+            definition (Callable[[], Union[ISchema, ISchemaAdapter]]): A
+                callable building the schema.
+            version (Hashable): The schema version. Defaults to None.
+
+        Raises:
+            TypeError: If `definition` is not callable.
+        """
+        if not callable(definition):
+            raise TypeError(
+                f"definition must be a callable building the schema, got {definition!r}"
+            )
+        key = (schema_id, version)
+        with self._lock:
+            self._definitions[key] = definition
+            self._latest[schema_id] = version
+            self._drop(key)
+
+    def unregister(self, schema_id: str, version: Hashable = None) -> None:
+        """
+        Removes a schema version and its built schema. The last remaining
+        registered version becomes the version used when none is
+        given.
+
+        Args:
+            schema_id (str): The schema id.
+            version (Hashable): The schema version. Defaults to None.
+
+        Raises:
+            KeyError: If the version is not registered.
+        """
+        key = (schema_id, version)
+        with self._lock:
+            del self._definitions[key]
+            self._drop(key)
+            if self._latest.get(schema_id) == version:
+                del self._latest[schema_id]
+                for sid, ver in self._definitions:
+                    if sid == schema_id:
+                        self._latest[schema_id] = ver
+
+    def get(
+        self, schema_id: str, version: Hashable = _LATEST
+    ) -> ISchema | ISchemaAdapter:
+        """
+        Returns the built schema of a schema version, building it if it is
+        not cached.
+
+        Args:
+            schema_id (str): The schema id.
+            version (Hashable): The schema version. Defaults to the most
+                recently registered version.
+
+        Returns:
+            Union[ISchema, ISchemaAdapter]: The schema.
+
+        Raises:
+            KeyError: If the schema id or version is not registered.
+        """
+        with self._lock:
+            if version is _LATEST:
+                version = self._latest.get(schema_id, _LATEST)
+            key = (schema_id, version)
+            entry = self._plans.get(key)
+            if entry is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            definition = self._definitions[key]
+            self.misses += 1
+
+        # built outside the lock, so slow definitions don't block other lookups
+        schema = definition()
+        nbytes = _footprint(schema)
+
+        with self._lock:
+            if self._definitions.get(key) is not definition:
+                return schema
+            entry = self._plans.get(key)
+            if entry is not None:
+                return entry[0]
+            self._plans[key] = (schema, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+            return schema
+
+    def validate(
+        self,
+        schema_id: str,
+        payload: Any,
+        version: Hashable = _LATEST,
+        abort_early: bool = True,
+        path: str = "~",
+    ) -> Any:
+        """
+        Validates a payload against a registered schema.
+
+        Args:
+            schema_id (str): The schema id.
+            payload (Any): The value to validate.
+            version (Hashable): The schema version. Defaults to the most
+                recently registered version.
+            abort_early (bool): If True, validation stops on the first error.
+                Defaults to True.
+            path (str): The path of the payload. Defaults to "~".
+
+        Returns:
+            Any: The validated and potentially transformed payload.
+
+        Raises:
+            KeyError: If the schema id or version is not registered.
+            ValidationError: If the payload fails validation.
+        """
+        return self.get(schema_id, version).validate(payload, abort_early, path)
+
+    def clear(self) -> None:
+        """
+        Drops every built schema and resets the statistics. Definitions are kept.
+        """
+        with self._lock:
+            self._plans.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> RegistryInfo:
+        """
+        Returns the statistics of the registry.
+
+        Returns:
+            RegistryInfo: The hits, misses, number of definitions, number of
+                built schemas and their estimated size in bytes.
+        """
+        with self._lock:
+            return RegistryInfo(
+                self.hits,
+                self.misses,
+                len(self._definitions),
+                len(self._plans),
+                self._nbytes,
+            )
+
+    def _drop(self, key: tuple[str, Hashable]) -> None:
+        """
+        Internal method dropping a built schema, if cached. Must be called
+        with the lock held.
+        """
+        entry = self._plans.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+
+    def _evict(self) -> None:
+        """
+        Internal method evicting the least recently used built schemas until
+        the cache is within its limits, always keeping the most recent one.
+        Must be called with the lock held.
+        """
+        plans = self._plans
+        while len(plans) > 1 and (
+            len(plans) > self.maxsize
+            or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+        ):
+            _, (_, nbytes) = plans.popitem(last=False)
+            self._nbytes -= nbytes
+
+    def __contains__(self, schema_id: object) -> bool:
+        return schema_id in self._latest
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._latest))
+
+    def __len__(self) -> int:
+        return len(self._latest)
@@ -1,13 +1,21 @@
+import codecs
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date
+from typing import IO, Any
 
 from typing_extensions import Self
 
 from yupy.icomparable_schema import ComparableSchema, EqualityComparableSchema
+from yupy.imembership_schema import MembershipSchema
+from yupy.imemo_schema import MemoSchema
 from yupy.ischema import _SchemaExpectedType
 from yupy.isized_schema import SizedSchema
 from yupy.locale import ErrorMessage, locale
+from yupy.schema import _constraint_of, _describe, _pure
+from yupy.util.time_budget import check_time_budget
+from yupy.util.trie import AhoCorasick, PrefixTrie
 from yupy.validation_error import Constraint, ValidationError
 
 __all__ = ("StringSchema",)
@@ -19,6 +27,9 @@ rUUID_pattern = re.compile(
 """
 Regular expression pattern for validating UUIDs (versions 1-5) and the null UUID.
 The validation is case-insensitive.
+
+It is the reference definition of the accepted values; validators use the
+equivalent linear-time `_is_uuid` instead.
 """
 
 rEmail_pattern = re.compile(
@@ -28,6 +39,9 @@ rEmail_pattern = re.compile(
 """
 Regular expression pattern for validating email addresses.
 The validation is case-insensitive.
+
+It is the reference definition of the accepted values; validators use the
+equivalent linear-time `_is_email` instead.
 """
 
 rUrl_pattern = re.compile(
@@ -37,17 +51,449 @@ rUrl_pattern = re.compile(
 """
 Regular expression pattern for validating URLs.
 The validation is case-insensitive.
+
+It is the reference definition of the accepted values; validators use the
+equivalent linear-time `_is_url` instead.
+"""
+
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+
+_NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+_EMAIL_LOCAL_CHARS = (
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    ".!#$%&'*+/=?^_`{|}~-"
+    # Non-ASCII letters matched by [a-zA-Z] under re.IGNORECASE
+    "\u0130\u0131\u017f\u212a"
+)
+
+_EMAIL_LABEL = r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
+
+rEmail_domain = re.compile(rf"{_EMAIL_LABEL}(?:\.{_EMAIL_LABEL})*", re.IGNORECASE)
+"""
+Regular expression pattern for the domain of an email address. Labels are
+bounded and separated by dots, so it matches in linear time.
+"""
+
+_URL_UCS = "\xa0-\ud7ff\uf900-\ufdcf\ufdf0-\uffef"
+_URL_UNRESERVED = rf"a-z\d\-._~{_URL_UCS}"
+_URL_SUB_DELIMS = "!$&'()*+,;="
+
+rUrl_scheme = re.compile(r"(?:(?:https?|ftp):)?//", re.IGNORECASE)
+rUrl_pct_encoded = re.compile(r"%[\da-f]{2}", re.IGNORECASE)
+rUrl_userinfo = re.compile(rf"[{_URL_UNRESERVED}{_URL_SUB_DELIMS}:]*", re.IGNORECASE)
+rUrl_host = re.compile(rf"[{_URL_UNRESERVED}]+", re.IGNORECASE)
+rUrl_label_end = re.compile(rf"[a-z\d{_URL_UCS}]", re.IGNORECASE)
+rUrl_tld_end = re.compile(rf"[a-z{_URL_UCS}]", re.IGNORECASE)
+rUrl_path = re.compile(rf"[{_URL_UNRESERVED}{_URL_SUB_DELIMS}:@/]*", re.IGNORECASE)
+rUrl_query = re.compile(
+    rf"[{_URL_UNRESERVED}{_URL_SUB_DELIMS}:@\ue000-\uf8ff/?]*", re.IGNORECASE
+)
+rUrl_fragment = re.compile(rf"[{_URL_UNRESERVED}{_URL_SUB_DELIMS}:@/?]*", re.IGNORECASE)
+"""
+Single character-class patterns for the parts of a URL, as defined by
+`rUrl_pattern`. None of them nests quantifiers, so each part is checked in
+linear time.
+"""
+
+
+def _is_uuid(value: str) -> bool:
+    """
+    Checks a string against `rUUID_pattern` with fixed-position comparisons.
+
+    Args:
+        value (str): The string to check.
+
+    Returns:
+        bool: True if `rUUID_pattern` matches the string.
+    """
+    if len(value) != 36:
+        # `$` also matches before a trailing newline
+        if len(value) != 37 or value[36] != "\n":
+            return False
+        value = value[:36]
+    if (
+        value[8:24:5] != "----"
+        or value.count("-") != 4
+        or value.replace("-", "").strip(_HEX_DIGITS)
+    ):
+        return False
+    return (value[14] in "12345" and value[19] in "89abAB") or value == _NIL_UUID
+
+
+def _is_email(value: str) -> bool:
+    """
+    Checks a string against `rEmail_pattern` in linear time.
+
+    The local part is checked with a single `strip()` over the allowed
+    characters and the domain with `rEmail_domain`.
+
+    Args:
+        value (str): The string to check.
+
+    Returns:
+        bool: True if `rEmail_pattern` matches the string.
+    """
+    # `$` also matches before a trailing newline
+    value = value.removesuffix("\n")
+    local, at, domain = value.partition("@")
+    if not at or not local or local.strip(_EMAIL_LOCAL_CHARS):
+        return False
+    return rEmail_domain.fullmatch(domain) is not None
+
+
+def _is_url_part(pattern: re.Pattern, part: str) -> bool:
+    """
+    Checks that a URL part only contains the characters of `pattern` and
+    well-formed percent-encoded octets.
+
+    Args:
+        pattern (re.Pattern): The character-class pattern of the part.
+        part (str): The part to check.
+
+    Returns:
+        bool: True if the part is valid.
+    """
+    if "%" in part:
+        part = rUrl_pct_encoded.sub("", part)
+    return pattern.fullmatch(part) is not None
+
+
+def _is_ipv4_octet(octet: str) -> bool:
+    """
+    Checks a decimal octet of an IPv4 address (0 to 255, no leading zero).
+
+    Args:
+        octet (str): The octet to check.
+
+    Returns:
+        bool: True if the octet is valid.
+    """
+    if not octet.isdecimal() or len(octet) > 3:
+        return False
+    if len(octet) == 1:
+        return True
+    if len(octet) == 2:
+        return octet[0] in "123456789"
+    return octet[0] == "1" or (
+        octet[0] == "2"
+        and (octet[1] in "01234" or (octet[1] == "5" and octet[2] in "012345"))
+    )
+
+
+def _is_hostname(host: str) -> bool:
+    """
+    Checks a host name made of labels and a top-level label, with an
+    optional trailing dot.
+
+    Labels may contain dots, so the host is valid if it splits at some dot
+    into labels (first and last characters alphanumeric) and a top-level
+    label (first and last characters alphabetic).
+
+    Args:
+        host (str): The host to check.
+
+    Returns:
+        bool: True if the host is valid.
+    """
+    host = host.removesuffix(".")
+    if not rUrl_host.fullmatch(host):
+        return False
+    if not rUrl_label_end.match(host[0]) or not rUrl_tld_end.match(host[-1]):
+        return False
+    dot = host.find(".", 1)
+    while 0 < dot < len(host) - 1:
+        if rUrl_label_end.match(host[dot - 1]) and rUrl_tld_end.match(host[dot + 1]):
+            return True
+        dot = host.find(".", dot + 1)
+    return False
+
+
+def _is_url(value: str) -> bool:
+    """
+    Checks a string against `rUrl_pattern` in linear time.
+
+    The URL is split on its delimiters (`#`, `?`, `/`, `@`, `:`), none of
+    which can appear in the part before it, and each part is checked once.
+
+    Args:
+        value (str): The string to check.
+
+    Returns:
+        bool: True if `rUrl_pattern` matches the string.
+    """
+    # `$` also matches before a trailing newline
+    value = value.removesuffix("\n")
+    scheme = rUrl_scheme.match(value)
+    if scheme is None:
+        return False
+    rest, hash_, fragment = value[scheme.end() :].partition("#")
+    rest, question, query = rest.partition("?")
+    authority, slash, path = rest.partition("/")
+    if hash_ and not _is_url_part(rUrl_fragment, fragment):
+        return False
+    if question and not _is_url_part(rUrl_query, query):
+        return False
+    if slash and (path.startswith("/") or not _is_url_part(rUrl_path, path)):
+        return False
+    userinfo, at, hostport = authority.rpartition("@")
+    if at and not _is_url_part(rUrl_userinfo, userinfo):
+        return False
+    host, colon, port = hostport.partition(":")
+    if colon and port and not port.isdecimal():
+        return False
+    if not host:
+        return False
+    octets = host.split(".")
+    if len(octets) == 4 and all(_is_ipv4_octet(octet) for octet in octets):
+        return True
+    return _is_hostname(host)
+
+
+rStreamable_pattern = re.compile(
+    r"^\^?(\[(?:\\.|[^\]\\])+\]|\\[dDwWsS]|\.)([*+])(\$|\\Z)?$"
+)
+"""
+Regular expression pattern recognising `matches()` patterns that can be
+evaluated incrementally: a single character class (or `.`, `\\d`, `\\w`, ...)
+repeated with `*` or `+`, optionally anchored with `^` and `$` or `\\Z`.
+"""
+
+
+class _StreamCheck:
+    """
+    The incremental form of a built-in string constraint, used by
+    `StringSchema.validate_stream` to validate a value chunk by chunk.
+
+    Attributes:
+        _constraint (Constraint): The constraint recorded on the validator.
+    """
+
+    def __init__(self, constraint: Constraint) -> None:
+        self._constraint = constraint
+
+    def _fail(self, *args: Any) -> None:
+        """
+        Raises the validation error of the constraint.
+
+        Args:
+            *args (Any): The constraint arguments passed to the error message.
+
+        Raises:
+            ValidationError: Always.
+        """
+        raise ValidationError(
+            Constraint(self._constraint.type, self._constraint.message, *args)
+        )
+
+    def feed(self, chunk: str, count: int) -> None:
+        """
+        Checks the next chunk of the value.
+
+        Args:
+            chunk (str): The next non-empty chunk.
+            count (int): The number of characters read so far, including `chunk`.
+
+        Raises:
+            ValidationError: If the value can already be rejected.
+        """
+
+    def finish(self, count: int) -> None:
+        """
+        Checks the constraint once the whole value has been read.
+
+        Args:
+            count (int): The total number of characters.
+
+        Raises:
+            ValidationError: If the value is invalid.
+        """
+
+
+class _SizeStreamCheck(_StreamCheck):
+    """
+    Streams `length()`, `min()` and `max()` by counting characters.
+    `max()` and `length()` fail as soon as the limit is exceeded.
+    """
+
+    def feed(self, chunk: str, count: int) -> None:
+        limit = self._constraint.args[0]
+        if self._constraint.type != "min" and count > limit:
+            self._fail(limit)
+
+    def finish(self, count: int) -> None:
+        limit = self._constraint.args[0]
+        if self._constraint.type == "min" and count < limit:
+            self._fail(limit)
+        if self._constraint.type == "length" and count != limit:
+            self._fail(limit)
+
+
+class _CaseStreamCheck(_StreamCheck):
+    """
+    Streams `lowercase()` and `uppercase()` by checking every chunk.
+    """
+
+    def feed(self, chunk: str, count: int) -> None:
+        if self._constraint.type == "lowercase":
+            converted = chunk.lower()
+        else:
+            converted = chunk.upper()
+        if converted != chunk:
+            self._fail()
+
+
+class _PatternStreamCheck(_StreamCheck):
+    """
+    Streams `matches()` for patterns recognised by `rStreamable_pattern`.
+
+    End-anchored patterns are checked against every chunk. Unanchored ones
+    only need a matching prefix, as with `re.match`, so only the first
+    character is checked. `$` also accepts a single trailing newline.
+
+    Raises:
+        TypeError: If the pattern can't be evaluated incrementally, or if it
+            ends with `$` under `re.MULTILINE`.
+    """
+
+    def __init__(self, constraint: Constraint) -> None:
+        super().__init__(constraint)
+        regex, self._exclude_empty = constraint.args
+        self._pattern = regex.pattern
+        found = (
+            rStreamable_pattern.match(regex.pattern)
+            if isinstance(regex.pattern, str)
+            else None
+        )
+        if found is not None and found[3] == "$" and regex.flags & re.MULTILINE:
+            # `$` then also matches before any newline, not only at the end
+            found = None
+        if found is None:
+            raise TypeError(
+                f"matches() pattern {regex.pattern!r} can't be validated from a stream"
+            )
+        atom, quantifier, end = found.groups()
+        self._atom = re.compile(atom, regex.flags)
+        self._repeated = re.compile(f"(?:{atom})*", regex.flags)
+        self._plus = quantifier == "+"
+        self._anchored = end is not None
+        self._dollar = end == "$"
+        self._newline = False
+
+    def feed(self, chunk: str, count: int) -> None:
+        if not self._anchored:
+            if self._plus and count == len(chunk) and not self._atom.match(chunk):
+                self._fail(self._pattern)
+            return
+        if self._newline:
+            self._newline = False
+            if not self._repeated.fullmatch("\n"):
+                self._fail(self._pattern)
+        if self._dollar and chunk.endswith("\n"):
+            chunk = chunk[:-1]
+            self._newline = True
+        if not self._repeated.fullmatch(chunk):
+            self._fail(self._pattern)
+
+    def finish(self, count: int) -> None:
+        if count == 0 and self._exclude_empty:
+            return
+        # a lone newline is only valid if the atom itself matches it
+        if (
+            self._plus
+            and count - self._newline == 0
+            and not (self._newline and self._atom.fullmatch("\n"))
+        ):
+            self._fail(self._pattern)
+
+
+class _AffixStreamCheck(_StreamCheck):
+    """
+    Streams `starts_with_any()` by walking the prefix trie along the chunks,
+    and `ends_with_any()` by keeping the tail of the value as long as the
+    longest suffix.
+    """
+
+    def __init__(self, constraint: Constraint) -> None:
+        super().__init__(constraint)
+        self._trie: PrefixTrie = constraint.args[0]
+        self._state: Any = None
+        self._tail = ""
+
+    def feed(self, chunk: str, count: int) -> None:
+        if self._trie.reverse:
+            tail = self._tail + chunk
+            self._tail = tail[max(len(tail) - self._trie.longest, 0) :]
+        elif not isinstance(self._state, str):
+            self._state = self._trie.walk(self._state, chunk)
+            if self._state is None:
+                self._fail()
+
+    def finish(self, count: int) -> None:
+        if self._trie.reverse:
+            matched = self._trie.match(self._tail)
+        elif count == 0:
+            matched = self._trie.match("")
+        else:
+            matched = self._state if isinstance(self._state, str) else None
+        if matched is None:
+            self._fail()
+
+
+class _ContainsStreamCheck(_StreamCheck):
+    """
+    Streams `contains_none_of()` by resuming the Aho-Corasick automaton from
+    one chunk to the next, so words spanning two chunks are found.
+    """
+
+    def __init__(self, constraint: Constraint) -> None:
+        super().__init__(constraint)
+        self._automaton: AhoCorasick = constraint.args[0]
+        self._state = 0
+
+    def feed(self, chunk: str, count: int) -> None:
+        self._state, found = self._automaton.search(chunk, self._state)
+        if found is not None:
+            self._fail(found)
+
+    def finish(self, count: int) -> None:
+        if count == 0:
+            self.feed("", 0)
+
+
+_STREAM_CHECKS: dict[str, type[_StreamCheck]] = {
+    "length": _SizeStreamCheck,
+    "min": _SizeStreamCheck,
+    "max": _SizeStreamCheck,
+    "lowercase": _CaseStreamCheck,
+    "uppercase": _CaseStreamCheck,
+    "matches": _PatternStreamCheck,
+    "starts_with_any": _AffixStreamCheck,
+    "ends_with_any": _AffixStreamCheck,
+    "contains_none_of": _ContainsStreamCheck,
+}
+"""
+Maps the built-in constraints that support stream validation to the class
+implementing their incremental form.
 """
 
 
 @dataclass
-class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
+class StringSchema(
+    SizedSchema,
+    ComparableSchema,
+    EqualityComparableSchema,
+    MembershipSchema,
+    MemoSchema,
+):
     """
     A schema for validating string values with various constraints.
 
     This schema extends `SizedSchema` for length-based validations,
-    `ComparableSchema` for comparison operations, and
-    `EqualityComparableSchema` for equality checks. It provides methods
+    `ComparableSchema` for comparison operations,
+    `EqualityComparableSchema` for equality checks, `MembershipSchema`
+    for allowlists and denylists and `MemoSchema` for caching validation
+    results of repeated values. It provides methods
     for regex matching, specific format validation (email, URL, UUID),
     case enforcement, and ensuring non-empty strings.
 
@@ -58,6 +504,82 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
 
     _type: _SchemaExpectedType = field(init=False, default=str)
 
+    def validate_stream(
+        self,
+        stream: IO[Any],
+        path: str = "~",
+        chunk_size: int = 65536,
+        encoding: str = "utf-8",
+    ) -> int:
+        """
+        Validates a large string read from a text or binary file-like object,
+        chunk by chunk, without loading the whole value into memory.
+
+        Supported constraints are `length()`, `min()` and `max()` (checked by
+        counting, `max()` stops reading as soon as the limit is exceeded),
+        `lowercase()` and `uppercase()` (checked per chunk), `matches()`
+        with a repeated character class pattern such as `^[A-Za-z0-9+/=]+$`,
+        `starts_with_any()`, `ends_with_any()` and `contains_none_of()`.
+
+        Args:
+            stream (IO[Any]): The stream to read the value from. Binary
+                streams are decoded incrementally with `encoding`.
+            path (str, optional): The current path in the data structure, used
+                for more informative error messages. Defaults to "~".
+            chunk_size (int, optional): The size of each read. Defaults to 65536.
+            encoding (str, optional): The encoding of binary streams.
+                Defaults to "utf-8".
+
+        Returns:
+            int: The length of the validated string, in characters.
+
+        Raises:
+            TypeError: If the schema has transforms or validators that can't
+                be evaluated incrementally (e.g. custom tests or `email()`).
+            ValidationError: If the stream doesn't yield text, or if the value
+                fails validation.
+        """
+        if self._transforms:
+            raise TypeError("transforms can't be applied to a stream")
+        checks: list[_StreamCheck] = []
+        for validator in self._validators:
+            constraint = _constraint_of(validator)
+            if constraint is None or constraint.type not in _STREAM_CHECKS:
+                raise TypeError(f"validator {validator!r} can't be applied to a stream")
+            checks.append(_STREAM_CHECKS[constraint.type](constraint))
+
+        decoder: codecs.IncrementalDecoder | None = None
+        count = 0
+        try:
+            while True:
+                raw = stream.read(chunk_size)
+                if isinstance(raw, str):
+                    chunk = raw
+                elif isinstance(raw, (bytes, bytearray)):
+                    if decoder is None:
+                        decoder = codecs.getincrementaldecoder(encoding)()
+                    try:
+                        chunk = decoder.decode(raw, final=not raw)
+                    except UnicodeDecodeError as err:
+                        raise ValidationError(
+                            Constraint("type", self.message, str, bytes, origin=err)
+                        )
+                else:
+                    raise ValidationError(
+                        Constraint("type", self.message, str, type(raw))
+                    )
+                if chunk:
+                    count += len(chunk)
+                    for check in checks:
+                        check.feed(chunk, count)
+                if not raw:
+                    break
+            for check in checks:
+                check.finish(count)
+        except ValidationError as err:
+            raise ValidationError(err.constraint, path, invalid_value=stream)
+        return count
+
     def matches(
         self,
         regex: re.Pattern,
@@ -83,18 +605,104 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
             if exclude_empty and not x:
                 return
 
+            check_time_budget()
             if not re.match(regex, x):
                 raise ValidationError(
                     Constraint("matches", message, regex.pattern), invalid_value=x
                 )
 
-        return self.test(_)
+        return self.test(_describe(_, "matches", message, regex, exclude_empty))
+
+    def starts_with_any(
+        self, prefixes: Iterable[str], message: ErrorMessage = locale["starts_with_any"]
+    ) -> Self:
+        """
+        Adds a validation rule to ensure the string starts with one of the given prefixes.
+
+        The prefixes are compiled into a trie when the rule is defined, so a
+        value is checked in a single pass over at most as many characters as
+        the longest prefix, however many prefixes there are.
+
+        Args:
+            prefixes (Iterable[str]): The allowed prefixes.
+            message (ErrorMessage): The error message to use if the validation fails.
+                Defaults to the locale-defined message for "starts_with_any".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+        trie = PrefixTrie(prefixes)
+
+        def _(x: str) -> None:
+            if trie.match(x) is None:
+                raise ValidationError(
+                    Constraint("starts_with_any", message), invalid_value=x
+                )
+
+        return self.test(_describe(_, "starts_with_any", message, trie))
+
+    def ends_with_any(
+        self, suffixes: Iterable[str], message: ErrorMessage = locale["ends_with_any"]
+    ) -> Self:
+        """
+        Adds a validation rule to ensure the string ends with one of the given suffixes.
+
+        The suffixes are compiled into a trie of reversed suffixes when the
+        rule is defined, and the value is walked backwards from its end.
+
+        Args:
+            suffixes (Iterable[str]): The allowed suffixes.
+            message (ErrorMessage): The error message to use if the validation fails.
+                Defaults to the locale-defined message for "ends_with_any".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+        trie = PrefixTrie(suffixes, reverse=True)
+
+        def _(x: str) -> None:
+            if trie.match(x) is None:
+                raise ValidationError(
+                    Constraint("ends_with_any", message), invalid_value=x
+                )
+
+        return self.test(_describe(_, "ends_with_any", message, trie))
+
+    def contains_none_of(
+        self, words: Iterable[str], message: ErrorMessage = locale["contains_none_of"]
+    ) -> Self:
+        """
+        Adds a validation rule to ensure the string contains none of the given words.
+
+        The words are compiled into an Aho-Corasick automaton when the rule is
+        defined, so a value is scanned in a single linear pass, however many
+        words there are. The error reports the first word found.
+
+        Args:
+            words (Iterable[str]): The banned words (substrings).
+            message (ErrorMessage): The error message to use if the validation fails.
+                Defaults to the locale-defined message for "contains_none_of".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+        automaton = AhoCorasick(words)
+
+        def _(x: str) -> None:
+            _state, found = automaton.search(x)
+            if found is not None:
+                raise ValidationError(
+                    Constraint("contains_none_of", message, found), invalid_value=x
+                )
+
+        return self.test(_describe(_, "contains_none_of", message, automaton))
 
     def email(self, message: ErrorMessage = locale["email"]) -> Self:
         """
         Adds a validation rule to ensure the string is a valid email address format.
 
-        This method uses the pre-compiled `rEmail_pattern` for validation.
+        The value is checked in linear time, accepting exactly the values
+        matched by `rEmail_pattern`.
 
         Args:
             message (ErrorMessage): The error message to use if the validation fails.
@@ -105,16 +713,17 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
         """
 
         def _(x: str) -> None:
-            if not re.match(rEmail_pattern, x):
+            if not _is_email(x):
                 raise ValidationError(Constraint("email", message), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "email", message))
 
     def url(self, message: ErrorMessage = locale["url"]) -> Self:
         """
         Adds a validation rule to ensure the string is a valid URL format.
 
-        This method uses the pre-compiled `rUrl_pattern` for validation.
+        The value is checked in linear time, accepting exactly the values
+        matched by `rUrl_pattern`.
 
         Args:
             message (ErrorMessage): The error message to use if the validation fails.
@@ -125,17 +734,18 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
         """
 
         def _(x: str) -> None:
-            if not re.match(rUrl_pattern, x):
+            if not _is_url(x):
                 raise ValidationError(Constraint("url", message), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "url", message))
 
     def uuid(self, message: ErrorMessage = locale["uuid"]) -> Self:
         """
         Adds a validation rule to ensure the string is a valid UUID format.
 
-        This method uses the pre-compiled `rUUID_pattern` for validation,
-        which includes support for UUID versions 1-5 and the null UUID.
+        The value is checked with fixed-position comparisons, accepting
+        exactly the values matched by `rUUID_pattern`: UUID versions 1-5
+        and the null UUID.
 
         Args:
             message (ErrorMessage): The error message to use if the validation fails.
@@ -146,10 +756,10 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
         """
 
         def _(x: str) -> None:
-            if not re.match(rUUID_pattern, x):
+            if not _is_uuid(x):
                 raise ValidationError(Constraint("uuid", message), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "uuid", message))
 
     # # FIXME
     # def datetime(self, message: ErrorMessage = locale["datetime"], precision: Literal[0, 3, 6] | None = None,
@@ -236,7 +846,7 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
             except ValueError:
                 raise ValidationError(Constraint("date", message), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_pure(_))
 
     def ensure(self) -> Self:
         """
@@ -253,8 +863,7 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
         def _(x: str) -> str:
             return x if x else ""
 
-        self._transforms.append(_)
-        return self
+        return self.transform(_pure(_))
 
     def trim(self) -> Self:
         """
@@ -269,8 +878,7 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
         def _(x: str) -> str:
             return x.strip()
 
-        self._transforms.append(_)
-        return self
+        return self.transform(_pure(_))
 
     def lowercase(self, message: ErrorMessage = locale["lowercase"]) -> Self:
         """
@@ -290,7 +898,7 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
             if x.lower() != x:
                 raise ValidationError(Constraint("lowercase", message), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "lowercase", message))
 
     def uppercase(self, message: ErrorMessage = locale["uppercase"]) -> Self:
         """
@@ -310,4 +918,4 @@ class StringSchema(SizedSchema, ComparableSchema, EqualityComparableSchema):
             if x.upper() != x:
                 raise ValidationError(Constraint("uppercase", message), invalid_value=x)
 
-        return self.test(_)
+        return self.test(_describe(_, "uppercase", message))
@@ -1,13 +1,38 @@
+import threading
+from collections.abc import Hashable, Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
 from typing_extensions import Self
 
-from yupy.adapters import ISchemaAdapter
-from yupy.icomparable_schema import EqualityComparableSchema
+from yupy.adapters import (
+    ISchemaAdapter,
+    SchemaAdapter,
+    SchemaDefaultAdapter,
+    SchemaImmutableAdapter,
+    SchemaRequiredAdapter,
+)
+from yupy.icomparable_schema import (
+    _LOWER_BOUNDS,
+    _UPPER_BOUNDS,
+    EqualityComparableSchema,
+)
+from yupy.imemo_schema import MemoSchema
 from yupy.ischema import ISchema, _SchemaExpectedType
 from yupy.locale import ErrorMessage, locale
+from yupy.mapping_schema import MappingSchema
+from yupy.schema import (
+    Schema,
+    _comparable_limit,
+    _constraint_of,
+    _optimize_nested,
+    _same_rule,
+)
 from yupy.util.concat_path import concat_path
+from yupy.util.error_limit import error_limit
+from yupy.util.revision import rules_revision
+from yupy.util.time_budget import budget_exceeded
+from yupy.util.unwrap import unwrap
 from yupy.validation_error import Constraint, ValidationError
 
 __all__ = ("UnionSchema",)
@@ -15,6 +40,172 @@ __all__ = ("UnionSchema",)
 UnionOptionsType = list[ISchema | ISchemaAdapter] | tuple[ISchema | ISchemaAdapter, ...]
 
 
+def _literal_values(schema: ISchema | ISchemaAdapter) -> list[Any]:
+    """
+    Returns the literal values a schema is restricted to by a `const()`,
+    `eq()`, `one_of()` or `literal()` constraint.
+
+    Args:
+        schema (Union[ISchema, ISchemaAdapter]): The schema to inspect,
+            optionally wrapped in adapters.
+
+    Returns:
+        list[Any]: The allowed values, or an empty list if the schema does not
+            restrict its value to literals.
+    """
+    inner = unwrap(schema)
+    for func in (
+        *getattr(inner, "_transforms", ()),
+        *getattr(inner, "_validators", ()),
+    ):
+        constraint = _constraint_of(func)
+        if constraint is None:
+            continue
+        if constraint.type in ("const", "eq"):
+            return [constraint.args[0]]
+        if constraint.type == "one_of":
+            return list(constraint.args[0])
+    return []
+
+
+def _type_checked(schema: ISchema | ISchemaAdapter) -> Any:
+    """
+    Returns the schema whose type check is the first step an option applies
+    to a non-null value, looking through adapters that pass the value on
+    unchanged (`required`, `immutable` and non-ensuring `default`).
+
+    Args:
+        schema (Union[ISchema, ISchemaAdapter]): The union option.
+
+    Returns:
+        Any: The type-checked schema, or None if the option can't be ruled
+            out from the type of the value alone (it has transforms, accepts
+            any type, or is wrapped in an adapter that changes the value).
+    """
+    while isinstance(
+        schema, (SchemaRequiredAdapter, SchemaImmutableAdapter, SchemaDefaultAdapter)
+    ):
+        if isinstance(schema, SchemaDefaultAdapter) and schema._ensure:
+            return None
+        schema = schema.schema
+    if isinstance(schema, SchemaAdapter) or getattr(schema, "_transforms", None):
+        return None
+    if getattr(schema, "_type", Any) in (Any, object):
+        return None
+    return schema
+
+
+_LITERAL_RULES = ("const", "eq", "one_of")
+"""
+The constraint types restricting a value to literals.
+"""
+
+
+def _implies(rules: list[Constraint], rule: Constraint) -> bool:
+    """
+    Checks whether a value satisfying all the given built-in rules satisfies
+    another one.
+
+    Args:
+        rules (list[Constraint]): The constraints of the rules.
+        rule (Constraint): The constraint to check.
+
+    Returns:
+        bool: True if `rule` is known to be implied; False if it isn't or
+            can't be decided.
+    """
+    limit = rule.args[0] if rule.args else None
+    for other in rules:
+        if _same_rule(rule, other):
+            return True
+        if not (_comparable_limit(limit) and other.args):
+            continue
+        if not _comparable_limit(other.args[0]):
+            continue
+        try:
+            if rule.type in _LOWER_BOUNDS and other.type in _LOWER_BOUNDS:
+                implied = (other.args[0], _LOWER_BOUNDS[other.type]) >= (
+                    limit,
+                    _LOWER_BOUNDS[rule.type],
+                )
+            elif rule.type in _UPPER_BOUNDS and other.type in _UPPER_BOUNDS:
+                implied = (other.args[0], _UPPER_BOUNDS[other.type]) <= (
+                    limit,
+                    _UPPER_BOUNDS[rule.type],
+                )
+            elif rule.type == "min" and other.type in ("min", "length"):
+                implied = other.args[0] >= limit
+            elif rule.type == "max" and other.type in ("max", "length"):
+                implied = other.args[0] <= limit
+            else:
+                implied = False
+        except TypeError:
+            implied = False
+        if implied:
+            return True
+    return False
+
+
+def _subsumes(first: Any, second: Any) -> bool:
+    """
+    Checks whether a union option accepts every value another option
+    accepts, so that the other option is never tried after it.
+
+    The check is conservative: it only compares options validated by their
+    nullability, type and built-in rules (no transforms, no custom tests on
+    `first`, no nested schemas).
+
+    Args:
+        first (Any): The earlier option.
+        second (Any): The later option.
+
+    Returns:
+        bool: True if `second` is known to be unreachable after `first`.
+    """
+    for option in (first, second):
+        if (
+            not isinstance(option, Schema)
+            or option._transforms
+            or type(option).validate not in (Schema.validate, MemoSchema.validate)
+        ):
+            return False
+    if second._nullability and not first._nullability:
+        return False
+    rules = [_constraint_of(func) for func in first._validators]
+    if any(rule is None for rule in rules):
+        return False
+
+    literals = None
+    for func in second._validators:
+        constraint = _constraint_of(func)
+        if constraint is not None and constraint.type in _LITERAL_RULES:
+            literals = (
+                constraint.args[0]
+                if constraint.type == "one_of"
+                else [constraint.args[0]]
+            )
+            break
+    if literals is not None:
+        # every literal accepted by `second` must pass the checks of `first`
+        for literal in literals:
+            try:
+                first._type_check(literal)
+                for func in first._validators:
+                    func(literal)
+            except (ValidationError, TypeError):
+                return False
+        return True
+
+    if first._type not in (Any, object):
+        types = second._type if isinstance(second._type, tuple) else (second._type,)
+        if second._type in (Any, object) or not all(
+            isinstance(t, type) and issubclass(t, first._type) for t in types
+        ):
+            return False
+    implied = [c for func in second._validators if (c := _constraint_of(func))]
+    return all(_implies(implied, rule) for rule in rules if rule is not None)
+
+
 @dataclass
 class UnionSchema(EqualityComparableSchema):
     """
@@ -30,10 +221,55 @@ class UnionSchema(EqualityComparableSchema):
             Initialized to `object`, as a union can represent any type.
         _options (UnionOptionsType): A list or tuple of `ISchema` or `ISchemaAdapter`
             instances, representing the alternative schemas for validation.
+        _discriminator (str | None): The name of the tag field used to select
+            the option, or None to try every option in order.
+        _discriminator_message (ErrorMessage): The error message used when the
+            tag field is missing or has an unknown value.
+        _dispatch (dict[Any, Union[ISchema, ISchemaAdapter]]): Maps each tag value
+            to the option accepting it.
+        _typed_options (list[Any]): For each option, the schema whose type
+            check rules it out from the type of the value, or None if the
+            option must always be tried.
+        _typed_revision (int): The `rules_revision()` `_typed_options` was
+            built at, so it is rebuilt once an option gets a transform or
+            an ensured default.
+        _candidates (dict[type, tuple[int, ...]]): Caches, per concrete type
+            of the value, the indexes of the options that can accept it.
+        _order (tuple[int, ...]): The indexes of the options in trial order.
+        _reorder_every (int | None): In adaptive mode, the number of matches
+            after which the trial order is recomputed; None if disabled.
+        _hits (list[int]): In adaptive mode, the number of matches per option.
+        _matches (int): In adaptive mode, the total number of matches counted.
+        _frozen (bool): If True, the trial order is pinned and matches are
+            no longer counted.
+        _lock (threading.Lock): Guards the adaptive counters.
+        _best_match (bool): If True, only the errors of the closest matching
+            option are reported.
     """
 
     _type: _SchemaExpectedType = field(init=False, default=object)
     _options: UnionOptionsType = field(init=False, default_factory=list)
+    _discriminator: str | None = field(init=False, default=None)
+    _discriminator_message: ErrorMessage = field(
+        init=False, default=locale["discriminator"]
+    )
+    _dispatch: dict[Any, ISchema | ISchemaAdapter] = field(
+        init=False, default_factory=dict
+    )
+    _typed_options: list[Any] = field(init=False, default_factory=list)
+    _typed_revision: int = field(init=False, default=-1, repr=False, compare=False)
+    _candidates: dict[type, tuple[int, ...]] = field(
+        init=False, default_factory=dict, compare=False
+    )
+    _order: tuple[int, ...] = field(init=False, default=(), compare=False)
+    _reorder_every: int | None = field(init=False, default=None)
+    _hits: list[int] = field(init=False, default_factory=list, compare=False)
+    _matches: int = field(init=False, default=0, compare=False)
+    _frozen: bool = field(init=False, default=False)
+    _lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False, compare=False
+    )
+    _best_match: bool = field(init=False, default=False)
 
     def one_of(
         self, options: UnionOptionsType, message: ErrorMessage = locale["one_of"]
@@ -44,6 +280,11 @@ class UnionSchema(EqualityComparableSchema):
         The value will be considered valid if it passes validation against any
         one of the schemas in the `options` list/tuple.
 
+        Options are indexed by the type they accept, so a value is only tried
+        against the options compatible with its type (e.g. a `StringSchema`
+        option is never tried for a dict). The index is rebuilt if an option
+        is reconfigured afterwards (e.g. given a transform).
+
         Args:
             options (UnionOptionsType): An iterable (list or tuple) containing
                 `ISchema` or `ISchemaAdapter` instances, each representing a
@@ -60,11 +301,187 @@ class UnionSchema(EqualityComparableSchema):
                 `ISchema` or `ISchemaAdapter`.
         """
         for schema in options:
-            if not isinstance(schema, ISchema):
+            if not isinstance(schema, (ISchema, ISchemaAdapter)):
                 raise TypeError(
                     "each union schema must be an instance of ISchema or ISchemaAdapter"
                 )
         self._options = options
+        self._index_options()
+        return self
+
+    def discriminator(
+        self, key: str, message: ErrorMessage = locale["discriminator"]
+    ) -> Self:
+        """
+        Turns the union into a discriminated (tagged) union of mapping schemas.
+
+        Every option must be a `MappingSchema` (optionally wrapped in adapters)
+        whose `key` field is restricted to literal values with `const()`,
+        `eq()`, `one_of()` or `literal()`. The tag is read once from the validated mapping
+        and the matching option is found with a single dictionary lookup, so
+        only that option is validated, regardless of the number of options.
+
+        Args:
+            key (str): The name of the tag field.
+            message (ErrorMessage): The error message to use if the tag is
+                missing or unknown. Defaults to the locale-defined message
+                for "discriminator".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            TypeError: If an option is not a mapping schema with a literal
+                `key` field, or if two options accept the same tag value.
+        """
+        self._discriminator = key
+        self._discriminator_message = message
+        self._index_options()
+        return self
+
+    def adaptive(self, every: int = 1000) -> Self:
+        """
+        Enables profile-guided ordering of the options.
+
+        The schema counts which option matches each validated value and,
+        every `every` matches, reorders its trial order so that the most
+        frequently matching options are tried first. Options with the same
+        count keep their declared order.
+
+        Reordering changes which option wins when several options accept the
+        same value, so adaptive mode should only be used with options that
+        are mutually exclusive (or equivalent on overlapping values).
+
+        Counters are shared between threads and updated under a lock.
+
+        Args:
+            every (int, optional): The number of matches between two
+                reorderings. Defaults to 1000.
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            ValueError: If `every` is not a positive integer.
+        """
+        if every < 1:
+            raise ValueError("every must be a positive integer")
+        with self._lock:
+            self._reorder_every = every
+            self._frozen = False
+        return self
+
+    def freeze(self) -> Self:
+        """
+        Pins the current (learned) trial order of the options.
+
+        Matches are no longer counted, so a frozen adaptive union validates
+        with no locking overhead.
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+        with self._lock:
+            self._frozen = True
+        return self
+
+    def best_match(self, enabled: bool = True) -> Self:
+        """
+        Enables best-match error reporting.
+
+        Instead of attaching the errors of every option, the union reports
+        only the errors of the closest matching option: the one with the
+        fewest field (or item) errors, options failing their type check
+        being the farthest. The first option in trial order wins ties.
+
+        Options are validated with a shrinking error budget: once an option
+        has as many field errors as the current best one, it has lost and
+        its validation stops. This bounds both the work and the size of the
+        error tree for wide unions over large objects.
+
+        Args:
+            enabled (bool, optional): Whether best-match reporting is enabled.
+                Defaults to True.
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+        """
+        self._best_match = enabled
+        return self
+
+    def _index_types(self) -> None:
+        """
+        Internal method building the type index of the options and dropping
+        the candidates cached for the previous one.
+        """
+        self._typed_revision = rules_revision()
+        self._typed_options = [_type_checked(option) for option in self._options]
+        self._candidates = {}
+
+    def _index_options(self) -> None:
+        """
+        Internal method building the type index of the options and the tag
+        value to option dispatch table of a discriminated union.
+
+        Raises:
+            TypeError: If an option has no literal tag field, or if two options
+                accept the same tag value.
+        """
+        self._index_types()
+        with self._lock:
+            self._order = tuple(range(len(self._options)))
+            self._hits = [0] * len(self._options)
+            self._matches = 0
+        self._dispatch = {}
+        key = self._discriminator
+        if key is None:
+            return
+        for i, option in enumerate(self._options):
+            inner = unwrap(option)
+            tags = []
+            if isinstance(inner, MappingSchema) and key in inner._fields:
+                tags = _literal_values(inner._fields[key])
+            if not tags:
+                raise TypeError(
+                    f"union option {i} must be a mapping schema with a literal {key!r} field"
+                )
+            for tag in tags:
+                if not isinstance(tag, Hashable):
+                    raise TypeError(f"discriminator value {tag!r} must be hashable")
+                if tag in self._dispatch:
+                    raise TypeError(f"discriminator value {tag!r} is ambiguous")
+                self._dispatch[tag] = option
+
+    def optimize(self, path: str = "~") -> Self:
+        """
+        Simplifies the rules of the union and of its options
+        (see `Schema.optimize()`), and checks that every option can be
+        reached.
+
+        Args:
+            path (str): The path of the schema, used in error messages.
+                Defaults to "~".
+
+        Returns:
+            Self: The schema instance, allowing for method chaining.
+
+        Raises:
+            ValueError: If the rules of an option contradict each other, or
+                if an option accepts no value that an earlier option doesn't
+                (e.g. `string().min(3)` after `string()`).
+        """
+        super().optimize(path)
+        options = self._options
+        for i, option in enumerate(options):
+            _optimize_nested(option, concat_path(path, i))
+        if self._discriminator is None:
+            for j, option in enumerate(options):
+                for i in range(j):
+                    if _subsumes(options[i], option):
+                        raise ValueError(
+                            f"{concat_path(path, j)}: option is never tried, "
+                            f"option {i} accepts every value it accepts"
+                        )
         return self
 
     def validate(
@@ -96,26 +513,119 @@ class UnionSchema(EqualityComparableSchema):
         value = super().validate(value, abort_early, path)
         if value is None and self._nullability:
             return None
+        if self._discriminator is not None:
+            return self._validate_discriminated(
+                value, self._discriminator, abort_early, path
+            )
         return self._validate_union(
             value, abort_early, path
         )  # Convert tuple to list for iteration
 
+    def _validate_discriminated(
+        self, value: Any, key: str, abort_early: bool = True, path: str = "~"
+    ) -> Any:
+        """
+        Internal method validating the value against the single option selected
+        by its tag field.
+
+        Errors of the selected option are raised as is, at the path of the value.
+
+        Args:
+            value (Any): The value to validate.
+            key (str): The name of the tag field.
+            abort_early (bool, optional): If True, validation stops on the first
+                error. If False, all errors are collected. Defaults to True.
+            path (str, optional): The current path in the data structure.
+                Defaults to "~".
+
+        Returns:
+            Any: The value validated by the selected option.
+
+        Raises:
+            ValidationError: If the tag is missing or unknown ("discriminator"
+                constraint at the path of the tag field), or if the selected
+                option rejects the value.
+        """
+        tag = value.get(key) if isinstance(value, Mapping) else None
+        option = self._dispatch.get(tag) if isinstance(tag, Hashable) else None
+        if option is None:
+            raise ValidationError(
+                Constraint(
+                    "discriminator",
+                    self._discriminator_message,
+                    key,
+                    list(self._dispatch),
+                ),
+                concat_path(path, key),
+                invalid_value=tag,
+            )
+        return option.validate(value, abort_early, path)
+
+    def _candidates_for(self, type_: type) -> tuple[int, ...]:
+        """
+        Internal method returning the indexes of the options that can accept a
+        value of the given concrete type, in trial order.
+
+        The result is computed once per type and cached.
+
+        Args:
+            type_ (type): The concrete type of the value.
+
+        Returns:
+            tuple[int, ...]: The indexes of the candidate options.
+        """
+        candidates = self._candidates.get(type_)
+        if candidates is None:
+            typed_options = self._typed_options
+            candidates = tuple(
+                i
+                for i in self._order
+                if typed_options[i] is None or issubclass(type_, typed_options[i]._type)
+            )
+            self._candidates[type_] = candidates
+        return candidates
+
+    def _count_match(self, index: int, every: int) -> None:
+        """
+        Internal method counting a match of the option at `index` and
+        reordering the options every `every` matches.
+
+        Args:
+            index (int): The index of the matching option.
+            every (int): The number of matches between two reorderings.
+        """
+        with self._lock:
+            if self._frozen:
+                return
+            self._hits[index] += 1
+            self._matches += 1
+            if self._matches % every:
+                return
+            hits = self._hits
+            order = tuple(sorted(self._order, key=lambda i: (-hits[i], i)))
+            if order != self._order:
+                self._order = order
+                self._candidates = {}
+
     def _validate_union(
         self, value: Any, abort_early: bool = True, path: str = "~"
     ) -> Any:
         """
         Internal method to iterate through alternative schemas and attempt validation.
 
-        It tries to validate the `value` against each schema in `_options`.
+        It tries to validate the `value` against each schema in `_options`
+        that is compatible with the type of the value.
         If a schema successfully validates the value, that validated value is returned.
         If no schema validates the value, a `ValidationError` is raised,
-        potentially containing all the errors from the failed attempts.
+        containing an error for every option. Options skipped because of the
+        type of the value report the "type" error they would have raised.
+        In best-match mode, only the error of the closest option is attached,
+        unless every option failed its type check.
 
         Args:
             value (Any): The value to validate against the union options.
-            abort_early (bool, optional): If True, returns on the first successful
-                validation. If False, continues to collect errors from all failed
-                attempts before raising a final error if no match is found. Defaults to True.
+            abort_early (bool, optional): Passed to each option; controls
+                whether an option collects all its errors. Defaults to True.
             path (str, optional): The current path in the data structure.
                 Defaults to "~".
 
@@ -125,27 +635,63 @@ class UnionSchema(EqualityComparableSchema):
         Raises:
             ValidationError: If the value fails to validate against all alternative schemas.
         """
-        matching_value = value
-        errs: list[ValidationError] = []
-        for i, opt in enumerate(self._options):
+        if len(self._typed_options) != len(self._options):
+            # Options were assigned without `one_of()`
+            self._index_options()
+        elif self._typed_revision != rules_revision():
+            # A schema may have been reconfigured after `one_of()`
+            self._index_types()
+        best_match = self._best_match
+        best: ValidationError | None = None
+        best_score = 0
+        failed: dict[int, ValidationError] = {}
+        for i in self._candidates_for(type(value)):
             path_ = concat_path(path, i)
+            option = self._options[i]
             try:
-                matching_value = opt.validate(value, abort_early, path_)
-                # If an option successfully validates, we've found a match
-                return matching_value
+                if best is None:
+                    matching_value = option.validate(value, abort_early, path_)
+                else:
+                    # An option with as many errors as the best one has lost
+                    with error_limit(path_, best_score - 1):
+                        matching_value = option.validate(value, abort_early, path_)
             except ValidationError as err:
-                errs.append(err)
+                if budget_exceeded(err):
+                    raise
+                if best_match and err.constraint.type != "type":
+                    score = len(err._errors) or 1
+                    if best is None or score < best_score:
+                        best, best_score = err, score
+                else:
+                    failed[i] = err
+                continue
+            if self._reorder_every is not None and not self._frozen:
+                self._count_match(i, self._reorder_every)
+            return matching_value
 
-        # If we reach here and no match was found, raise a Union-specific error
-        if len(errs) >= len(
-            self._options
-        ):  # This condition will always be true if no option matched
+        if best is not None:
             raise ValidationError(
                 Constraint("one_of", locale["one_of"], path),
-                # The path passed to the constraint should reflect the current union path
                 path,
-                errs,
+                [best],
                 invalid_value=value,
             )
-        # This part should ideally not be reached if no option matched and errs were collected
-        return matching_value  # Fallback,
+
+        errs: list[ValidationError] = []
+        for i, typed in enumerate(self._typed_options):
+            if i in failed:
+                errs.append(failed[i])
+            else:
+                errs.append(
+                    ValidationError(
+                        Constraint("type", typed.message, typed._type, type(value)),
+                        concat_path(path, i),
+                        invalid_value=value,
+                    )
+                )
+        raise ValidationError(
+            Constraint("one_of", locale["one_of"], path),
+            path,
+            errs,
+            invalid_value=value,
+        )
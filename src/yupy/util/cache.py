@@ -0,0 +1,204 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from time import monotonic
+from typing import Any, NamedTuple
+
+__all__ = ("CacheInfo", "LRUCache", "TTLCache")
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a cache, like `functools.lru_cache().cache_info()`.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the share of lookups that found an entry.
+
+        Returns:
+            The hit rate, between 0 and 1 (0 if there was no lookup).
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """
+    A thread-safe, bounded mapping evicting its least recently used entries.
+
+    Lookups count hits and misses, reported by `info()`.
+
+    Attributes:
+        maxsize (int): The maximum number of entries.
+        hits (int): The number of lookups that found an entry.
+        misses (int): The number of lookups that found none.
+    """
+
+    maxsize: int
+    hits: int
+    misses: int
+    _data: OrderedDict[Hashable, Any]
+    _lock: Lock
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize: The maximum number of entries. Defaults to 1024.
+
+        Raises:
+            ValueError: If `maxsize` is less than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Looks an entry up and marks it as the most recently used.
+
+        Args:
+            key: The key of the entry.
+            default: The value returned if there is no entry.
+
+        Returns:
+            The cached value, or `default`.
+
+        Raises:
+            TypeError: If the key is not hashable.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores an entry, evicting the least recently used one if the cache is full.
+
+        Args:
+            key: The key of the entry.
+            value: The value to cache.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            The hits, misses, maximum size and current size.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTLCache(LRUCache):
+    """
+    An LRU cache whose entries also expire `ttl` seconds after being stored.
+
+    Expired entries are dropped when looked up, and otherwise evicted like
+    any other entry, so the cache never holds more than `maxsize` entries.
+
+    Attributes:
+        ttl (float): The lifetime of an entry, in seconds.
+    """
+
+    ttl: float
+    _timer: Callable[[], float]
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        timer: Callable[[], float] = monotonic,
+    ):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize: The maximum number of entries. Defaults to 1024.
+            ttl: The lifetime of an entry, in seconds. Defaults to 60.
+            timer: The clock entry lifetimes are measured with. Defaults to
+                `time.monotonic`.
+
+        Raises:
+            ValueError: If `maxsize` is less than 1 or `ttl` is not positive.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self._timer = timer
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Looks an unexpired entry up and marks it as the most recently used.
+
+        Args:
+            key: The key of the entry.
+            default: The value returned if there is no unexpired entry.
+
+        Returns:
+            The cached value, or `default`.
+
+        Raises:
+            TypeError: If the key is not hashable.
+        """
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires <= self._timer():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores an entry expiring in `ttl` seconds, evicting the least recently
+        used one if the cache is full.
+
+        Args:
+            key: The key of the entry.
+            value: The value to cache.
+        """
+        super().put(key, (self._timer() + self.ttl, value))
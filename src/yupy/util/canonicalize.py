@@ -0,0 +1,102 @@
+import dataclasses
+from typing import Any, TypeVar
+
+from yupy.adapters import SchemaAdapter
+from yupy.schema import Schema
+from yupy.util.fingerprint import _Fingerprinter, _structural_fields
+
+__all__ = ("canonicalize",)
+
+_S = TypeVar("_S")
+
+
+class _Canonicalizer:
+    """
+    Rewrites a schema tree bottom-up, replacing every schema or adapter by
+    the first one met with the same fingerprint.
+    """
+
+    _pool: dict[bytes, Any]
+    _fingerprints: _Fingerprinter
+    _done: dict[int, Any]
+
+    def __init__(self, pool: dict[bytes, Any]) -> None:
+        self._pool = pool
+        self._fingerprints = _Fingerprinter()
+        self._done = {}
+
+    def visit(self, node: Any) -> Any:
+        """
+        Canonicalizes the subschemas of a schema or adapter, then the node itself.
+
+        Args:
+            node (Any): The schema or adapter.
+
+        Returns:
+            Any: The canonical node.
+        """
+        key = id(node)
+        done = self._done.get(key)
+        if done is not None:
+            return done
+        # a node reached again through a cycle is kept as is
+        self._done[key] = node
+        if dataclasses.is_dataclass(node):
+            names: Any = _structural_fields(node)
+        else:
+            names = list(vars(node))
+        for name in names:
+            value = getattr(node, name)
+            replaced = self._replace(value)
+            if replaced is not value:
+                setattr(node, name, replaced)
+        canonical = self._pool.setdefault(self._fingerprints.digest(node), node)
+        self._done[key] = canonical
+        return canonical
+
+    def _replace(self, value: Any) -> Any:
+        """
+        Canonicalizes the schemas held by a field value, directly or in
+        lists, tuples and dict values. Containers are copied, not modified,
+        only if one of their schemas was replaced.
+        """
+        if isinstance(value, (Schema, SchemaAdapter)):
+            return self.visit(value)
+        if isinstance(value, (list, tuple)):
+            items = [self._replace(item) for item in value]
+            if all(a is b for a, b in zip(items, value)):
+                return value
+            return items if isinstance(value, list) else type(value)(items)
+        if isinstance(value, dict):
+            replaced = {k: self._replace(v) for k, v in value.items()}
+            if all(replaced[k] is v for k, v in value.items()):
+                return value
+            return replaced
+        return value
+
+
+def canonicalize(schema: _S, pool: dict[bytes, Any] | None = None) -> _S:
+    """
+    Deduplicates structurally identical subschemas of a schema tree.
+
+    Nested schemas and adapters (mapping fields, array elements, union
+    options, wrapped schemas) with the same fingerprint are replaced by a
+    single shared instance, so a subschema repeated throughout a tree (e.g.
+    an address mapping built by a factory function) is kept, and caches
+    (`memoize()`, `identity_memo()`) are filled, only once.
+
+    Shared instances are the same object: changing the rules of one of them
+    after canonicalization changes them everywhere.
+
+    Args:
+        schema (_S): The root schema or adapter. It is modified in place.
+        pool (dict[bytes, Any] | None): The canonical instances by
+            fingerprint, to share subschemas across several trees. Defaults
+            to None (a pool for this tree only).
+
+    Returns:
+        _S: The canonical root: `schema`, or the instance of `pool` with the
+            same fingerprint.
+    """
+    canonical: _S = _Canonicalizer({} if pool is None else pool).visit(schema)
+    return canonical
@@ -0,0 +1,48 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+__all__ = ("error_limit", "errors_exceeded")
+
+_error_limit: ContextVar[tuple[str, int] | None] = ContextVar(
+    "yupy_error_limit", default=None
+)
+
+
+@contextmanager
+def error_limit(path: str, limit: int) -> Iterator[None]:
+    """
+    Limits the number of errors collected by the mapping or array validated
+    at `path`, in the current context.
+
+    Once more than `limit` field or item errors are collected, the mapping
+    or array stops validating and raises the errors collected so far.
+    Nested mappings and arrays (at other paths) are not affected.
+
+    Args:
+        path: The path of the limited mapping or array.
+        limit: The maximum number of errors to collect.
+
+    Yields:
+        None
+    """
+    token = _error_limit.set((path, limit))
+    try:
+        yield
+    finally:
+        _error_limit.reset(token)
+
+
+def errors_exceeded(path: str, count: int) -> bool:
+    """
+    Checks whether `count` errors collected at `path` exceed the current limit.
+
+    Args:
+        path: The path of the mapping or array collecting errors.
+        count: The number of errors collected so far.
+
+    Returns:
+        True if validation at `path` should stop collecting errors.
+    """
+    limit = _error_limit.get()
+    return limit is not None and limit[0] == path and count > limit[1]
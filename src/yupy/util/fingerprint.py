@@ -0,0 +1,224 @@
+import dataclasses
+import re
+import struct
+from functools import partial
+from hashlib import blake2b
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+from yupy.util.cache import LRUCache, TTLCache
+
+__all__ = ("fingerprint",)
+
+_SCALARS = frozenset((type(None), bool, int, float, complex, str, bytes))
+
+_STRUCTURAL_FIELDS: dict[type, tuple[str, ...]] = {}
+"""
+The fields of dataclasses taking part in comparison, by class.
+"""
+
+
+def _structural_fields(obj: Any) -> tuple[str, ...]:
+    """
+    Returns the names of the fields of a dataclass instance that take part
+    in comparison, i.e. its structure as opposed to its runtime state.
+    """
+    cls = type(obj)
+    names = _STRUCTURAL_FIELDS.get(cls)
+    if names is None:
+        names = tuple(f.name for f in dataclasses.fields(obj) if f.compare)
+        _STRUCTURAL_FIELDS[cls] = names
+    return names
+
+
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+"""
+Regular expression finding a memory address in a `repr()`, which changes
+from one process to the next.
+"""
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """
+    Returns the names of the `__slots__` declared by a class and its bases.
+    """
+    names: list[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(n for n in slots if n not in ("__dict__", "__weakref__"))
+    return tuple(names)
+
+
+def _qualname(obj: Any) -> bytes:
+    """
+    Returns the importable name of a class, function or module.
+    """
+    module = getattr(obj, "__module__", None) or ""
+    name = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", "")
+    return f"{module}:{name}".encode()
+
+
+class _Fingerprinter:
+    """
+    Computes structural digests of schemas and of the objects they hold,
+    keeping the digest of every compound object met so that shared
+    subschemas are only walked once.
+
+    Attributes:
+        digests (dict[int, bytes]): The digests of the compound objects
+            walked, by id.
+    """
+
+    digests: dict[int, bytes]
+    _active: list[int]
+    _keep: list[Any]
+
+    def __init__(self) -> None:
+        self.digests = {}
+        self._active = []
+        # keeps the walked objects alive, so their ids aren't reused
+        self._keep = []
+
+    def digest(self, obj: Any) -> bytes:
+        """
+        Returns the digest of a compound object.
+
+        An object reached again while being walked (a cycle) is encoded by
+        its distance up the walk instead of its digest.
+
+        Args:
+            obj (Any): The object.
+
+        Returns:
+            bytes: The 16-byte digest.
+        """
+        key = id(obj)
+        known = self.digests.get(key)
+        if known is not None:
+            return known
+        if key in self._active:
+            return b"@%d" % (len(self._active) - self._active.index(key))
+        self._active.append(key)
+        try:
+            tokens = self._tokens(obj)
+        finally:
+            self._active.pop()
+        digest = blake2b(
+            b"".join(len(t).to_bytes(4, "little") + t for t in tokens), digest_size=16
+        ).digest()
+        self.digests[key] = digest
+        self._keep.append(obj)
+        return digest
+
+    def _token(self, obj: Any) -> bytes:
+        """
+        Encodes a value held by a compound object: scalars and classes by
+        value, anything else by digest.
+        """
+        if type(obj) in _SCALARS:
+            return b"%s=%r" % (type(obj).__name__.encode(), obj)
+        if isinstance(obj, (type, ModuleType)):
+            return b"type=" + _qualname(obj)
+        return b"#" + self.digest(obj)
+
+    def _tokens(self, obj: Any) -> list[bytes]:
+        """
+        Returns the tokens describing a compound object.
+        """
+        tok = self._token
+        tokens = [_qualname(type(obj))]
+        put = tokens.append
+        if isinstance(obj, (list, tuple)):
+            tokens.extend(map(tok, obj))
+        elif isinstance(obj, dict):
+            for key, value in obj.items():
+                put(tok(key))
+                put(tok(value))
+        elif isinstance(obj, (set, frozenset)):
+            tokens.extend(sorted(map(tok, obj)))
+        elif isinstance(obj, FunctionType):
+            # marshal output depends on reference counts, so code objects are
+            # encoded from their parts instead
+            put(_qualname(obj))
+            put(tok(obj.__code__))
+            put(tok(obj.__defaults__))
+            put(tok(obj.__kwdefaults__))
+            if obj.__dict__:
+                put(tok(obj.__dict__))
+            tokens.extend(tok(cell.cell_contents) for cell in obj.__closure__ or ())
+        elif isinstance(obj, CodeType):
+            put(obj.co_code)
+            tokens.extend(map(tok, obj.co_consts))
+            put(tok(obj.co_names))
+            put(tok(obj.co_varnames))
+            put(tok(obj.co_freevars))
+        elif dataclasses.is_dataclass(obj):
+            for name in _structural_fields(obj):
+                put(name.encode())
+                put(tok(getattr(obj, name)))
+        elif isinstance(obj, re.Pattern):
+            put(tok(obj.pattern))
+            put(tok(obj.flags))
+        elif isinstance(obj, struct.Struct):
+            put(tok(obj.format))
+        elif isinstance(obj, MethodType):
+            put(tok(obj.__func__))
+            put(tok(obj.__self__))
+        elif isinstance(obj, BuiltinFunctionType):
+            owner = obj.__self__
+            put(_qualname(obj))
+            if owner is not None and not isinstance(owner, (type, ModuleType)):
+                put(tok(owner))
+        elif isinstance(obj, partial):
+            put(tok(obj.func))
+            put(tok(obj.args))
+            put(tok(obj.keywords))
+        elif isinstance(obj, LRUCache):
+            # a cache is described by its settings, not its entries
+            put(tok(obj.maxsize))
+            if isinstance(obj, TTLCache):
+                put(tok(obj.ttl))
+                put(tok(obj._timer))
+        elif hasattr(obj, "__dict__"):
+            for name, value in sorted(vars(obj).items()):
+                put(name.encode())
+                put(tok(value))
+        elif slots := _slot_names(type(obj)):
+            for name in slots:
+                if hasattr(obj, name):
+                    put(name.encode())
+                    put(tok(getattr(obj, name)))
+        else:
+            try:
+                view = memoryview(obj)
+            except TypeError:
+                text = repr(obj)
+                # objects only identified by their address (sentinels, locks)
+                # are encoded by their type alone
+                if not _ADDRESS.search(text):
+                    put(text.encode())
+            else:
+                put(blake2b(view.cast("B"), digest_size=16).digest())
+        return tokens
+
+
+def fingerprint(schema: Any) -> str:
+    """
+    Computes a structural fingerprint of a schema or adapter.
+
+    The fingerprint covers everything that determines how values are
+    validated: the schema classes, types, options and nested schemas, the
+    constraints recorded by built-in rules, and for other callables their
+    code, defaults and captured values. Runtime state (caches, learned union
+    orders, counters) is left out, so schemas built the same way share a
+    fingerprint, in this process and in others running the same code.
+
+    Args:
+        schema (Any): The schema or adapter.
+
+    Returns:
+        str: The fingerprint, as 32 hexadecimal digits.
+    """
+    return _Fingerprinter().digest(schema).hex()
@@ -0,0 +1,103 @@
+from collections.abc import Mapping
+from typing import Any
+
+from yupy.adapters import ISchemaAdapter, SchemaDefaultAdapter, SchemaRequiredAdapter
+from yupy.ischema import ISchema
+
+__all__ = ("revalidate_field",)
+
+
+def _patch_target(schema: ISchema | ISchemaAdapter) -> Any:
+    """
+    Returns the schema a patch of an existing value is applied with, looking
+    through adapters that pass a present value on unchanged (`required` and
+    non-ensuring `default`).
+
+    Args:
+        schema (Union[ISchema, ISchemaAdapter]): The field or element schema.
+
+    Returns:
+        Any: The schema, or None if it is wrapped in another adapter.
+    """
+    while isinstance(schema, (SchemaRequiredAdapter, SchemaDefaultAdapter)):
+        if isinstance(schema, SchemaDefaultAdapter) and schema._ensure:
+            return None
+        schema = schema.schema
+    return schema
+
+
+def _apply_patch(previous: Any, change: Mapping) -> Any:
+    """
+    Applies a patch to a copy of a mapping or array, recursively for mapping
+    changes of nested mappings and arrays.
+
+    Args:
+        previous (Any): The mapping, list or tuple to patch. It is not modified.
+        change (Mapping): The changes, by key or index.
+
+    Returns:
+        Any: The patched copy (a dict, or an array of the type of `previous`).
+
+    Raises:
+        TypeError: If an array is patched with a non-integer index.
+        IndexError: If an index is out of range.
+    """
+    if isinstance(previous, Mapping):
+        patched: Any = dict(previous)
+        has = patched.__contains__
+    else:
+        patched = list(previous)
+        if not all(isinstance(index, int) for index in change):
+            raise TypeError("changes must be a mapping of indexes")
+        has = range(-len(patched), len(patched)).__contains__
+    for key, value in change.items():
+        if (
+            isinstance(value, Mapping)
+            and has(key)
+            and isinstance(patched[key], (Mapping, list, tuple))
+        ):
+            value = _apply_patch(patched[key], value)
+        patched[key] = value
+    return patched if isinstance(previous, (Mapping, list)) else type(previous)(patched)
+
+
+def revalidate_field(
+    schema: ISchema | ISchemaAdapter,
+    previous: Any,
+    change: Any,
+    abort_early: bool,
+    path: str,
+) -> Any:
+    """
+    Validates the new value of a field or element from its previously
+    validated value and a change.
+
+    A mapping change applied to a previous mapping (or array) is a patch:
+    if the schema has a `revalidate()` method (`MappingSchema`,
+    `ArraySchema`), only the patched keys (or indexes) are validated.
+    Otherwise (e.g. a union or an immutable field) the patch is applied to a
+    copy of the previous value, which is validated as a whole. Any other
+    change replaces the value and is validated as a whole.
+
+    Args:
+        schema (Union[ISchema, ISchemaAdapter]): The field or element schema.
+        previous (Any): The previously validated value.
+        change (Any): The change.
+        abort_early (bool): If True, validation stops on the first error.
+        path (str): The path of the value.
+
+    Returns:
+        Any: The validated new value.
+
+    Raises:
+        TypeError: If an array is patched with a non-integer index.
+        IndexError: If an index is out of range.
+        ValidationError: If the new value fails validation.
+    """
+    if isinstance(change, Mapping) and isinstance(previous, (Mapping, list, tuple)):
+        target = _patch_target(schema)
+        revalidate = getattr(target, "revalidate", None)
+        if revalidate is not None and isinstance(previous, target._type):
+            return revalidate(previous, change, abort_early, path)
+        change = _apply_patch(previous, change)
+    return schema.validate(change, abort_early, path)
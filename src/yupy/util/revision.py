@@ -0,0 +1,27 @@
+__all__ = ("rules_changed", "rules_revision")
+
+_rules_revision = 0
+"""
+Counts the transforms added to schemas and the defaults adapters were told to
+ensure, the changes that alter how a schema treats a value before its type check.
+"""
+
+
+def rules_changed() -> None:
+    """
+    Records that a schema got a transform or a default adapter got `ensure()`d.
+    """
+    global _rules_revision
+    _rules_revision += 1
+
+
+def rules_revision() -> int:
+    """
+    Returns the number of changes recorded by `rules_changed()`, so indexes
+    built from the type checks of schemas (see `UnionSchema`) can tell when
+    they are stale with a single comparison.
+
+    Returns:
+        int: The current revision.
+    """
+    return _rules_revision
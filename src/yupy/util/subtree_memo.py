@@ -0,0 +1,99 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Protocol
+
+from yupy.locale import locale
+from yupy.validation_error import Constraint, ValidationError
+
+__all__ = ("identity_memo", "validate_once")
+
+
+class _Subtree(Protocol):
+    def _validate(self, value: Any, abort_early: bool, path: str) -> Any: ...
+
+
+_ACTIVE = object()
+"""
+The entry of a (value, schema) pair being validated.
+"""
+
+_visit: ContextVar[dict[tuple[int, int], Any] | None] = ContextVar(
+    "yupy_subtree_memo", default=None
+)
+"""
+The (value, schema) pairs met in the current `identity_memo()` context:
+`_ACTIVE` while being validated, then the value and its result. Values are
+kept referenced until the context ends, so their ids can't be reused in the meantime.
+"""
+
+
+@contextmanager
+def identity_memo() -> Iterator[None]:
+    """
+    Validates every mapping and array object at most once per schema in the
+    current context.
+
+    A mapping or array object met again while validating (e.g. a dict shared
+    by several parents, as produced by YAML anchors or in-memory object
+    graphs) gets the result of its first validation instead of being
+    validated again, and an object reached again while it is being validated
+    (a cycle) is rejected with a "cycle" error instead of recursing until
+    `RecursionError`.
+
+    Payloads decoded from JSON never share objects, so this is opt-in.
+
+    Yields:
+        None
+    """
+    if _visit.get() is not None:
+        yield
+        return
+    token = _visit.set({})
+    try:
+        yield
+    finally:
+        _visit.reset(token)
+
+
+def validate_once(schema: _Subtree, value: Any, abort_early: bool, path: str) -> Any:
+    """
+    Validates a mapping or array, at most once per schema within
+    `identity_memo()`.
+
+    Failures are not remembered: each occurrence of an invalid value reports
+    its own errors, at its own path.
+
+    Args:
+        schema: The mapping or array schema, validating with `_validate()`.
+        value: The value to validate.
+        abort_early: If True, validation stops on the first error.
+        path: The path of the value.
+
+    Returns:
+        The validated value.
+
+    Raises:
+        ValidationError: With a "cycle" constraint if `value` contains itself,
+            or any error raised by `schema._validate()`.
+    """
+    visit = _visit.get()
+    if visit is None:
+        return schema._validate(value, abort_early, path)
+
+    key = (id(value), id(schema))
+    seen = visit.get(key)
+    if seen is _ACTIVE:
+        raise ValidationError(
+            Constraint("cycle", locale["cycle"]), path, invalid_value=value
+        )
+    if seen is not None:
+        return seen[1]
+    visit[key] = _ACTIVE
+    try:
+        result = schema._validate(value, abort_early, path)
+    except BaseException:
+        del visit[key]
+        raise
+    visit[key] = (value, result)
+    return result
@@ -0,0 +1,92 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+from yupy.locale import ErrorMessage, locale
+from yupy.validation_error import Constraint, ValidationError
+
+__all__ = ("budget_exceeded", "budget_expiry", "check_time_budget", "time_budget")
+
+_time_budget: ContextVar[tuple[float, float, ErrorMessage] | None] = ContextVar(
+    "yupy_time_budget", default=None
+)
+"""
+The current budget: its expiry time (on the `time.monotonic()` clock), its
+length in milliseconds and its error message.
+"""
+
+
+@contextmanager
+def time_budget(ms: float, message: ErrorMessage = locale["budget"]) -> Iterator[None]:
+    """
+    Limits the time spent validating in the current context.
+
+    Once `ms` milliseconds have elapsed, array, mapping and binary record
+    validation stops at the next element, field or record, and `matches()`
+    rules stop before running their pattern, with a "budget" error. The
+    error is raised even when errors are collected (`abort_early=False`).
+
+    Budgets nest: an inner budget can only shorten the current one.
+
+    Args:
+        ms: The time budget in milliseconds.
+        message: The error message to use once the budget is exhausted.
+            Defaults to the locale-defined message for "budget".
+
+    Yields:
+        None
+    """
+    expires = monotonic() + ms / 1000
+    current = _time_budget.get()
+    if current is not None and current[0] <= expires:
+        yield
+        return
+    token = _time_budget.set((expires, ms, message))
+    try:
+        yield
+    finally:
+        _time_budget.reset(token)
+
+
+def budget_expiry() -> float | None:
+    """
+    Returns when the current time budget expires, on the `time.monotonic()`
+    clock, so loops can skip `check_time_budget()` when there is no budget.
+
+    Returns:
+        The expiry time, or None if there is no time budget.
+    """
+    current = _time_budget.get()
+    return None if current is None else current[0]
+
+
+def check_time_budget(path: str = "~") -> None:
+    """
+    Raises a "budget" error if the current time budget is exhausted.
+
+    Args:
+        path: The path validation stopped at.
+
+    Raises:
+        ValidationError: If the current time budget is exhausted.
+    """
+    current = _time_budget.get()
+    if current is not None and monotonic() > current[0]:
+        raise ValidationError(Constraint("budget", current[2], current[1]), path)
+
+
+def budget_exceeded(err: ValidationError) -> bool:
+    """
+    Checks whether an error was raised because the time budget is exhausted.
+
+    Such errors must be propagated instead of being collected or handled
+    as an ordinary validation failure.
+
+    Args:
+        err: The validation error.
+
+    Returns:
+        True if the error is a "budget" error.
+    """
+    return err.constraint.type == "budget"
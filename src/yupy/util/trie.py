@@ -0,0 +1,168 @@
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+__all__ = ("AhoCorasick", "PrefixTrie")
+
+_END = ""
+"""
+The key marking the end of a word in a trie node. Node keys are otherwise
+single characters, so it can't collide with them.
+"""
+
+
+class PrefixTrie:
+    """
+    A character trie answering whether a string starts (or, if built with
+    `reverse=True`, ends) with any of a set of words.
+
+    A lookup walks the trie along the string once and stops at the first
+    complete word, so its cost only depends on the length of the longest
+    word, not on the number of words.
+
+    Attributes:
+        reverse (bool): If True, the trie matches suffixes instead of prefixes.
+        longest (int): The length of the longest word.
+    """
+
+    reverse: bool
+    longest: int
+    _root: dict[str, Any]
+
+    def __init__(self, words: Iterable[str], reverse: bool = False):
+        """
+        Builds the trie.
+
+        Args:
+            words: The prefixes (or suffixes) to match.
+            reverse: If True, match suffixes instead of prefixes.
+        """
+        self.reverse = reverse
+        self.longest = 0
+        self._root = {}
+        for word in words:
+            node = self._root
+            for char in reversed(word) if reverse else word:
+                node = node.setdefault(char, {})
+            node[_END] = word
+            self.longest = max(self.longest, len(word))
+
+    def match(self, value: str) -> str | None:
+        """
+        Finds the shortest word that `value` starts (or ends) with.
+
+        Args:
+            value: The string to look up.
+
+        Returns:
+            The matching word, or None if there is none.
+        """
+        node = self._root
+        for char in reversed(value) if self.reverse else value:
+            if _END in node:
+                break
+            next_node = node.get(char)
+            if next_node is None:
+                return None
+            node = next_node
+        return node.get(_END)
+
+    def walk(self, node: dict[str, Any] | None, chunk: str) -> Any:
+        """
+        Continues a prefix lookup with the next chunk of a string.
+
+        Args:
+            node: The node reached so far (None to start at the root).
+            chunk: The next chunk of the string.
+
+        Returns:
+            The matching word (a `str`) once one is complete, the node reached
+            at the end of the chunk (a `dict`), or None if no word can match.
+        """
+        if node is None:
+            node = self._root
+        for char in chunk:
+            if _END in node:
+                return node[_END]
+            node = node.get(char)
+            if node is None:
+                return None
+        return node.get(_END, node)
+
+
+class AhoCorasick:
+    """
+    An Aho-Corasick automaton finding occurrences of any of a set of words
+    in a single linear pass over a string, whatever the number of words.
+
+    States are integers; `search()` can resume from a previous state, so a
+    string can be scanned chunk by chunk.
+    """
+
+    _goto: list[dict[str, int]]
+    _fail: list[int]
+    _out: list[str | None]
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Builds the automaton.
+
+        Args:
+            words: The words to find.
+        """
+        goto: list[dict[str, int]] = [{}]
+        out: list[str | None] = [None]
+        for word in words:
+            state = 0
+            for char in word:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    out.append(None)
+                state = next_state
+            if out[state] is None:
+                out[state] = word
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(char, 0)
+                if out[child] is None:
+                    # Report the longest word that is a suffix of this one
+                    out[child] = out[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def search(self, value: str, state: int = 0) -> tuple[int, str | None]:
+        """
+        Scans a string for the first occurrence of any word.
+
+        Args:
+            value: The string (or chunk of string) to scan.
+            state: The state to resume from. Defaults to the initial state.
+
+        Returns:
+            The state reached, and the first word found or None.
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        if out[state] is not None:
+            return state, out[state]
+        for char in value:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state] is not None:
+                return state, out[state]
+        return state, None
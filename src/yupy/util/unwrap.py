@@ -0,0 +1,20 @@
+from yupy.adapters import ISchemaAdapter, SchemaAdapter
+from yupy.ischema import ISchema
+
+__all__ = ("unwrap",)
+
+
+def unwrap(schema: ISchema | ISchemaAdapter) -> ISchema | ISchemaAdapter:
+    """
+    Returns the innermost schema wrapped by a chain of adapters.
+
+    Args:
+        schema: The schema or adapter to unwrap.
+
+    Returns:
+        The first non-adapter schema in the chain, or `schema` itself if it
+        is not an adapter.
+    """
+    while isinstance(schema, SchemaAdapter):
+        schema = schema.schema
+    return schema
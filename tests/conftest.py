@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.fixture
+def rules():
+    """
+    Returns a helper listing the validators of a schema: built-in rules as
+    (type, args) pairs, custom tests as themselves.
+    """
+
+    def _rules(schema):
+        return [
+            (c.type, c.args) if (c := getattr(v, "constraint", None)) else v
+            for v in schema._validators
+        ]
+
+    return _rules
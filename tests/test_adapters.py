@@ -0,0 +1,205 @@
+import re
+import time
+
+import pytest
+
+from yupy.adapters import SchemaBudgetAdapter, SchemaDefaultAdapter, SchemaJsonAdapter
+from yupy.array_schema import ArraySchema
+from yupy.mapping_schema import MappingSchema
+from yupy.number_schema import NumberSchema
+from yupy.string_schema import StringSchema
+from yupy.union_schema import UnionSchema
+from yupy.util.cache import LRUCache
+from yupy.util.time_budget import time_budget
+from yupy.validation_error import ValidationError
+
+
+# region SchemaJsonAdapter limits
+def test_json_adapter_without_limits():
+    schema = SchemaJsonAdapter(ArraySchema())
+    assert schema.validate("[[1], [2]]") == [[1], [2]]
+
+
+def test_json_adapter_max_bytes():
+    schema = SchemaJsonAdapter(ArraySchema(), max_bytes=8)
+    assert schema.validate(b"[1, 2]") == [1, 2]
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(b"[1, 2, 3, 4]")
+    assert excinfo.value.constraint.type == "json_limit"
+    assert excinfo.value.constraint.args == ("max_bytes", 8)
+    assert excinfo.value.path == "~"
+
+
+def test_json_adapter_max_depth_rejects_before_parsing():
+    schema = SchemaJsonAdapter(ArraySchema(), max_depth=32)
+    assert schema.validate("[[[]]]") == [[[]]]
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("[" * 10_000 + "]" * 10_000)
+    assert excinfo.value.constraint.type == "json_limit"
+    assert excinfo.value.constraint.args == ("max_depth", 32)
+    assert (
+        excinfo.value.constraint.format_message
+        == "JSON payload exceeds max_depth of 32"
+    )
+
+
+def test_json_adapter_max_items():
+    schema = SchemaJsonAdapter(
+        MappingSchema().shape({"a": ArraySchema().of(NumberSchema())}), max_items=4
+    )
+    assert schema.validate('{"a": [1, 2, 3]}') == {"a": [1, 2, 3]}
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate('{"a": [1, 2, 3, 4]}')
+    assert excinfo.value.constraint.args == ("max_items", 4)
+
+
+def test_json_adapter_limits_ignore_string_contents():
+    schema = SchemaJsonAdapter(ArraySchema(), max_depth=1, max_items=1)
+    assert schema.validate('["[[[,,,]]]"]') == ["[[[,,,]]]"]
+
+
+# endregion
+
+
+# region SchemaJsonAdapter keys
+def test_json_adapter_reject_duplicate_keys():
+    schema = SchemaJsonAdapter(
+        MappingSchema().shape({"a": NumberSchema()}), reject_duplicate_keys=True
+    )
+    assert schema.validate('{"a": 1}') == {"a": 1}
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate('{"a": 1, "a": 2}')
+    assert excinfo.value.constraint.type == "duplicate_key"
+    assert excinfo.value.path == "~"
+    assert excinfo.value.invalid_value == '{"a": 1, "a": 2}'
+
+
+def test_json_adapter_intern_keys():
+    key = b"name".decode()
+    item = MappingSchema().shape({key: StringSchema()})
+    schema = SchemaJsonAdapter(ArraySchema().of(item), intern_keys=True)
+    assert schema._intern_keys == {"name": "name"}
+    result = schema.validate('[{"name": "a"}, {"name": "b"}]')
+    assert all(next(iter(obj)) is key for obj in result)
+
+
+# endregion
+
+
+# region SchemaJsonAdapter cache
+def _counting_schema(calls):
+    return ArraySchema().of(
+        MappingSchema().shape({"id": NumberSchema().test(calls.append)})
+    )
+
+
+def test_json_adapter_cache_skips_identical_payloads():
+    calls = []
+    cache = LRUCache(8)
+    schema = SchemaJsonAdapter(_counting_schema(calls), cache=cache)
+    first = schema.validate(b'[{"id": 1}, {"id": 2}]')
+    second = schema.validate(bytearray(b'[{"id": 1}, {"id": 2}]'))
+    assert second is first
+    assert first == ({"id": 1}, {"id": 2})
+    assert calls == [1, 2]
+    assert cache.info().hits == 1
+    with pytest.raises(TypeError):
+        first[0]["id"] = 3
+
+
+def test_json_adapter_cache_keeps_errors():
+    calls = []
+    schema = SchemaJsonAdapter(_counting_schema(calls), cache=LRUCache(8))
+    for _ in range(2):
+        with pytest.raises(ValidationError) as excinfo:
+            schema.validate('[{"id": "x"}]')
+        assert excinfo.value.constraint.type == "type"
+        assert excinfo.value.path == "~/[0]/id"
+    with pytest.raises(ValidationError):
+        schema.validate('[{"id": "x"}]', path="~/body")
+    assert schema._cache.info().misses == 2
+
+
+def test_json_adapter_cache_verify_rejects_digest_collisions(monkeypatch):
+    import yupy.adapters
+
+    class _Digest:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def digest(self):
+            return b"collision"
+
+    schema = SchemaJsonAdapter(ArraySchema(), cache=LRUCache(8), verify=True)
+    monkeypatch.setattr(yupy.adapters.hashlib, "blake2b", _Digest)
+    assert schema.validate("[1]") == (1,)
+    assert schema.validate("[2]") == (2,)
+
+
+# endregion
+
+
+# region SchemaBudgetAdapter
+def _slow(x):
+    time.sleep(0.002)
+
+
+def test_budget_adapter_passes_within_budget():
+    schema = SchemaBudgetAdapter(ArraySchema().of(NumberSchema()), 1000)
+    assert schema.validate([1, 2, 3]) == [1, 2, 3]
+
+
+def test_budget_adapter_rejects_invalid_ms():
+    with pytest.raises(ValueError):
+        SchemaBudgetAdapter(ArraySchema(), 0)
+
+
+@pytest.mark.parametrize("abort_early", [True, False])
+def test_budget_adapter_stops_array_at_element_boundary(abort_early):
+    schema = SchemaBudgetAdapter(ArraySchema().of(NumberSchema().test(_slow)), 10)
+    start = time.monotonic()
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(list(range(1000)), abort_early)
+    assert time.monotonic() - start < 0.5
+    assert excinfo.value.constraint.type == "budget"
+    assert excinfo.value.constraint.args == (10,)
+    assert excinfo.value.path.startswith("~/[")
+    assert excinfo.value.path != "~/[0]"
+
+
+def test_budget_adapter_is_not_collected_by_nested_mappings():
+    item = MappingSchema().shape({"a": NumberSchema().test(_slow), "b": NumberSchema()})
+    schema = SchemaBudgetAdapter(
+        MappingSchema().shape({"items": ArraySchema().of(item)}), 10
+    )
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate({"items": [{"a": i, "b": "x"} for i in range(1000)]}, False)
+    assert excinfo.value.constraint.type == "budget"
+    assert excinfo.value.path.startswith("~/items/[")
+
+
+def test_budget_adapter_is_not_handled_by_union_or_ensure():
+    option = ArraySchema().of(NumberSchema().test(_slow))
+    union = UnionSchema().one_of([option, ArraySchema()])
+    schema = SchemaBudgetAdapter(SchemaDefaultAdapter([], union).ensure(), 10)
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(list(range(1000)))
+    assert excinfo.value.constraint.type == "budget"
+
+
+def test_budget_adapter_checks_matches_patterns():
+    schema = StringSchema().test(_slow).matches(re.compile(r"\w+"))
+    with time_budget(1), pytest.raises(ValidationError) as excinfo:
+        schema.validate("abc", path="~/name")
+    assert excinfo.value.constraint.type == "budget"
+    assert excinfo.value.path == "~/name"
+
+
+def test_nested_budgets_keep_the_shortest():
+    schema = SchemaBudgetAdapter(ArraySchema().of(NumberSchema().test(_slow)), 1000)
+    with time_budget(10), pytest.raises(ValidationError) as excinfo:
+        schema.validate(list(range(1000)))
+    assert excinfo.value.constraint.args == (10,)
+
+
+# endregion
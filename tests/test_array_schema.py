@@ -238,3 +238,82 @@ def test_array_schema_inherited_max_failure():
     assert excinfo.value.constraint.type == "max"
     assert excinfo.value.invalid_value == [1, 2, 3, 4]
     assert excinfo.value.constraint.format_message == "Max length must be 3"
+
+
+def test_revalidate_only_validates_changed_elements():
+    calls = []
+    schema = ArraySchema().of(NumberSchema().test(calls.append)).max(3)
+    previous = schema.validate((1, 2, 3))
+    calls.clear()
+    assert schema.revalidate(previous, {0: 5, -1: 6}) == (5, 2, 6)
+    assert calls == [5, 6]
+    assert previous == (1, 2, 3)
+
+
+def test_revalidate_rejects_invalid_elements_and_indexes():
+    schema = ArraySchema().of(NumberSchema())
+    previous = schema.validate([1, 2])
+    with pytest.raises(ValidationError) as excinfo:
+        schema.revalidate(previous, {1: "x"})
+    assert excinfo.value.path == "~/[1]"
+    with pytest.raises(IndexError):
+        schema.revalidate(previous, {2: 3})
+    with pytest.raises(TypeError):
+        schema.revalidate(previous, {"0": 3})
+
+
+def test_checkpoint_only_validates_appended_elements():
+    calls = []
+    schema = ArraySchema().of(NumberSchema().test(calls.append)).max(4)
+    checkpoint = schema.checkpoint()
+    buffer = [1, 2]
+    assert checkpoint.validate(buffer) == [1, 2]
+    buffer += [3, 4]
+    assert checkpoint.validate(buffer) == [1, 2, 3, 4]
+    assert calls == [1, 2, 3, 4]
+    assert checkpoint.count == 4
+
+    buffer.append(5)
+    with pytest.raises(ValidationError) as excinfo:
+        checkpoint.validate(buffer)
+    assert excinfo.value.constraint.type == "max"
+    assert checkpoint.count == 4
+
+
+def test_checkpoint_does_not_advance_on_invalid_elements():
+    schema = ArraySchema().of(NumberSchema())
+    checkpoint = schema.checkpoint()
+    checkpoint.validate([1, 2])
+    with pytest.raises(ValidationError) as excinfo:
+        checkpoint.validate([1, 2, "x"])
+    assert excinfo.value.path == "~/[2]"
+    assert checkpoint.count == 2
+
+
+def test_checkpoint_revalidates_replaced_arrays():
+    calls = []
+    checkpoint = ArraySchema().of(NumberSchema().test(calls.append)).checkpoint()
+    checkpoint.validate((1, 2))
+    assert checkpoint.validate((3, 4, 5)) == (3, 4, 5)
+    assert calls == [1, 2, 3, 4, 5]
+    checkpoint.reset()
+    checkpoint.validate((3, 4, 5))
+    assert calls == [1, 2, 3, 4, 5, 3, 4, 5]
+
+
+def test_checkpoint_returns_read_only_views():
+    checkpoint = ArraySchema().of(StringSchema().transform(str.upper)).checkpoint()
+    buffer = ["a", "b"]
+    first = checkpoint.validate(buffer)
+    buffer.append("c")
+    second = checkpoint.validate(buffer)
+    assert first == ["A", "B"]
+    assert first != ("A", "B")
+    assert second == ["A", "B", "C"]
+    assert (len(second), second[-1], second[1:]) == (3, "C", ["B", "C"])
+    assert list(second) == ["A", "B", "C"]
+    with pytest.raises(IndexError):
+        first[2]
+    with pytest.raises(TypeError):
+        second[0] = "x"
+    assert checkpoint.validate(tuple(buffer))[:2] == ("A", "B")
@@ -0,0 +1,127 @@
+import mmap
+import struct
+
+import pytest
+
+from yupy.binary_record_schema import BinaryRecordSchema
+from yupy.number_schema import NumberSchema
+from yupy.string_schema import StringSchema
+from yupy.validation_error import ValidationError
+
+_LAYOUT = struct.Struct("<Ih6s2x")
+
+
+@pytest.fixture
+def schema():
+    return BinaryRecordSchema().layout(
+        {
+            "id": ("I", NumberSchema().ge(1)),
+            "temp": ("h", NumberSchema().ge(-400).le(1250)),
+            "name": ("6s", StringSchema().min(1).lowercase()),
+            "_pad": ("2x", None),
+        }
+    )
+
+
+def _pack(id_, temp, name):
+    return _LAYOUT.pack(id_, temp, name)
+
+
+def test_binary_record_schema_layout(schema):
+    assert schema.size == _LAYOUT.size
+    assert schema.names == ("id", "temp", "name")
+
+
+def test_binary_record_schema_validate_single_record(schema):
+    record = _pack(1, 215, b"abc")
+    assert schema.validate(record) is record
+
+
+def test_binary_record_schema_validate_field_failure(schema):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(_pack(0, 215, b"abc"))
+    assert excinfo.value.constraint.type == "ge"
+    assert excinfo.value.path == "~/id"
+    assert excinfo.value.invalid_value == 0
+
+
+def test_binary_record_schema_string_fields_are_decoded(schema):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(_pack(1, 0, b"ABC"))
+    assert excinfo.value.constraint.type == "lowercase"
+    assert excinfo.value.invalid_value == "ABC"
+
+
+def test_binary_record_schema_undecodable_string_field(schema):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(_pack(1, 0, b"a\xffb"))
+    assert excinfo.value.constraint.type == "type"
+    assert excinfo.value.path == "~/name"
+    assert excinfo.value.invalid_value == b"a\xffb\0\0\0"
+
+
+def test_binary_record_schema_undecodable_string_field_collected(schema):
+    buffer = _pack(1, 0, b"\xff") + _pack(0, 0, b"a")
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate_records(buffer, abort_early=False)
+    paths = [e.path for e in excinfo.value.errors]
+    assert "~/[0]/name" in paths
+    assert "~/[1]/id" in paths
+
+
+def test_binary_record_schema_wrong_size(schema):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(b"\x00" * 3)
+    assert excinfo.value.constraint.type == "length"
+
+
+def test_binary_record_schema_wrong_type(schema):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("not bytes")
+    assert excinfo.value.constraint.type == "type"
+
+
+def test_binary_record_schema_validate_records(schema):
+    buffer = b"".join(_pack(i, i, b"dev") for i in range(1, 101))
+    assert schema.validate_records(buffer) == 100
+    assert schema.validate_records(memoryview(buffer)) == 100
+
+
+def test_binary_record_schema_validate_records_from_mmap(schema):
+    buffer = b"".join(_pack(i, i, b"dev") for i in range(1, 11))
+    with mmap.mmap(-1, len(buffer)) as mm:
+        mm.write(buffer)
+        assert schema.validate_records(mm) == 10
+
+
+def test_binary_record_schema_validate_records_collects_errors(schema):
+    buffer = _pack(1, 0, b"ok") + _pack(0, 0, b"ok") + _pack(2, 5000, b"ok")
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate_records(buffer, abort_early=False)
+    assert excinfo.value.constraint.type == "array"
+    paths = [e.path for e in excinfo.value.errors]
+    assert "~/[1]/id" in paths
+    assert "~/[2]/temp" in paths
+
+
+def test_binary_record_schema_validate_records_partial_buffer(schema):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate_records(_pack(1, 0, b"ok") + b"\x00")
+    assert excinfo.value.constraint.type == "multiple_of"
+
+
+def test_binary_record_schema_iter_records(schema):
+    buffer = _pack(1, -5, b"a") + _pack(2, 7, b"b")
+    assert list(schema.iter_records(buffer)) == [(1, -5, "a"), (2, 7, "b")]
+
+
+def test_binary_record_schema_invalid_format():
+    with pytest.raises(ValueError):
+        BinaryRecordSchema().layout({"a": ("2I", NumberSchema())})
+    with pytest.raises(ValueError):
+        BinaryRecordSchema().layout({"a": ("Q?", None)})
+
+
+def test_binary_record_schema_invalid_field_schema():
+    with pytest.raises(TypeError):
+        BinaryRecordSchema().layout({"a": ("I", "not a schema")})
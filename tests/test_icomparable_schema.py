@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from yupy.icomparable_schema import (
@@ -246,3 +248,74 @@ def test_icomparable_schema_protocol_conformance():
 
     assert not isinstance(NotComparableSchema(), IEqualityComparableSchema)
     assert not isinstance(NotComparableSchema(), IComparableSchema)
+
+
+def test_optimize_keeps_tightest_bounds(rules):
+    schema = ComparableSchema().ge(0).ge(5).gt(5).le(20).lt(30).optimize()
+    assert rules(schema) == [("gt", (5,)), ("le", (20,))]
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(5)
+    assert excinfo.value.constraint.type == "gt"
+    assert schema.validate(20) == 20
+
+
+def test_optimize_removes_duplicaterules(rules):
+    schema = EqualityComparableSchema().ne(1).ne(1).ne(2).optimize()
+    assert rules(schema) == [("ne", (1,)), ("ne", (2,))]
+
+
+def test_optimize_keeps_custom_tests():
+    def custom(x):
+        pass
+
+    schema = ComparableSchema().test(custom).ge(1).test(custom).optimize()
+    assert schema._validators.count(custom) == 2
+
+
+def test_optimize_rejects_empty_range(rules):
+    with pytest.raises(ValueError, match="gt\\(5\\) contradicts le\\(5\\)"):
+        ComparableSchema().gt(5).le(5).optimize()
+    with pytest.raises(ValueError, match="ge\\(6\\) contradicts le\\(5\\)"):
+        ComparableSchema().ge(6).le(5).optimize("~/age")
+    assert rules(ComparableSchema().ge(5).le(5).optimize()) == [
+        ("ge", (5,)),
+        ("le", (5,)),
+    ]
+
+
+def _root(x):
+    math.sqrt(x)
+
+
+def test_optimize_keeps_bounds_guarding_custom_tests(rules):
+    schema = ComparableSchema().ge(0).test(_root).ge(5).optimize()
+    assert rules(schema) == [("ge", (0,)), _root, ("ge", (5,))]
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(-1)
+    assert excinfo.value.constraint.args == (0,)
+
+    schema = ComparableSchema().ge(5).test(_root).ge(0).le(9).optimize()
+    assert rules(schema) == [("ge", (5,)), _root, ("le", (9,))]
+
+
+def test_optimize_keeps_custom_messages(rules):
+    schema = ComparableSchema().ge(0, "negative").ge(5).optimize()
+    assert rules(schema) == [("ge", (0,)), ("ge", (5,))]
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(-1)
+    assert excinfo.value.constraint.format_message == "negative"
+    schema = ComparableSchema().ge(0, "too low").ge(5, "too low").optimize()
+    assert rules(schema) == [("ge", (5,))]
+    assert rules(ComparableSchema().ge(5).ge(0, "never shown").optimize()) == [
+        ("ge", (5,))
+    ]
+
+
+def test_optimize_ignores_nan_limits(rules):
+    nan = float("nan")
+    schema = ComparableSchema().ge(nan).ge(5).optimize()
+    assert rules(schema)[1] == ("ge", (5,))
+    assert len(rules(schema)) == 2
+    with pytest.raises(ValidationError):
+        schema.validate(-100)
+    assert len(rules(ComparableSchema().le(5).le(nan).le(9).optimize())) == 2
@@ -0,0 +1,160 @@
+import math
+
+import pytest
+
+from yupy.imemo_schema import IMemoSchema, MemoSchema
+from yupy.membership_store import BloomFilterStore
+from yupy.number_schema import NumberSchema
+from yupy.schema import Schema
+from yupy.string_schema import StringSchema
+from yupy.util.cache import CacheInfo, LRUCache
+from yupy.validation_error import ValidationError
+
+
+def test_memo_schema_inheritance():
+    """Test that MemoSchema inherits from Schema and implements IMemoSchema."""
+    schema = MemoSchema()
+    assert isinstance(schema, Schema)
+    assert isinstance(schema, IMemoSchema)
+    assert isinstance(StringSchema(), MemoSchema)
+    assert isinstance(NumberSchema(), MemoSchema)
+
+
+def test_not_memoized_by_default():
+    schema = StringSchema().min(1)
+    assert schema.memo_info is None
+    assert not schema.memoized
+    assert schema.validate("a") == "a"
+
+
+def test_memoize_caches_results():
+    calls = []
+
+    schema = StringSchema().transform(_counting(calls, str.strip)).lowercase()
+    schema.memoize(maxsize=8)
+    assert schema.memoized
+    for _ in range(3):
+        assert schema.validate(" active ") == "active"
+    assert len(calls) == 1
+    assert schema.memo_info == CacheInfo(2, 1, 8, 1)
+
+
+def _counting(calls, func):
+    def _(x):
+        calls.append(x)
+        return func(x)
+
+    _.pure = True
+    return _
+
+
+def test_memoize_with_pure_user_transforms():
+    calls = []
+
+    def strip(x):
+        calls.append(x)
+        return x.strip()
+
+    schema = StringSchema().transform(strip, pure=True).lowercase().memoize(maxsize=8)
+    assert schema.memoized
+    for _ in range(3):
+        assert schema.validate(" active ") == "active"
+    assert len(calls) == 1
+
+
+def test_memoize_with_pure_user_tests():
+    calls = []
+    schema = NumberSchema().test(calls.append, pure=True, cost=5).memoize()
+    assert schema.memoized
+    schema.validate(3)
+    schema.validate(3)
+    assert calls == [3]
+
+
+def test_memoize_caches_failures():
+    schema = NumberSchema().positive().memoize()
+    for path in ("~/a", "~/b"):
+        with pytest.raises(ValidationError) as excinfo:
+            schema.validate(-1, path=path)
+        assert excinfo.value.constraint.type == "gt"
+        assert excinfo.value.path == path
+        assert excinfo.value.invalid_value == -1
+    assert schema.memo_info.hits == 1
+
+
+def test_memoize_keys_on_type():
+    schema = NumberSchema().memoize()
+    assert type(schema.validate(1)) is int
+    assert type(schema.validate(1.0)) is float
+    assert schema.validate(True) is True
+    assert schema.memo_info.currsize == 3
+
+
+def test_memoize_keys_on_float_sign():
+    schema = NumberSchema().transform(lambda x: math.copysign(1.0, x), pure=True)
+    schema.memoize()
+    assert schema.validate(0.0) == 1.0
+    assert schema.validate(-0.0) == -1.0
+    assert schema.memo_info.currsize == 2
+
+
+def test_memoize_mutable_store_is_not_pure():
+    allowed = {1}
+    schema = NumberSchema().member_of(allowed).memoize()
+    assert not schema.memoized
+    schema.validate(1)
+    allowed.discard(1)
+    with pytest.raises(ValidationError):
+        schema.validate(1)
+    assert NumberSchema().member_of(frozenset({1})).memoize().memoized
+    store = BloomFilterStore([1], exact=allowed)
+    assert not NumberSchema().not_member_of(store).memoize().memoized
+
+
+def test_memoize_skips_none():
+    schema = StringSchema().nullable().memoize()
+    assert schema.validate(None) is None
+    assert schema.memo_info.currsize == 0
+
+
+def test_memoize_disabled_by_user_callables():
+    calls = []
+    schema = StringSchema().memoize()
+    assert schema.memoized
+    schema.test(calls.append)
+    assert not schema.memoized
+    schema.validate("a")
+    schema.validate("a")
+    assert calls == ["a", "a"]
+    assert schema.memo_info.currsize == 0
+
+
+def test_memoize_cleared_when_rules_change():
+    schema = StringSchema().memoize()
+    assert schema.validate("ab") == "ab"
+    schema.max(1)
+    with pytest.raises(ValidationError):
+        schema.validate("ab")
+
+
+def test_memoize_cleared_when_optimize_replaces_rules():
+    schema = NumberSchema().ge(0).memoize()
+    assert schema.validate(3) == 3
+    schema = schema.ge(5).optimize()
+    assert len(schema._validators) == 1
+    with pytest.raises(ValidationError):
+        schema.validate(3)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.info() == CacheInfo(3, 1, 2, 2)
+    with pytest.raises(ValueError):
+        LRUCache(0)
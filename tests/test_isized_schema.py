@@ -161,3 +161,51 @@ def test_isized_schema_protocol_conformance():
         pass
 
     assert not isinstance(NotSizedSchema(), ISizedSchema)
+
+
+def test_optimize_folds_min_max_into_length(rules):
+    schema = SizedSchema().min(1).min(3).max(3).optimize()
+    assert rules(schema) == [("length", (3,))]
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("ab")
+    assert excinfo.value.constraint.type == "length"
+    assert schema.validate("abc") == "abc"
+
+
+def test_optimize_drops_implied_sizes(rules):
+    assert rules(SizedSchema().min(0).max(5).optimize()) == [("max", (5,))]
+    assert rules(SizedSchema().min(2).length(4).max(4).optimize()) == [("length", (4,))]
+
+
+def test_optimize_rejects_contradicting_sizes():
+    with pytest.raises(ValueError, match="~/name: min\\(10\\) contradicts max\\(5\\)"):
+        SizedSchema().min(10).max(5).optimize("~/name")
+    with pytest.raises(ValueError, match="length\\(2\\) contradicts min\\(3\\)"):
+        SizedSchema().length(2).min(3).optimize()
+    with pytest.raises(ValueError, match="length\\(2\\) contradicts length\\(3\\)"):
+        SizedSchema().length(2).length(3).optimize()
+
+
+def _custom(x):
+    pass
+
+
+def test_optimize_keeps_size_bounds_around_custom_tests(rules):
+    schema = SizedSchema().min(3).test(_custom).max(3).optimize()
+    assert rules(schema) == [("min", (3,)), _custom, ("max", (3,))]
+    schema = SizedSchema().min(2).test(_custom).length(4).optimize()
+    assert rules(schema) == [("min", (2,)), _custom, ("length", (4,))]
+    schema = SizedSchema().length(4).test(_custom).min(2).optimize()
+    assert rules(schema) == [("length", (4,)), _custom]
+
+
+def test_optimize_keeps_custom_size_messages(rules):
+    schema = SizedSchema().min(3, "too short").max(3).optimize()
+    assert rules(schema) == [("min", (3,)), ("max", (3,))]
+    schema = SizedSchema().max(3, "bad size").min(3, "bad size").optimize()
+    assert rules(schema) == [("length", (3,))]
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("ab")
+    assert excinfo.value.constraint.format_message == "bad size"
+    schema = SizedSchema().min(2, "too short").length(4).optimize()
+    assert rules(schema) == [("min", (2,)), ("length", (4,))]
@@ -6,7 +6,8 @@ from unittest.mock import patch
 
 import pytest
 
-from yupy._json_decode import get_json_parser, loads
+from yupy._json_decode import get_json_parser, loads, measure
+from yupy.validation_error import ValidationError
 
 orjson: Any
 
@@ -210,3 +211,101 @@ class TestLoadsFunction:
         if orjson:
             with pytest.raises(JSONDecodeError):
                 loads(b"", "orjson")
+
+
+class TestLoadsKeyOptions:
+    """
+    Tests for the duplicate key and key interning options of loads.
+    """
+
+    def test_loads_duplicate_keys_allowed_by_default(self):
+        """
+        Tests that the last value wins by default, like the json library.
+        """
+        assert loads('{"a": 1, "a": 2}', "json") == {"a": 2}
+
+    def test_loads_reject_duplicate_keys(self):
+        """
+        Tests that duplicate keys are reported as a ValidationError.
+        """
+        assert loads('{"a": 1, "b": 2}', "json", reject_duplicate_keys=True) == {
+            "a": 1,
+            "b": 2,
+        }
+        with pytest.raises(ValidationError) as excinfo:
+            loads('{"x": {"a": 1, "a": 2}}', "json", reject_duplicate_keys=True)
+        assert excinfo.value.constraint.type == "duplicate_key"
+        assert excinfo.value.constraint.args == ("a",)
+
+    @patch("yupy._json_decode.orjson", new=MockOrjson())
+    def test_loads_reject_duplicate_keys_orjson_falls_back_to_json(self):
+        """
+        Tests that duplicate key detection uses the json library with orjson.
+        """
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            with pytest.raises(ValidationError):
+                loads('{"a": 1, "a": 2}', "orjson", reject_duplicate_keys=True)
+            assert "orjson can't detect duplicate keys" in str(w[-1].message)
+
+    def test_loads_intern_keys(self):
+        """
+        Tests that known keys are shared across separately decoded documents.
+        """
+        key = b"name".decode()
+        first = loads('{"name": "a", "other": 1}', "json", intern_keys=[key])
+        second = loads('[{"name": "b"}]', "json", intern_keys=[key])
+        assert next(iter(first)) is key
+        assert next(iter(second[0])) is key
+        assert first == {"name": "a", "other": 1}
+
+    def test_loads_intern_keys_table(self):
+        """
+        Tests that a prebuilt key table is used without being copied.
+        """
+        key = b"name".decode()
+        table = {key: key}
+        assert next(iter(loads('{"name": 1}', "json", intern_keys=table))) is key
+
+    def test_loads_key_options_conflict_with_object_pairs_hook(self):
+        """
+        Tests that a user object_pairs_hook can't be combined with key options.
+        """
+        with pytest.raises(ValueError):
+            loads("{}", "json", reject_duplicate_keys=True, object_pairs_hook=dict)
+
+
+class TestMeasureFunction:
+    """
+    Tests for the measure function in _json_decode.py.
+    """
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (1, (0, 0)),
+            ("[[,", (0, 0)),
+            ([], (1, 0)),
+            ({}, (1, 0)),
+            ([""], (1, 1)),
+            ({"": ""}, (1, 1)),
+            ([1, 2, 3], (1, 3)),
+            ({"a": [1, {"b": 'x,[y"]'}], "c": {}}, (3, 5)),
+            ([[1, [2, {"k": [3, 4]}]], "\\\\]]"], (5, 9)),
+            (["a\\", ["x"]], (2, 3)),
+        ],
+    )
+    def test_measure(self, value, expected):
+        """
+        Tests that measure reports the depth and item count of a document,
+        ignoring brackets and commas inside strings.
+        """
+        document = json.dumps(value)
+        assert measure(document) == expected
+        assert measure(document.encode()) == expected
+
+    def test_measure_deeply_nested(self):
+        """
+        Tests that measure handles nesting far beyond the recursion limit.
+        """
+        assert measure("[" * 100_000 + "]" * 100_000) == (100_000, 99_999)
@@ -3,7 +3,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from yupy.adapters import _REQUIRED_UNDEFINED_, SchemaRequiredAdapter
+from yupy.adapters import (
+    _REQUIRED_UNDEFINED_,
+    SchemaImmutableAdapter,
+    SchemaRequiredAdapter,
+)
+from yupy.array_schema import ArraySchema
 from yupy.locale import (
     get_error_message as yupy_actual_get_error_message,
 )
@@ -11,8 +16,13 @@ from yupy.locale import (
     locale as yupy_actual_locale,
 )
 from yupy.mapping_schema import MappingSchema
+from yupy.mixed_schema import MixedSchema
 from yupy.number_schema import NumberSchema
 from yupy.string_schema import StringSchema
+from yupy.union_schema import UnionSchema
+from yupy.util.canonicalize import canonicalize
+from yupy.util.error_limit import error_limit
+from yupy.util.subtree_memo import identity_memo
 from yupy.validation_error import ValidationError
 
 
@@ -352,3 +362,230 @@ def test_mapping_schema_getitem_key_not_found():
 
 
 # endregion
+
+
+def test_error_limit_only_applies_at_its_path():
+    schema = MappingSchema().shape(
+        {
+            "a": NumberSchema(),
+            "b": NumberSchema(),
+            "c": MappingSchema().shape({"d": NumberSchema(), "e": NumberSchema()}),
+        }
+    )
+    value = {"a": "x", "b": "x", "c": {"d": "x", "e": "x"}}
+    with error_limit("~", 1), pytest.raises(ValidationError) as excinfo:
+        schema.validate(dict(value), abort_early=False)
+    assert len(excinfo.value._errors) == 2
+    with error_limit("~", 2), pytest.raises(ValidationError) as excinfo:
+        schema.validate(dict(value), abort_early=False)
+    assert len(excinfo.value._errors[2]._errors) == 2
+
+
+def test_identity_memo_validates_shared_objects_once():
+    calls = []
+    item = MappingSchema().shape({"id": NumberSchema().test(calls.append)})
+    schema = ArraySchema().of(item)
+    shared = {"id": 1}
+    schema.validate([shared, shared, {"id": 2}])
+    assert calls == [1, 1, 2]
+
+    calls.clear()
+    with identity_memo():
+        result = schema.validate([shared, shared, {"id": 2}])
+    assert calls == [1, 2]
+    assert result[0] is result[1]
+
+
+def test_identity_memo_reports_each_invalid_occurrence():
+    schema = ArraySchema().of(MappingSchema().shape({"id": NumberSchema()}))
+    shared = {"id": "x"}
+    with identity_memo(), pytest.raises(ValidationError) as excinfo:
+        schema.validate([shared, shared], abort_early=False)
+    assert [err.path for err in excinfo.value._errors] == ["~/[0]", "~/[1]"]
+
+
+def test_identity_memo_rejects_cycles():
+    node = MappingSchema().nullable()
+    node.shape({"name": StringSchema(), "next": node})
+    first = {"name": "a"}
+    first["next"] = {"name": "b", "next": first}
+    with identity_memo(), pytest.raises(ValidationError) as excinfo:
+        node.validate(first)
+    assert excinfo.value.constraint.type == "cycle"
+    assert excinfo.value.path == "~/next/next"
+
+    with identity_memo():
+        assert node.validate({"name": "a", "next": {"name": "b"}})
+
+
+def _document_schema(calls):
+    counted = NumberSchema().test(calls.append)
+    item = MappingSchema().shape({"id": counted, "label": StringSchema()})
+    return MappingSchema().shape(
+        {
+            "title": StringSchema().min(1),
+            "meta": MappingSchema().shape({"rev": counted, "owner": StringSchema()}),
+            "items": ArraySchema().of(item),
+            "note": StringSchema().nullable(),
+        }
+    )
+
+
+def test_revalidate_only_validates_changed_fields():
+    calls = []
+    schema = _document_schema(calls)
+    previous = schema.validate(
+        {
+            "title": "doc",
+            "meta": {"rev": 1, "owner": "ann"},
+            "items": [{"id": 10, "label": "a"}, {"id": 11, "label": "b"}],
+            "note": "n",
+        }
+    )
+    calls.clear()
+
+    result = schema.revalidate(
+        previous,
+        {"meta": {"rev": 2}, "items": {1: {"label": "c"}}, "note": None},
+    )
+    assert calls == [2]
+    assert result == {
+        "title": "doc",
+        "meta": {"rev": 2, "owner": "ann"},
+        "items": [{"id": 10, "label": "a"}, {"id": 11, "label": "c"}],
+        "note": None,
+    }
+    assert result["items"][0] is previous["items"][0]
+    assert previous["meta"]["rev"] == 1
+    assert previous["items"][1]["label"] == "b"
+
+
+def test_revalidate_reports_changed_field_errors():
+    schema = _document_schema([])
+    previous = schema.validate(
+        {"title": "doc", "meta": {"rev": 1, "owner": "ann"}, "items": []}
+    )
+    with pytest.raises(ValidationError) as excinfo:
+        schema.revalidate(previous, {"meta": {"rev": "x"}})
+    assert excinfo.value.path == "~/meta/rev"
+
+    with pytest.raises(ValidationError) as excinfo:
+        schema.revalidate(previous, {"title": "", "items": [{"id": 1}]}, False)
+    assert [err.path for err in excinfo.value._errors] == ["~/title", "~/items"]
+
+    with pytest.raises(ValidationError) as excinfo:
+        schema.revalidate(previous, {"title": None})
+    assert excinfo.value.path == "~/title"
+    assert previous["title"] == "doc"
+
+
+def test_revalidate_checks_strictness_on_patched_mapping():
+    schema = MappingSchema().shape({"a": NumberSchema()}).strict()
+    previous = schema.validate({"a": 1})
+    with pytest.raises(ValidationError) as excinfo:
+        schema.revalidate(previous, {"b": 2})
+    assert excinfo.value.constraint.type == "strict"
+    assert schema.revalidate(previous, {"a": 2}) == {"a": 2}
+    with pytest.raises(TypeError):
+        schema.revalidate(previous, [("a", 2)])
+
+
+def test_revalidate_patches_fields_without_revalidate():
+    pair = MappingSchema().shape({"a": NumberSchema(), "b": NumberSchema()})
+    schema = MappingSchema().shape(
+        {
+            "u": UnionSchema().one_of([pair, StringSchema()]),
+            "i": SchemaImmutableAdapter(pair),
+            "m": MixedSchema(),
+            "l": MixedSchema(),
+        }
+    )
+    previous = schema.validate(
+        {
+            "u": {"a": 1, "b": 2},
+            "i": {"a": 1, "b": 2},
+            "m": {"a": 1, "n": {"x": 1, "y": 2}},
+            "l": [1, {"x": 1}],
+        }
+    )
+    result = schema.revalidate(
+        previous,
+        {"u": {"a": 5}, "i": {"a": 5}, "m": {"n": {"x": 3}}, "l": {1: {"y": 2}}},
+    )
+    assert result == {
+        "u": {"a": 5, "b": 2},
+        "i": {"a": 5, "b": 2},
+        "m": {"a": 1, "n": {"x": 3, "y": 2}},
+        "l": [1, {"x": 1, "y": 2}],
+    }
+    assert previous["m"] == {"a": 1, "n": {"x": 1, "y": 2}}
+    with pytest.raises(TypeError):
+        schema.revalidate(previous, {"l": {"0": 2}})
+
+
+def _address():
+    return MappingSchema().shape(
+        {
+            "street": SchemaRequiredAdapter(StringSchema().min(1)),
+            "zip": StringSchema().length(5),
+        }
+    )
+
+
+def test_canonicalize_shares_identical_subschemas():
+    schema = MappingSchema().shape(
+        {
+            "home": _address(),
+            "work": _address(),
+            "history": ArraySchema().of(_address()),
+            "other": UnionSchema().one_of([_address(), StringSchema()]),
+        }
+    )
+    fingerprint = schema.fingerprint()
+    assert canonicalize(schema) is schema
+    fields = schema._fields
+    assert fields["home"] is fields["work"]
+    assert fields["history"]._of_schema_type is fields["home"]
+    assert fields["other"]._options[0] is fields["home"]
+    assert schema.fingerprint() == fingerprint
+
+    address = {"street": "Main", "zip": "12345"}
+    value = {"home": address, "work": address, "history": [address], "other": "x"}
+    assert schema.validate(value) == value
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate({**value, "history": [address, {"street": "", "zip": "1"}]})
+    assert excinfo.value.path == "~/history/[1]/street"
+
+
+def test_canonicalize_keeps_distinct_subschemas():
+    schema = MappingSchema().shape(
+        {"a": StringSchema().min(1), "b": StringSchema().min(2), "c": NumberSchema()}
+    )
+    canonicalize(schema)
+    assert len({id(field) for field in schema._fields.values()}) == 3
+
+
+def test_canonicalize_pool_shared_across_trees():
+    pool = {}
+    first = canonicalize(MappingSchema().shape({"address": _address()}), pool)
+    second = canonicalize(MappingSchema().shape({"address": _address()}), pool)
+    assert second is first
+    other = canonicalize(MappingSchema().shape({"billing": _address()}), pool)
+    assert other._fields["billing"] is first._fields["address"]
+
+
+def test_optimize_nested_schemas():
+    schema = MappingSchema().shape(
+        {
+            "code": SchemaRequiredAdapter(StringSchema().min(2).max(2)),
+            "tags": ArraySchema().of(NumberSchema().ge(0).ge(1)),
+        }
+    )
+    assert schema.optimize() is schema
+    code = schema["code"].schema
+    assert [v.constraint.type for v in code._validators] == ["length"]
+    assert len(schema["tags"]._of_schema_type._validators) == 1
+    with pytest.raises(ValueError, match="~/tags/\\[\\*\\]: ge\\(3\\) contradicts"):
+        MappingSchema().shape(
+            {"tags": ArraySchema().of(NumberSchema().ge(3).lt(2))}
+        ).optimize()
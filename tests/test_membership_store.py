@@ -0,0 +1,89 @@
+import pytest
+
+from yupy.membership_store import BloomFilterStore, SortedArrayStore
+from yupy.number_schema import NumberSchema
+from yupy.string_schema import StringSchema
+from yupy.validation_error import ValidationError
+
+
+@pytest.mark.parametrize(
+    "values, members, non_members",
+    [
+        (["b", "a", "é", "a"], ["a", "b", "é"], ["", "c", "ab", 1]),
+        ([3, 1, 2**62], [1, 3.0, 2**62, True], [2, 1.5, float("nan"), "1"]),
+        ([0.5, 2, -1], [0.5, 2, 2.0, -1], [0, 1, "0.5"]),
+        ([], [], ["a", 0]),
+    ],
+)
+def test_sorted_array_store(tmp_path, values, members, non_members):
+    store = SortedArrayStore(values)
+    path = tmp_path / "store.bin"
+    store.save(path)
+    for candidate in (store, SortedArrayStore.open(path)):
+        assert len(candidate) == len(set(values))
+        for value in members:
+            assert value in candidate
+        for value in non_members:
+            assert value not in candidate
+
+
+def test_sorted_array_store_rejects_mixed_values():
+    with pytest.raises(TypeError):
+        SortedArrayStore(["a", 1])
+
+
+@pytest.mark.parametrize("values", [[2**63], [-(2**63) - 1], [0.5, 2**53 + 1]])
+def test_sorted_array_store_rejects_inexact_numbers(values):
+    with pytest.raises(ValueError):
+        SortedArrayStore(values)
+
+
+def test_sorted_array_store_int64_bounds():
+    store = SortedArrayStore([-(2**63), 2**63 - 1, 2**53 + 1])
+    assert 2**63 - 1 in store
+    assert 2**53 + 1 in store
+    assert 2**53 not in store
+    assert 2**63 not in store
+
+
+def test_sorted_array_store_open_invalid_file(tmp_path):
+    path = tmp_path / "store.bin"
+    path.write_bytes(b"not a store at all, really")
+    with pytest.raises(ValueError):
+        SortedArrayStore.open(path)
+
+
+def test_bloom_filter_store():
+    values = [f"id-{i}" for i in range(1000)]
+    store = BloomFilterStore(values, error_rate=0.01)
+    assert all(value in store for value in values)
+    assert "id-1000" not in store
+    false_positives = sum(store.might_contain(f"x-{i}") for i in range(10000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_store_with_exact_store():
+    exact = SortedArrayStore([1, 2, 3])
+    store = BloomFilterStore([1, 2, 3], exact=exact)
+    assert 2.0 in store
+    assert 4 not in store
+    with pytest.raises(ValueError):
+        BloomFilterStore([1], error_rate=1)
+
+
+def test_member_of():
+    schema = StringSchema().member_of(SortedArrayStore(["EUR", "USD"]))
+    assert schema.validate("EUR") == "EUR"
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("GBP")
+    assert excinfo.value.constraint.type == "member_of"
+    assert excinfo.value.invalid_value == "GBP"
+
+
+def test_not_member_of():
+    schema = NumberSchema().not_member_of(BloomFilterStore([13, 666]))
+    assert schema.validate(7) == 7
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(13)
+    assert excinfo.value.constraint.type == "not_member_of"
+    assert excinfo.value.constraint.format_message == "Value is not allowed"
@@ -1,4 +1,5 @@
 # File: test_mixed_schema.py
+from enum import Enum
 from typing import Any
 
 import pytest
@@ -170,3 +171,51 @@ def test_mixed_schema_nullable_behavior():
     schema_not_nullable_one_of = MixedSchema().one_of([1, 2, 3])
     with pytest.raises(ValidationError):
         schema_not_nullable_one_of.validate(None)
+
+
+def test_one_of_large_enumeration():
+    """Test one_of() with many items and a generator."""
+    schema = MixedSchema().one_of(f"SKU-{i}" for i in range(10000))
+    assert schema.validate("SKU-9999") == "SKU-9999"
+    with pytest.raises(ValidationError):
+        schema.validate("SKU-10000")
+
+
+def test_one_of_unhashable_items_and_values():
+    """Test one_of() fallback for unhashable items and values."""
+    schema = MixedSchema().one_of([1, [2, 3], {"a": 1}])
+    assert schema.validate(1.0) == 1.0
+    assert schema.validate([2, 3]) == [2, 3]
+    assert schema.validate({"a": 1}) == {"a": 1}
+    with pytest.raises(ValidationError):
+        schema.validate([4])
+
+
+class Currency(Enum):
+    EUR = "eur"
+    USD = "usd"
+
+
+def test_literal_enum():
+    """Test literal() maps enum values to members."""
+    schema = MixedSchema().literal(Currency)
+    assert schema.validate("eur") is Currency.EUR
+    assert schema.validate(Currency.USD) is Currency.USD
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("gbp")
+    assert excinfo.value.constraint.type == "one_of"
+    assert excinfo.value.constraint.args == (["eur", "usd"],)
+    assert excinfo.value.invalid_value == "gbp"
+
+
+def test_literal_mapping_and_iterable():
+    """Test literal() with a mapping and a plain iterable."""
+    schema = MixedSchema().literal({"yes": True, "no": False})
+    assert schema.validate("no") is False
+    with pytest.raises(ValidationError):
+        schema.validate("maybe")
+
+    schema = MixedSchema().literal(["a", "b"])
+    assert schema.validate("a") == "a"
+    with pytest.raises(ValidationError):
+        schema.validate(["a"])
@@ -340,3 +340,14 @@ def test_truncate_and_validate_chaining():
 
 
 # endregion
+
+
+def test_optimize_folds_positive_and_negative_into_bounds(rules):
+    """Test optimize() folds positive()/negative() into tighter gt()/lt() bounds."""
+    schema = NumberSchema().positive().gt(10).optimize()
+    assert rules(schema) == [("gt", (10,))]
+    assert rules(NumberSchema().negative().lt(-1).optimize()) == [("lt", (-1,))]
+    assert rules(NumberSchema().positive("must be > 0").gt(10).optimize()) == [
+        ("gt", (0,)),
+        ("gt", (10,)),
+    ]
@@ -0,0 +1,113 @@
+import pytest
+
+from yupy.adapters import SchemaRequiredAdapter
+from yupy.array_schema import ArraySchema
+from yupy.mapping_schema import MappingSchema
+from yupy.number_schema import NumberSchema
+from yupy.query_adapter import SchemaQueryAdapter
+from yupy.string_schema import StringSchema
+from yupy.validation_error import ValidationError
+
+
+@pytest.fixture
+def schema():
+    return SchemaQueryAdapter(
+        MappingSchema().shape(
+            {
+                "q": StringSchema().min(1).nullable(),
+                "page": SchemaRequiredAdapter(NumberSchema().integer().ge(1)),
+                "tags": ArraySchema().of(StringSchema()).nullable(),
+                "ids": ArraySchema().of(NumberSchema()).nullable(),
+            }
+        )
+    )
+
+
+def test_query_adapter_parses_into_shape(schema):
+    result = schema.validate("?q=hello+world&page=2&tags=a&tags=b%20c&ids=1&ids=2.5")
+    assert result == {
+        "q": "hello world",
+        "page": 2,
+        "tags": ["a", "b c"],
+        "ids": [1, 2.5],
+    }
+
+
+def test_query_adapter_accepts_bytes(schema):
+    assert schema.validate(b"page=3")["page"] == 3
+
+
+def test_query_adapter_single_array_value_is_a_list(schema):
+    assert schema.validate("page=1&tags=x")["tags"] == ["x"]
+
+
+def test_query_adapter_scalar_last_value_wins(schema):
+    assert schema.validate("page=1&q=a&q=b")["q"] == "b"
+
+
+def test_query_adapter_unknown_keys_are_kept_as_strings(schema):
+    assert schema.validate("page=1&extra=5")["extra"] == "5"
+
+
+def test_query_adapter_blank_values(schema):
+    assert schema.validate("page=1&q=")["q"] is None
+    keep = SchemaQueryAdapter(
+        MappingSchema().shape({"q": StringSchema()}), keep_blank_values=True
+    )
+    assert keep.validate("q=") == {"q": ""}
+
+
+def test_query_adapter_non_numeric_value_fails_number_schema(schema):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("page=abc")
+    assert excinfo.value.constraint.type == "type"
+    assert excinfo.value.path == "~/page"
+
+
+def test_query_adapter_missing_required_field(schema):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("q=x")
+    assert excinfo.value.constraint.type == "required"
+
+
+def test_query_adapter_invalid_input_type(schema):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(123)
+    assert excinfo.value.constraint.type == "query"
+    assert excinfo.value.invalid_value == 123
+
+
+def test_query_adapter_custom_separator():
+    schema = SchemaQueryAdapter(
+        MappingSchema().shape({"a": NumberSchema(), "b": StringSchema()}),
+        separator=";",
+    )
+    assert schema.validate("a=1;b=2") == {"a": 1, "b": "2"}
+
+
+def test_query_adapter_requires_mapping_schema():
+    with pytest.raises(TypeError):
+        SchemaQueryAdapter(StringSchema())
+
+
+@pytest.mark.parametrize("raw", ["nan", "inf", "-Infinity", "1_000", " 1", "1 ", "١"])
+def test_query_adapter_rejects_loose_numbers(schema, raw):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(f"page={raw}")
+    assert excinfo.value.constraint.type == "type"
+    assert excinfo.value.path == "~/page"
+
+
+def test_query_adapter_strict_numbers(schema):
+    result = schema.validate("page=%2B3&ids=-1.5&ids=.5&ids=2e3")
+    assert result["page"] == 3
+    assert result["ids"] == [-1.5, 0.5, 2000.0]
+
+
+@pytest.mark.parametrize("query", [b"q=\xff", "q=%FF", "%C3=x"])
+def test_query_adapter_rejects_invalid_utf8(schema, query):
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(query, path="~/query")
+    assert excinfo.value.constraint.type == "query"
+    assert excinfo.value.path == "~/query"
+    assert excinfo.value.invalid_value == query
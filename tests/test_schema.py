@@ -1,9 +1,16 @@
+import math
+import os
+import subprocess
+import sys
 from typing import Any  # Import Any here
 
 import pytest
 
 from yupy.locale import locale
-from yupy.schema import Schema
+from yupy.number_schema import NumberSchema
+from yupy.schema import Schema, _is_pure
+from yupy.string_schema import StringSchema
+from yupy.util.cache import LRUCache, TTLCache
 from yupy.validation_error import Constraint, ValidationError
 
 
@@ -170,6 +177,105 @@ def test_test_method_adds_validator_func():
     assert schema._validators[0] == is_positive
 
 
+def test_test_method_orders_validators_by_cost():
+    """Test test() runs validators cheapest first, keeping the order of equal costs."""
+    calls = []
+    schema = Schema()
+    schema.test(lambda x: calls.append("expensive"), cost=10)
+    schema.test(lambda x: calls.append("a"))
+    schema.test(lambda x: calls.append("medium"), cost=5)
+    schema.test(lambda x: calls.append("b"))
+    schema.validate(1)
+    assert calls == ["a", "b", "medium", "expensive"]
+
+
+def test_test_method_cost_never_overtakes_guards():
+    """Test a cheap test still runs after the built-in rules and tests added before it."""
+    schema = StringSchema().min(1).test(lambda x: x[0] == "a", cost=0.5)
+    with pytest.raises(ValidationError):
+        schema.validate("")
+    calls = []
+    schema = Schema().test(lambda x: calls.append("guard"))
+    schema.test(lambda x: calls.append("cheap"), cost=0.1)
+    schema.validate(1)
+    assert calls == ["guard", "cheap"]
+
+
+def test_test_and_transform_pure_annotations():
+    """Test pure=True marks the callable as pure without modifying it."""
+
+    def check(value):
+        if value < 0:
+            raise ValidationError(Constraint("test", "negative"))
+
+    schema = Schema().test(check, pure=True).transform(abs, pure=True)
+    assert all(_is_pure(f) for f in schema._validators + schema._transforms)
+    assert not _is_pure(check)
+    assert not _is_pure(Schema().test(check)._validators[0])
+    assert schema.validate(-1) == 1
+
+
+def test_test_method_caches_outcomes():
+    """Test test(cache=...) skips the validator for repeated values until they expire."""
+    now = [0.0]
+    calls = []
+
+    def check(value):
+        calls.append(value)
+        if value < 0:
+            raise ValidationError(Constraint("test", "negative"))
+
+    cache = TTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    schema = Schema().test(check, cache=cache)
+    for _ in range(2):
+        assert schema.validate(1) == 1
+        with pytest.raises(ValidationError) as excinfo:
+            schema.validate(-1, path="~/a")
+        assert excinfo.value.constraint.type == "test"
+        assert excinfo.value.path == "~/a"
+    assert calls == [1, -1]
+    assert cache.info().hit_rate == 0.5
+
+    now[0] = 10.0
+    schema.validate(1)
+    assert calls == [1, -1, 1]
+
+    schema.validate(2)
+    schema.validate(3)
+    assert len(cache) == 2
+
+
+def test_test_method_cache_skips_unhashable_values():
+    """Test test(cache=...) always runs the validator for unhashable values."""
+    calls = []
+    schema = Schema().test(calls.append, cache=TTLCache())
+    schema.validate([1])
+    schema.validate([1])
+    assert calls == [[1], [1]]
+
+
+def test_test_method_cache_keeps_signed_zeros_and_tuple_types_apart():
+    """Test test(cache=...) does not share outcomes between -0.0 and 0.0, or (1,) and (True,)."""
+
+    def positive_sign(x):
+        if math.copysign(1, x) < 0:
+            raise ValidationError(Constraint("sign", "negative sign"))
+
+    schema = NumberSchema().test(positive_sign, cache=LRUCache(8))
+    assert schema.validate(0.0) == 0.0
+    with pytest.raises(ValidationError):
+        schema.validate(-0.0)
+
+    def ints_only(x):
+        if type(x[0]) is not int:
+            raise ValidationError(Constraint("int", "not an int"))
+
+    schema = Schema().test(ints_only, cache=LRUCache(8))
+    schema.validate((1,))
+    with pytest.raises(ValidationError):
+        schema.validate((True,))
+
+
 def test_validate_success_no_transforms_no_validators():
     """Test validate() success with no transforms or validators."""
     schema = Schema(_type=int)
@@ -274,3 +380,94 @@ def test_validate_const_failure_with_custom_message():
     assert error.constraint.type == "const"
     assert error.constraint.message == custom_const_message
     assert error.invalid_value == 5
+
+
+def _user_schema():
+    from yupy import array, mapping, number, required, string, union
+
+    return mapping().shape(
+        {
+            "name": required(string().min(1).max(20)),
+            "tags": array().of(string().member_of(frozenset({"a", "b"}))),
+            "age": union().one_of([number().ge(0), string()]),
+        }
+    )
+
+
+def test_fingerprint_is_structural():
+    assert _user_schema().fingerprint() == _user_schema().fingerprint()
+    assert Schema().fingerprint() != Schema().nullable().fingerprint()
+    assert Schema().const(1).fingerprint() != Schema().const(2).fingerprint()
+    assert Schema().const(1).fingerprint() != Schema().const(True).fingerprint()
+
+
+def test_fingerprint_ignores_runtime_state():
+    from yupy import number, string, union
+
+    schema = union().one_of([string(), number()]).adaptive(every=1)
+    before = schema.fingerprint()
+    for _ in range(3):
+        schema.validate(1)
+    assert schema.fingerprint() == before
+
+
+def test_fingerprint_of_user_callables():
+    def check(limit):
+        def _(x):
+            if x > limit:
+                raise ValidationError(Constraint("limit", "too big"))
+
+        return _
+
+    assert (
+        Schema().test(check(1)).fingerprint() == Schema().test(check(1)).fingerprint()
+    )
+    assert (
+        Schema().test(check(1)).fingerprint() != Schema().test(check(2)).fingerprint()
+    )
+    assert (
+        Schema().test(check(1), cache=TTLCache(8)).fingerprint()
+        == Schema().test(check(1), cache=TTLCache(8)).fingerprint()
+    )
+
+
+class _Slotted:
+    __slots__ = ("limit",)
+
+    def __init__(self, limit):
+        self.limit = limit
+
+
+def _opaque_schema():
+    import threading
+
+    missing = object()
+    lock = threading.Lock()
+    bound = _Slotted(3)
+
+    def _(x):
+        with lock:
+            if x is missing or x > bound.limit:
+                raise ValidationError(Constraint("limit", "too big"))
+
+    return Schema().test(_)
+
+
+def test_fingerprint_of_opaque_objects():
+    assert _opaque_schema().fingerprint() == _opaque_schema().fingerprint()
+    assert _opaque_schema().fingerprint() != Schema().test(lambda x: x).fingerprint()
+
+
+@pytest.mark.parametrize("factory", ["_user_schema", "_opaque_schema"])
+def test_fingerprint_is_stable_across_processes(factory):
+    code = f"from tests.test_schema import {factory}; print({factory}().fingerprint())"
+    env = dict(os.environ, PYTHONHASHSEED="1")
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        check=True,
+    ).stdout.strip()
+    assert output == globals()[factory]().fingerprint()
@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from yupy.mapping_schema import MappingSchema
+from yupy.number_schema import NumberSchema
+from yupy.schema_registry import RegistryInfo, SchemaRegistry, _footprint
+from yupy.string_schema import StringSchema
+from yupy.validation_error import ValidationError
+
+
+def _counting(builds, schema_factory):
+    def definition():
+        builds.append(1)
+        return schema_factory()
+
+    return definition
+
+
+def test_registry_builds_on_first_use():
+    builds = []
+    registry = SchemaRegistry()
+    registry.register(
+        "user",
+        _counting(builds, lambda: MappingSchema().shape({"name": StringSchema()})),
+    )
+    assert "user" in registry
+    assert builds == []
+    assert registry.validate("user", {"name": "a"}) == {"name": "a"}
+    assert registry.validate("user", {"name": "b"}) == {"name": "b"}
+    assert builds == [1]
+    info = registry.info()
+    assert (info.hits, info.misses, info.registered, info.currsize) == (1, 1, 1, 1)
+    assert info.nbytes > 0
+    with pytest.raises(ValidationError):
+        registry.validate("user", {"name": 1})
+
+
+def test_registry_versions():
+    registry = SchemaRegistry()
+    registry.register("n", lambda: NumberSchema().le(1), version=1)
+    registry.register("n", lambda: NumberSchema().le(2), version=2)
+    assert registry.validate("n", 2) == 2
+    with pytest.raises(ValidationError):
+        registry.validate("n", 2, version=1)
+    registry.unregister("n", version=2)
+    with pytest.raises(ValidationError):
+        registry.validate("n", 2)
+    with pytest.raises(KeyError):
+        registry.get("n", version=2)
+    with pytest.raises(KeyError):
+        registry.get("missing")
+    with pytest.raises(TypeError):
+        registry.register("n", NumberSchema())
+
+
+def test_registry_none_is_a_version():
+    registry = SchemaRegistry()
+    registry.register("n", lambda: NumberSchema().le(1))
+    registry.register("n", lambda: NumberSchema().le(2), version=2)
+    assert registry.validate("n", 2) == 2
+    with pytest.raises(ValidationError):
+        registry.validate("n", 2, version=None)
+    registry.unregister("n")
+    with pytest.raises(KeyError):
+        registry.get("n", version=None)
+    assert registry.validate("n", 2) == 2
+
+
+def test_registry_reregister_drops_built_schema():
+    registry = SchemaRegistry()
+    registry.register("s", lambda: StringSchema().max(1))
+    with pytest.raises(ValidationError):
+        registry.validate("s", "ab")
+    registry.register("s", lambda: StringSchema().max(2))
+    assert registry.validate("s", "ab") == "ab"
+
+
+def test_registry_evicts_least_recently_used():
+    builds = []
+    registry = SchemaRegistry(maxsize=2)
+    for schema_id in "abc":
+        registry.register(schema_id, _counting(builds, StringSchema))
+    registry.get("a")
+    registry.get("b")
+    registry.get("a")
+    registry.get("c")
+    assert registry.info().currsize == 2
+    registry.get("a")
+    assert len(builds) == 3
+    registry.get("b")
+    assert len(builds) == 4
+
+
+def test_registry_evicts_by_size():
+    size = _footprint(StringSchema())
+    registry = SchemaRegistry(max_bytes=size * 2 + size // 2)
+    for schema_id in "abc":
+        registry.register(schema_id, StringSchema)
+        registry.get(schema_id)
+    info = registry.info()
+    assert info.currsize == 2
+    assert info.nbytes <= registry.max_bytes
+    registry.clear()
+    assert registry.info() == RegistryInfo(0, 0, 3, 0, 0)
+    with pytest.raises(ValueError):
+        SchemaRegistry(max_bytes=0)
+
+
+def test_registry_concurrent_lookup():
+    registry = SchemaRegistry(maxsize=4)
+    for i in range(8):
+        registry.register(str(i), lambda i=i: NumberSchema().le(i))
+    with ThreadPoolExecutor(8) as pool:
+        results = list(
+            pool.map(lambda i: registry.validate(str(i % 8), i % 8), range(400))
+        )
+    assert results == [i % 8 for i in range(400)]
+    assert registry.info().currsize <= 4
@@ -1,10 +1,18 @@
 # test_string_schema.py
+import io
+import random
 import re
+import time
 from unittest.mock import patch
 
 import pytest
 
-from yupy.string_schema import StringSchema
+from yupy.string_schema import (
+    StringSchema,
+    rEmail_pattern,
+    rUrl_pattern,
+    rUUID_pattern,
+)
 from yupy.validation_error import ValidationError
 
 
@@ -420,3 +428,297 @@ def test_date_with_custom_message():
 
 
 # endregion
+
+
+# region validate_stream tests
+class _ChunkCountingStream(io.StringIO):
+    def __init__(self, value: str) -> None:
+        super().__init__(value)
+        self.reads = 0
+
+    def read(self, size: int | None = -1) -> str:
+        self.reads += 1
+        return super().read(size)
+
+
+def test_validate_stream_success_text_and_binary():
+    """Test validate_stream() accepts text and binary streams and returns the length."""
+    schema = StringSchema().min(2).max(10).lowercase()
+    assert schema.validate_stream(io.StringIO("abcdef"), chunk_size=2) == 6
+    assert schema.validate_stream(io.BytesIO("абвг".encode()), chunk_size=1) == 4
+
+
+def test_validate_stream_max_stops_reading_early():
+    """Test validate_stream() stops reading once max() is exceeded."""
+    stream = _ChunkCountingStream("a" * 1000)
+    with pytest.raises(ValidationError) as excinfo:
+        StringSchema().max(10).validate_stream(stream, chunk_size=4)
+    assert excinfo.value.constraint.type == "max"
+    assert excinfo.value.path == "~"
+    assert stream.reads == 3
+
+
+@pytest.mark.parametrize(
+    "schema, value, constraint",
+    [
+        (StringSchema().min(5), "abc", "min"),
+        (StringSchema().length(3), "abcd", "length"),
+        (StringSchema().length(3), "ab", "length"),
+        (StringSchema().lowercase(), "abcD", "lowercase"),
+        (StringSchema().uppercase(), "ABcD", "uppercase"),
+    ],
+)
+def test_validate_stream_failures(schema, value, constraint):
+    """Test validate_stream() reports the same constraint as validate()."""
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate_stream(io.StringIO(value), chunk_size=2)
+    assert excinfo.value.constraint.type == constraint
+
+
+@pytest.mark.parametrize(
+    ("pattern", "flags"),
+    [
+        (r"^[a-z0-9]+$", 0),
+        (r"[a-z0-9]*\Z", 0),
+        (r"^[a-z]+", 0),
+        (r"\d*", 0),
+        (r"^.+$", 0),
+        (r"^[^a]+$", 0),
+        (r"^.+$", re.DOTALL),
+        (r"[a-z]+\Z", re.MULTILINE),
+    ],
+)
+@pytest.mark.parametrize(
+    "value", ["abc123", "ab-c", "", "9ab", "ab\n", "ab\nc", "\n", "\n\n", "b\nb"]
+)
+def test_validate_stream_matches_agrees_with_validate(pattern, flags, value):
+    """Test validate_stream() evaluates supported patterns exactly like validate()."""
+    schema = StringSchema().matches(re.compile(pattern, flags))
+    try:
+        schema.validate(value)
+        expected = True
+    except ValidationError:
+        expected = False
+    try:
+        schema.validate_stream(io.StringIO(value), chunk_size=2)
+        actual = True
+    except ValidationError:
+        actual = False
+    assert actual is expected
+
+
+def test_validate_stream_unsupported_constraints():
+    """Test validate_stream() rejects constraints it can't evaluate incrementally."""
+    with pytest.raises(TypeError):
+        StringSchema().email().validate_stream(io.StringIO("a@b.c"))
+    with pytest.raises(TypeError):
+        StringSchema().matches(re.compile("a(b|c)")).validate_stream(io.StringIO("ab"))
+    with pytest.raises(TypeError):
+        StringSchema().matches(re.compile("^[a-z]+$", re.MULTILINE)).validate_stream(
+            io.StringIO("b\nb")
+        )
+    with pytest.raises(TypeError):
+        StringSchema().trim().validate_stream(io.StringIO("ab"))
+
+
+def test_validate_stream_invalid_encoding():
+    """Test validate_stream() reports undecodable bytes as a type error."""
+    with pytest.raises(ValidationError) as excinfo:
+        StringSchema().validate_stream(io.BytesIO(b"\xff\xfe"), encoding="utf-8")
+    assert excinfo.value.constraint.type == "type"
+
+
+# endregion
+
+
+# region prefix, suffix and substring set tests
+def test_starts_with_any():
+    """Test starts_with_any() with overlapping prefixes."""
+    schema = StringSchema().starts_with_any(["ab", "abc", "x"])
+    assert schema.validate("abd") == "abd"
+    assert schema.validate("x") == "x"
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("a")
+    assert excinfo.value.constraint.type == "starts_with_any"
+    assert excinfo.value.invalid_value == "a"
+
+
+def test_ends_with_any():
+    """Test ends_with_any() with many suffixes."""
+    schema = StringSchema().ends_with_any(f".tld{i}" for i in range(5000))
+    assert schema.validate("example.tld4999") == "example.tld4999"
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("example.tld")
+    assert excinfo.value.constraint.type == "ends_with_any"
+
+
+def test_contains_none_of():
+    """Test contains_none_of() reports the first banned word found."""
+    schema = StringSchema().contains_none_of(["he", "she", "his", "hers"])
+    assert schema.validate("ahoy") == "ahoy"
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("ushers")
+    assert excinfo.value.constraint.type == "contains_none_of"
+    assert excinfo.value.constraint.format_message == "Value must not contain 'she'"
+
+
+@pytest.mark.parametrize(
+    "words", [["abcd", "bc"], ["aab", "ab"], ["word", "or", "d"], [""], []]
+)
+@pytest.mark.parametrize("value", ["", "abcd", "xaabx", "sword", "xyz", "b"])
+def test_contains_none_of_agrees_with_in(words, value):
+    """Test contains_none_of() finds exactly the values `in` would find."""
+    schema = StringSchema().contains_none_of(words)
+    expected = not any(word in value for word in words)
+    try:
+        schema.validate(value)
+        actual = True
+    except ValidationError:
+        actual = False
+    assert actual is expected
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        StringSchema().starts_with_any(["abc", "xy"]),
+        StringSchema().ends_with_any(["cd", "bcd", "y"]),
+        StringSchema().contains_none_of(["bc", "zz"]),
+        StringSchema().starts_with_any([""]),
+        StringSchema().ends_with_any([""]),
+    ],
+)
+@pytest.mark.parametrize("value", ["", "abcd", "xy", "xbcy", "zaz"])
+def test_validate_stream_affixes_agree_with_validate(schema, value):
+    """Test validate_stream() evaluates prefix, suffix and substring sets like validate()."""
+    try:
+        schema.validate(value)
+        expected = True
+    except ValidationError:
+        expected = False
+    try:
+        schema.validate_stream(io.StringIO(value), chunk_size=1)
+        actual = True
+    except ValidationError:
+        actual = False
+    assert actual is expected
+
+
+# endregion
+
+
+# region linear-time format validators tests
+def _url_corpus(rnd):
+    def part(chars, n):
+        return "".join(rnd.choice(chars) for _ in range(n))
+
+    for _ in range(3000):
+        url = rnd.choice(["", "http:", "https:", "ftp:", "HtTp:", "httpſ:", "mailto:"])
+        url += "//"
+        if rnd.random() < 0.3:
+            url += part(["a", ":", "%41", "%", "!", ".", "@"], rnd.randint(0, 4)) + "@"
+        if rnd.random() < 0.3:
+            url += ".".join(
+                rnd.choice(["1", "25", "255", "256", "01", "0", "٣"])
+                for _ in range(rnd.choice([3, 4, 4, 5]))
+            )
+        else:
+            url += part(
+                ["a", "b", "0", "-", ".", "_", "~", "é", "٣", "K"], rnd.randint(0, 8)
+            )
+            url += rnd.choice(["", ".", ".c", ".com", "..", "c", ".1"])
+        if rnd.random() < 0.3:
+            url += ":" + part(["8", "0", "٣", "a", ":"], rnd.randint(0, 3))
+        if rnd.random() < 0.5:
+            url += "/" + part(
+                ["a", "/", "%2F", "%", "%g0", "@", ":", "é"], rnd.randint(0, 5)
+            )
+        if rnd.random() < 0.3:
+            url += "?" + part(["a", "=", "&", "?", "/", "", "%"], rnd.randint(0, 5))
+        if rnd.random() < 0.3:
+            url += "#" + part(["a", "?", "/", "#", ""], rnd.randint(0, 4))
+        url += rnd.choice(["", "", "", "\n", "\n\n", " "])
+        yield url
+
+
+def _email_corpus(rnd):
+    pieces = ["a", "Z", "0", ".", "-", "ſ", "K", "é", "!", "#", "b.c", "x" * 30]
+    pieces += ["y" * 64, "\n", " ", "+", "%", "_", "`", "@"]
+
+    labels = ["a", "b0", "-", ".", "x" * 30, "y" * 64, "K", "ſ", "é", "\n", "_"]
+
+    def part(choices):
+        return "".join(rnd.choice(choices) for _ in range(rnd.randint(0, 5)))
+
+    for _ in range(3000):
+        yield part(pieces) + rnd.choice(["@", "", "@@"]) + part(labels)
+
+
+def _uuid_corpus(rnd):
+    chars = "0123456789abcdefABCDEFgG-\nK"
+    for _ in range(3000):
+        value = list(
+            rnd.choice(
+                [
+                    "f47ac10b-58cc-4372-a567-0e02b2c3d479",
+                    "F47AC10B-58CC-5372-B567-0E02B2C3D479",
+                    "00000000-0000-0000-0000-000000000000",
+                ]
+            )
+        )
+        for _ in range(rnd.randint(0, 2)):
+            i = rnd.randrange(len(value))
+            op = rnd.random()
+            if op < 0.5:
+                value[i] = rnd.choice(chars)
+            elif op < 0.75:
+                value.insert(i, rnd.choice(chars))
+            else:
+                del value[i]
+        yield "".join(value)
+
+
+@pytest.mark.parametrize(
+    "method, pattern, corpus",
+    [
+        ("url", rUrl_pattern, _url_corpus),
+        ("email", rEmail_pattern, _email_corpus),
+        ("uuid", rUUID_pattern, _uuid_corpus),
+    ],
+)
+def test_format_validators_agree_with_reference_patterns(method, pattern, corpus):
+    """Test url(), email() and uuid() accept exactly what their reference patterns match."""
+    schema = getattr(StringSchema(), method)()
+    accepted = 0
+    for value in corpus(random.Random(method)):
+        expected = pattern.match(value) is not None
+        accepted += expected
+        try:
+            schema.validate(value)
+            actual = True
+        except ValidationError:
+            actual = False
+        assert actual is expected, value
+    assert 50 < accepted < 2950
+
+
+@pytest.mark.parametrize(
+    "method, value",
+    [
+        ("url", "http://" + "a." * 20000 + "!"),
+        ("url", "http://" + "a" * 50000 + "-"),
+        ("url", "http://a." + "a-" * 20000 + "-."),
+        ("email", "a@" + "a-" * 20000 + "!"),
+        ("uuid", "f" * 100000),
+    ],
+)
+def test_format_validators_reject_adversarial_input_quickly(method, value):
+    """Test url(), email() and uuid() don't backtrack on adversarial input."""
+    schema = getattr(StringSchema(), method)()
+    start = time.perf_counter()
+    with pytest.raises(ValidationError):
+        schema.validate(value)
+    assert time.perf_counter() - start < 1
+
+
+# endregion
@@ -1,14 +1,18 @@
 # test_union_schema.py
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from yupy.adapters import SchemaDefaultAdapter, SchemaRequiredAdapter
 from yupy.locale import (
     get_error_message as yupy_actual_get_error_message,
 )
 from yupy.locale import (
     locale as yupy_actual_locale,
 )
+from yupy.mapping_schema import MappingSchema
+from yupy.mixed_schema import MixedSchema
 from yupy.number_schema import NumberSchema
 from yupy.schema import Schema
 from yupy.string_schema import StringSchema
@@ -85,3 +89,309 @@ def test_union_schema_one_of_empty_list():
         schema.validate("any_value")
     assert excinfo.value.constraint.type == "one_of"
     assert "Must be one of " in excinfo.value.constraint.format_message
+
+
+# region discriminator tests
+@pytest.fixture
+def event_schema():
+    click = MappingSchema().shape(
+        {"type": StringSchema().const("click"), "x": NumberSchema().ge(0)}
+    )
+    key = MappingSchema().shape(
+        {
+            "type": SchemaRequiredAdapter(MixedSchema().one_of(["key", "keydown"])),
+            "code": StringSchema(),
+        }
+    )
+    return UnionSchema().one_of([click, key]).discriminator("type")
+
+
+def test_union_schema_discriminator_dispatch(event_schema):
+    assert event_schema._dispatch.keys() == {"click", "key", "keydown"}
+    assert event_schema.validate({"type": "click", "x": 1}) == {"type": "click", "x": 1}
+    assert event_schema.validate({"type": "keydown", "code": "A"})["code"] == "A"
+
+
+def test_union_schema_discriminator_validates_only_selected_option(event_schema):
+    with pytest.raises(ValidationError) as excinfo:
+        event_schema.validate({"type": "click", "x": -1})
+    assert excinfo.value.constraint.type == "ge"
+    assert excinfo.value.path == "~/x"
+
+
+@pytest.mark.parametrize(
+    "value, invalid", [({"type": "scroll"}, "scroll"), ({}, None), ("click", None)]
+)
+def test_union_schema_discriminator_unknown_tag(event_schema, value, invalid):
+    with pytest.raises(ValidationError) as excinfo:
+        event_schema.validate(value)
+    assert excinfo.value.constraint.type == "discriminator"
+    assert excinfo.value.path == "~/type"
+    assert excinfo.value.invalid_value == invalid
+    assert excinfo.value.constraint.args == ("type", ["click", "key", "keydown"])
+
+
+def test_union_schema_discriminator_before_one_of():
+    option = MappingSchema().shape({"kind": StringSchema().eq("a")})
+    schema = UnionSchema().discriminator("kind").one_of([option])
+    assert schema.validate({"kind": "a"}) == {"kind": "a"}
+
+
+def test_union_schema_discriminator_with_literal():
+    schema = (
+        UnionSchema()
+        .one_of(
+            [
+                MappingSchema().shape({"kind": MixedSchema().literal(["a", "b"])}),
+                MappingSchema().shape({"kind": MixedSchema().literal({"c": "C"})}),
+            ]
+        )
+        .discriminator("kind")
+    )
+    assert schema.validate({"kind": "c"}) == {"kind": "C"}
+
+
+def test_union_schema_discriminator_invalid_options():
+    with pytest.raises(TypeError):
+        UnionSchema().one_of([StringSchema()]).discriminator("type")
+    with pytest.raises(TypeError):
+        UnionSchema().one_of(
+            [MappingSchema().shape({"type": StringSchema()})]
+        ).discriminator("type")
+    same = MappingSchema().shape({"type": StringSchema().const("a")})
+    with pytest.raises(TypeError):
+        UnionSchema().one_of([same, same]).discriminator("type")
+
+
+# endregion
+
+
+# region type index tests
+def _counting(schema, calls):
+    def _(x):
+        calls.append(x)
+
+    return schema.test(_)
+
+
+def test_union_schema_tries_only_type_compatible_options():
+    calls = []
+    schema = UnionSchema().one_of(
+        [
+            _counting(StringSchema(), calls),
+            _counting(NumberSchema(), calls),
+            _counting(MappingSchema(), calls),
+        ]
+    )
+    assert schema.validate({}) == {}
+    assert calls == [{}]
+    assert schema._candidates[dict] == (2,)
+
+
+def test_union_schema_type_index_looks_through_adapters():
+    schema = UnionSchema().one_of(
+        [SchemaRequiredAdapter(StringSchema()), SchemaRequiredAdapter(NumberSchema())]
+    )
+    assert schema.validate(1) == 1
+    assert schema._candidates[int] == (1,)
+
+
+def test_union_schema_type_index_keeps_untyped_options():
+    schema = UnionSchema().one_of(
+        [
+            NumberSchema(),
+            MixedSchema(),
+            StringSchema().transform(str),
+        ]
+    )
+    assert schema.validate(True) is True
+    assert schema.validate([1]) == [1]
+    assert schema._candidates[list] == (1, 2)
+
+
+def test_union_schema_type_index_follows_reconfigured_options():
+    text = StringSchema()
+    fallback = SchemaDefaultAdapter("none", StringSchema())
+    schema = UnionSchema().one_of([fallback, text])
+    assert schema._candidates_for(int) == ()
+    text.transform(str)
+    assert schema.validate(1) == "1"
+    assert schema._candidates[int] == (1,)
+    fallback.ensure()
+    assert schema.validate(1) == "none"
+
+
+def test_union_schema_type_index_reused_between_validations():
+    schema = UnionSchema().one_of([StringSchema(), NumberSchema()])
+    typed_options = schema._typed_options
+    assert schema.validate(1) == 1
+    assert schema.validate("a") == "a"
+    assert schema._typed_options is typed_options
+    StringSchema().trim()
+    assert schema.validate(1) == 1
+    assert schema._typed_options is not typed_options
+
+
+def test_union_schema_type_index_errors_for_skipped_options():
+    schema = UnionSchema().one_of([StringSchema(), NumberSchema().gt(5)])
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate(1)
+    errors = excinfo.value._errors
+    assert excinfo.value.constraint.type == "one_of"
+    assert [e.path for e in errors] == ["~/[0]", "~/[1]"]
+    assert [e.constraint.type for e in errors] == ["type", "gt"]
+    assert errors[0].invalid_value == 1
+
+
+# endregion
+
+
+# region adaptive ordering tests
+def test_union_schema_adaptive_reorders_by_matches():
+    calls = []
+    schema = (
+        UnionSchema()
+        .one_of(
+            [
+                _counting(StringSchema().const("a"), calls),
+                _counting(StringSchema().const("b"), calls),
+                _counting(StringSchema().const("c"), calls),
+            ]
+        )
+        .adaptive(every=4)
+    )
+    for value in ["c", "c", "b", "c"]:
+        schema.validate(value)
+    assert schema._order == (2, 1, 0)
+    calls.clear()
+    assert schema.validate("c") == "c"
+    assert calls == ["c"]
+
+
+def test_union_schema_adaptive_freeze_pins_order():
+    schema = (
+        UnionSchema()
+        .one_of([StringSchema().const("a"), StringSchema().const("b")])
+        .adaptive(every=1)
+    )
+    schema.validate("b")
+    schema.freeze()
+    for _ in range(3):
+        schema.validate("a")
+    assert schema._order == (1, 0)
+    assert schema._hits == [0, 1]
+
+
+def test_union_schema_adaptive_keeps_error_order():
+    schema = UnionSchema().one_of([StringSchema(), NumberSchema()]).adaptive(every=1)
+    schema.validate(1)
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate([])
+    assert [e.path for e in excinfo.value._errors] == ["~/[0]", "~/[1]"]
+
+
+def test_union_schema_adaptive_is_thread_safe():
+    schema = UnionSchema().one_of([NumberSchema(), StringSchema()]).adaptive(every=7)
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(schema.validate, ["x"] * 400 + [1] * 100))
+    assert schema._hits == [100, 400]
+    assert schema._order == (1, 0)
+
+
+def test_union_schema_adaptive_invalid_every():
+    with pytest.raises(ValueError):
+        UnionSchema().adaptive(0)
+
+
+# endregion
+
+
+# region best match tests
+@pytest.fixture
+def shapes():
+    point = MappingSchema().shape(
+        {"x": NumberSchema(), "y": NumberSchema(), "z": NumberSchema()}
+    )
+    user = MappingSchema().shape({"name": StringSchema(), "age": NumberSchema().ge(0)})
+    return point, user
+
+
+def test_union_schema_best_match_reports_closest_option(shapes):
+    schema = UnionSchema().one_of([*shapes, StringSchema()]).best_match()
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate({"name": "a", "age": -1}, abort_early=False)
+    assert excinfo.value.constraint.type == "one_of"
+    (best,) = excinfo.value._errors
+    assert best.path == "~/[1]"
+    assert [e.path for e in best._errors] == ["~/[1]/age"]
+
+
+def test_union_schema_best_match_stops_losing_options(shapes):
+    calls = []
+    point, user = shapes
+    point._fields["z"] = _counting(NumberSchema(), calls)
+    schema = UnionSchema().one_of([user, point]).best_match()
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate({"name": "a", "age": "x"}, abort_early=False)
+    assert excinfo.value._errors[0].path == "~/[0]"
+    assert calls == []
+
+
+def test_union_schema_best_match_first_option_wins_ties():
+    schema = (
+        UnionSchema()
+        .one_of([StringSchema().min(5), StringSchema().max(1)])
+        .best_match()
+    )
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate("abc")
+    assert [e.path for e in excinfo.value._errors] == ["~/[0]"]
+
+
+def test_union_schema_best_match_all_type_errors():
+    schema = UnionSchema().one_of([StringSchema(), NumberSchema()]).best_match()
+    with pytest.raises(ValidationError) as excinfo:
+        schema.validate([])
+    assert [e.constraint.type for e in excinfo.value._errors] == ["type", "type"]
+
+
+# endregion
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        [StringSchema(), StringSchema().min(3)],
+        [NumberSchema().ge(0), NumberSchema().positive()],
+        [MixedSchema(), StringSchema()],
+        [MixedSchema().one_of(["a", "b"]), StringSchema().eq("a")],
+        [StringSchema().nullable(), StringSchema()],
+    ],
+)
+def test_optimize_rejects_unreachable_options(options):
+    with pytest.raises(ValueError, match="~/\\[1\\]: option is never tried"):
+        UnionSchema().one_of(options).optimize()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        [StringSchema().min(3), StringSchema()],
+        [NumberSchema().ge(0), NumberSchema().gt(-1)],
+        [NumberSchema().ge(5), NumberSchema().ge(float("nan")).ge(0)],
+        [StringSchema(), StringSchema().nullable()],
+        [StringSchema().test(lambda x: None), StringSchema().min(1)],
+        [MappingSchema(), MappingSchema()],
+    ],
+)
+def test_optimize_keeps_reachable_options(options):
+    schema = UnionSchema().one_of(options)
+    assert schema.optimize() is schema
+
+
+def test_optimize_nested_options():
+    schema = UnionSchema().one_of([NumberSchema().ge(0).ge(1), StringSchema()])
+    schema.optimize()
+    assert len(schema._options[0]._validators) == 1
+    with pytest.raises(ValueError, match="~/\\[0\\]: min"):
+        UnionSchema().one_of([StringSchema().min(2).max(1)]).optimize()